@@ -0,0 +1,92 @@
+"""Benchmark the JSON codecs on realistic Hyphen API payloads.
+
+Usage:
+    python benchmarks/codec_benchmark.py [--repeat N]
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+from hyphen.codec import JsonCodec, OrjsonCodec, StdlibJsonCodec
+
+
+def ip_infos_payload(count: int) -> dict[str, Any]:
+    """Build a get_ip_infos response for the given number of IPs."""
+    return {
+        "data": [
+            {
+                "ip": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+                "type": "ipv4",
+                "location": {
+                    "country": "United States",
+                    "region": "California",
+                    "city": "Mountain View",
+                    "lat": 37.386 + i / 1e6,
+                    "lng": -122.0838 - i / 1e6,
+                    "postalCode": "94035",
+                    "timezone": "America/Los_Angeles",
+                    "geonameId": 5375480 + i,
+                },
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def short_codes_payload(count: int) -> dict[str, Any]:
+    """Build a get_short_codes page with the given number of codes."""
+    return {
+        "total": 2_000_000,
+        "pageNum": 1,
+        "pageSize": count,
+        "data": [
+            {
+                "id": f"code_{i:012d}",
+                "code": f"c{i:07x}",
+                "long_url": f"https://example.com/campaigns/spring/landing?utm_source=mail&id={i}",
+                "domain": "test.h4n.link",
+                "createdAt": "2025-01-01T00:00:00.000Z",
+                "title": f"Campaign link {i}",
+                "tags": ["campaign", "spring", f"batch-{i % 10}"],
+                "organizationId": {"id": "org_123", "name": "Example Org"},
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def available_codecs() -> list[JsonCodec]:
+    """Get every codec that can be constructed in this environment."""
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed; only benchmarking the stdlib codec.")
+    return codecs
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="iterations per measurement")
+    args = parser.parse_args()
+
+    payloads = {
+        "get_ip_infos (1000 IPs)": ip_infos_payload(1000),
+        "get_short_codes (500 codes)": short_codes_payload(500),
+    }
+    print(f"{'payload':<30} {'codec':<8} {'size':>10} {'encode ms':>10} {'decode ms':>10}")
+    for label, payload in payloads.items():
+        for codec in available_codecs():
+            encoded = codec.dumps(payload)
+            encode = timeit.timeit(lambda: codec.dumps(payload), number=args.repeat)
+            decode = timeit.timeit(lambda: codec.loads(encoded), number=args.repeat)
+            print(
+                f"{label:<30} {codec.name:<8} {len(encoded):>10} "
+                f"{encode / args.repeat * 1000:>10.3f} {decode / args.repeat * 1000:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Benchmark concurrent NetInfo lookups over HTTP/1.1 and HTTP/2.
+
+Both transports talk to local stand-in servers that answer every request after
+the same simulated latency, so the results show connection usage rather than
+server speed.
+
+Usage:
+    python benchmarks/http2_benchmark.py [--requests N] [--concurrency N] [--latency MS]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from hyphen import Http2Transport, NetInfo
+
+IP_INFO = json.dumps(
+    {
+        "ip": "8.8.8.8",
+        "type": "ipv4",
+        "location": {
+            "country": "United States",
+            "region": "California",
+            "city": "Mountain View",
+            "lat": 37.386,
+            "lng": -122.0838,
+            "postalCode": "94035",
+            "timezone": "America/Los_Angeles",
+            "geonameId": 5375480,
+        },
+    }
+).encode()
+
+
+class _Http1Listener(ThreadingHTTPServer):
+    """Threaded server accepting a burst of connections without refusing any."""
+
+    # Read by the constructor when it starts listening, so it must be set here
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class Http1Server:
+    """HTTP/1.1 server answering IP lookups after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.connections = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                server.connections += 1
+                super().setup()
+
+            def do_GET(self) -> None:  # noqa: N802
+                time.sleep(latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(IP_INFO)))
+                self.end_headers()
+                self.wfile.write(IP_INFO)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = _Http1Listener(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class Http2Server:
+    """Plain-text HTTP/2 server answering IP lookups after a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.connections = 0
+        self.latency = latency
+        self._loop = asyncio.new_event_loop()
+        self._connections: set[asyncio.Task[None]] = set()
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def _run(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._serve, "127.0.0.1", 0, backlog=1024)
+        )
+        self.url = f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+        ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.exceptions
+
+        self.connections += 1
+        self._connections.add(asyncio.current_task())  # type: ignore[arg-type]
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        responses: set[asyncio.Task[None]] = set()
+        try:
+            while data := await reader.read(65536):
+                try:
+                    events = conn.receive_data(data)
+                except h2.exceptions.ProtocolError:
+                    # h2 queued a GOAWAY frame telling the client why
+                    writer.write(conn.data_to_send())
+                    break
+                for event in events:
+                    if isinstance(event, h2.events.StreamEnded):
+                        response = asyncio.create_task(self._respond(conn, writer, event.stream_id))
+                        responses.add(response)
+                        response.add_done_callback(responses.discard)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        break
+                writer.write(conn.data_to_send())
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            for response in responses:
+                response.cancel()
+            await asyncio.gather(*responses, return_exceptions=True)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+            self._connections.discard(asyncio.current_task())  # type: ignore[arg-type]
+
+    async def _respond(self, conn: Any, writer: asyncio.StreamWriter, stream_id: int) -> None:
+        import h2.exceptions
+
+        await asyncio.sleep(self.latency)
+        if writer.is_closing():
+            return
+        try:
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(IP_INFO))),
+                ],
+            )
+            conn.send_data(stream_id, IP_INFO, end_stream=True)
+        except h2.exceptions.ProtocolError:
+            # The client reset the stream or closed the connection meanwhile
+            return
+        writer.write(conn.data_to_send())
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        for connection in self._connections:
+            connection.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._loop.stop()
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        self._thread.join()
+
+
+def run(net_info: NetInfo, requests: int, concurrency: int) -> float:
+    """Send concurrent lookups and return the elapsed seconds."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(net_info.get_ip_info, ["8.8.8.8"] * requests))
+    return time.perf_counter() - start
+
+
+def report(label: str, connections: int, elapsed: float, requests: int) -> None:
+    """Print one row of the results table."""
+    print(f"{label:<10} {connections:>12} {elapsed:>10.3f} {requests / elapsed:>10.0f}")
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500, help="lookups per transport")
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent lookups")
+    parser.add_argument("--latency", type=float, default=20.0, help="server latency in ms")
+    args = parser.parse_args()
+    latency = args.latency / 1000
+
+    print(f"{'transport':<10} {'connections':>12} {'total s':>10} {'req/s':>10}")
+
+    http1 = Http1Server(latency)
+    net_info = NetInfo(api_key="benchmark", base_url=http1.url, pool_maxsize=args.concurrency)
+    elapsed = run(net_info, args.requests, args.concurrency)
+    net_info.client.close()
+    http1.close()
+    report("HTTP/1.1", http1.connections, elapsed, args.requests)
+
+    try:
+        transport = Http2Transport(prior_knowledge=True)
+    except ImportError:
+        print("httpx[http2] is not installed; only benchmarking HTTP/1.1.")
+        return
+    http2 = Http2Server(latency)
+    net_info = NetInfo(api_key="benchmark", base_url=http2.url, transport=transport)
+    elapsed = run(net_info, args.requests, args.concurrency)
+    net_info.client.close()
+    http2.close()
+    report("HTTP/2", http2.connections, elapsed, args.requests)
+
+
+if __name__ == "__main__":
+    main()
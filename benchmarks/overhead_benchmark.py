@@ -0,0 +1,129 @@
+"""Benchmark the SDK's own CPU cost per call, without sockets.
+
+Every service call is served by an InMemoryTransport, so the measured time is
+spent in the SDK: building requests, encoding and decoding bodies and building
+result objects.
+
+Usage:
+    python benchmarks/overhead_benchmark.py [--calls N] [--threads N] [--latency MS]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from hyphen import FeatureToggle, InMemoryResponse, InMemoryTransport, Link, NetInfo
+
+ORGANIZATION_ID = "org_123"
+
+
+def ip_info(ip: str) -> dict[str, Any]:
+    """Build a get_ip_info response."""
+    return {
+        "ip": ip,
+        "type": "ipv4",
+        "location": {
+            "country": "United States",
+            "region": "California",
+            "city": "Mountain View",
+            "lat": 37.386,
+            "lng": -122.0838,
+            "postalCode": "94035",
+            "timezone": "America/Los_Angeles",
+            "geonameId": 5375480,
+        },
+    }
+
+
+def build_transport(latency: float) -> InMemoryTransport:
+    """Build a transport serving every endpoint used by the benchmark."""
+    transport = InMemoryTransport(latency=latency, record=False)
+    transport.route("GET", "/ip/8.8.8.8", InMemoryResponse.json(ip_info("8.8.8.8")))
+    transport.route(
+        "POST",
+        "/ip",
+        InMemoryResponse.json({"data": [ip_info(f"10.0.0.{i}") for i in range(100)]}),
+    )
+    transport.route(
+        "POST",
+        "/toggle/evaluate",
+        InMemoryResponse.json(
+            {
+                "toggles": {
+                    f"toggle-{i}": {"value": i % 2 == 0, "type": "boolean", "reason": "rule"}
+                    for i in range(20)
+                }
+            }
+        ),
+    )
+    transport.route(
+        "GET",
+        f"/api/organizations/{ORGANIZATION_ID}/link/codes",
+        InMemoryResponse.json(
+            {
+                "total": 50,
+                "pageNum": 1,
+                "pageSize": 50,
+                "data": [
+                    {
+                        "id": f"code_{i}",
+                        "code": f"c{i:07x}",
+                        "long_url": f"https://example.com/landing?id={i}",
+                        "domain": "test.h4n.link",
+                        "createdAt": "2025-01-01T00:00:00.000Z",
+                        "tags": ["campaign"],
+                        "organizationId": {"id": ORGANIZATION_ID, "name": "Example Org"},
+                    }
+                    for i in range(50)
+                ],
+            }
+        ),
+    )
+    return transport
+
+
+def measure(call: Callable[[], Any], calls: int, threads: int) -> tuple[float, float]:
+    """Run a call repeatedly and return (wall seconds, CPU seconds)."""
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    if threads == 1:
+        for _ in range(calls):
+            call()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda _: call(), range(calls)))
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000, help="calls per operation")
+    parser.add_argument("--threads", type=int, default=1, help="concurrent callers")
+    parser.add_argument("--latency", type=float, default=0.0, help="injected latency in ms")
+    args = parser.parse_args()
+
+    transport = build_transport(args.latency / 1000)
+    net_info = NetInfo(api_key="benchmark", transport=transport)
+    toggle = FeatureToggle(
+        application_id="app", api_key="benchmark", environment="production", transport=transport
+    )
+    link = Link(organization_id=ORGANIZATION_ID, api_key="benchmark", transport=transport)
+    ips = [f"10.0.0.{i}" for i in range(100)]
+
+    operations: dict[str, Callable[[], Any]] = {
+        "NetInfo.get_ip_info": lambda: net_info.get_ip_info("8.8.8.8"),
+        "NetInfo.get_ip_infos (100)": lambda: net_info.get_ip_infos(ips),
+        "FeatureToggle.evaluate (20)": toggle.evaluate,
+        "Link.get_short_codes (50)": link.get_short_codes,
+    }
+    print(f"{'operation':<30} {'calls/s':>10} {'CPU us/call':>12}")
+    for label, call in operations.items():
+        wall, cpu = measure(call, args.calls, args.threads)
+        print(f"{label:<30} {args.calls / wall:>10.0f} {cpu / args.calls * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Benchmark listing every short code sequentially and concurrently.
+
+A local stand-in server answers each page of the listing after a simulated
+latency, like a remote API would. The sequential loop requests one page after
+another with get_short_codes; fetch_all_short_codes requests the remaining
+pages concurrently once the first page reports the total.
+
+Usage:
+    python benchmarks/pagination_benchmark.py [--codes N] [--page-size N]
+        [--concurrency N] [--latency MS]
+"""
+
+import argparse
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from hyphen import Link, ShortCode
+
+ORGANIZATION_ID = "org_123"
+
+
+class ListingServer:
+    """HTTP/1.1 server answering short code pages after a fixed latency."""
+
+    def __init__(self, codes: int, latency: float):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                query = parse_qs(urlparse(self.path).query)
+                page_num = int(query.get("pageNum", ["1"])[0])
+                page_size = int(query.get("pageSize", ["100"])[0])
+                first = (page_num - 1) * page_size
+                body = json.dumps(
+                    {
+                        "total": codes,
+                        "pageNum": page_num,
+                        "pageSize": page_size,
+                        "data": [
+                            {
+                                "id": f"code_{i}",
+                                "code": f"c{i:07x}",
+                                "long_url": f"https://example.com/landing?id={i}",
+                                "domain": "test.h4n.link",
+                            }
+                            for i in range(first, min(first + page_size, codes))
+                        ],
+                    }
+                ).encode()
+                time.sleep(latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def sequential(link: Link, page_size: int) -> Iterable[ShortCode]:
+    """List every short code with a page-by-page loop."""
+    page_number = 1
+    while True:
+        page = link.get_short_codes(page_number=page_number, page_size=page_size)
+        yield from page.data
+        if not page.data or page_number * page_size >= page.total:
+            return
+        page_number += 1
+
+
+def measure(listing: Callable[[], Iterable[Any]]) -> tuple[int, float]:
+    """Consume a listing and return (items, wall seconds)."""
+    start = time.perf_counter()
+    count = sum(1 for _ in listing())
+    return count, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--codes", type=int, default=20000, help="short codes listed")
+    parser.add_argument("--page-size", type=int, default=500, help="short codes per page")
+    parser.add_argument("--concurrency", type=int, default=8, help="pages fetched at once")
+    parser.add_argument("--latency", type=float, default=50.0, help="server latency in ms")
+    args = parser.parse_args()
+
+    server = ListingServer(args.codes, args.latency / 1000)
+    link = Link(
+        organization_id=ORGANIZATION_ID,
+        api_key="benchmark",
+        base_url=server.url,
+        max_workers=args.concurrency,
+        pool_maxsize=args.concurrency,
+    )
+    try:
+        link.warmup(args.concurrency)
+        listings: dict[str, Callable[[], Iterable[Any]]] = {
+            "sequential get_short_codes": lambda: sequential(link, args.page_size),
+            f"fetch_all_short_codes ({args.concurrency})": lambda: link.fetch_all_short_codes(
+                page_size=args.page_size, max_concurrency=args.concurrency
+            ),
+        }
+        print(f"{'listing':<30} {'codes':>8} {'seconds':>8} {'codes/s':>10}")
+        for label, listing in listings.items():
+            count, wall = measure(listing)
+            print(f"{label:<30} {count:>8} {wall:>8.2f} {count / wall:>10.0f}")
+    finally:
+        link.close()
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
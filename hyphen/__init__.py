@@ -1,8 +1,35 @@
 """Hyphen Python SDK - Feature toggles, IP geolocation, and link shortening."""
 
+from hyphen.click_stats import Breakdown, ClickSeries, ShortCodeStats
+from hyphen.client_pool import ClientPool
+from hyphen.codec import JsonCodec, OrjsonCodec, StdlibJsonCodec
+from hyphen.compression import CompressionPolicy
+from hyphen.concurrency import AdaptiveConcurrencyLimiter
+from hyphen.exceptions import (
+    ConcurrencyLimitExceededError,
+    ExecutorQueueFullError,
+    HyphenError,
+    RateLimitExceededError,
+    ResponseTooLargeError,
+)
 from hyphen.feature_toggle import FeatureToggle
+from hyphen.hedging import HedgePolicy
+from hyphen.http_cache import HttpCache
 from hyphen.link import Link
+from hyphen.metrics import Metrics
 from hyphen.net_info import NetInfo
+from hyphen.rate_limit import RateLimiter, RateLimitRule
+from hyphen.short_code_cache import ShortCodeCache
+from hyphen.short_code_mirror import MirrorSyncResult, ShortCodeMirror
+from hyphen.tag_index import TagIndex
+from hyphen.transport import (
+    Http2Transport,
+    InMemoryRequest,
+    InMemoryResponse,
+    InMemoryTransport,
+    RequestsTransport,
+    Transport,
+)
 from hyphen.types import (
     CreateQrCodeOptions,
     CreateShortCodeOptions,
@@ -12,22 +39,53 @@ from hyphen.types import (
     IpInfoError,
     IpLocation,
     QrCode,
+    QrCodeImage,
     QrCodesResponse,
     QrSize,
     ShortCode,
+    ShortCodeCreationError,
     ShortCodesResponse,
     ToggleContext,
     ToggleType,
     UpdateShortCodeOptions,
     UserContext,
 )
+from hyphen.url_resolver import UrlResolver, UrlTable
 
 __version__ = "0.0.1a1"
 __all__ = [
     # Services
+    "ClientPool",
     "FeatureToggle",
     "Link",
     "NetInfo",
+    "ShortCodeMirror",
+    "TagIndex",
+    "UrlResolver",
+    # Client configuration
+    "AdaptiveConcurrencyLimiter",
+    "CompressionPolicy",
+    "HedgePolicy",
+    "Http2Transport",
+    "HttpCache",
+    "InMemoryRequest",
+    "InMemoryResponse",
+    "InMemoryTransport",
+    "JsonCodec",
+    "Metrics",
+    "OrjsonCodec",
+    "RateLimiter",
+    "RateLimitRule",
+    "RequestsTransport",
+    "ShortCodeCache",
+    "StdlibJsonCodec",
+    "Transport",
+    # Errors
+    "ConcurrencyLimitExceededError",
+    "ExecutorQueueFullError",
+    "HyphenError",
+    "RateLimitExceededError",
+    "ResponseTooLargeError",
     # Toggle types
     "Evaluation",
     "EvaluationResponse",
@@ -38,13 +96,22 @@ __all__ = [
     "CreateQrCodeOptions",
     "CreateShortCodeOptions",
     "QrCode",
+    "QrCodeImage",
     "QrCodesResponse",
     "QrSize",
     "ShortCode",
+    "ShortCodeCreationError",
     "ShortCodesResponse",
     "UpdateShortCodeOptions",
+    # Stats types
+    "Breakdown",
+    "ClickSeries",
+    "ShortCodeStats",
     # NetInfo types
     "IpInfo",
     "IpInfoError",
     "IpLocation",
+    # Mirror types
+    "MirrorSyncResult",
+    "UrlTable",
 ]
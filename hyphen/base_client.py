@@ -1,35 +1,184 @@
 """Base client for Hyphen SDK."""
 
+import hashlib
+import json
 import os
+import time
+from collections.abc import Hashable, Iterator
+from fnmatch import fnmatchcase
 from typing import Any
 
 import requests
+import urllib3
+
+from hyphen.codec import JsonCodec, default_codec
+from hyphen.compression import CompressionPolicy
+from hyphen.concurrency import AdaptiveConcurrencyLimiter
+from hyphen.exceptions import RateLimitExceededError, ResponseTooLargeError
+from hyphen.executor import BoundedExecutor
+from hyphen.hedging import HedgePolicy, Hedger
+from hyphen.http_cache import CachingTransport, HttpCache
+from hyphen.metrics import Metrics
+from hyphen.rate_limit import RateLimiter
+from hyphen.singleflight import SingleFlight
+from hyphen.streaming import JsonArrayParser
+from hyphen.transport import BufferedBody, RequestsTransport, StreamedBody, Transport
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Bytes read from the connection at a time when streaming a response
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class BaseClient:
     """Base client class for making HTTP requests to Hyphen API."""
 
-    def __init__(self, api_key: str | None = None, base_url: str = "https://api.hyphen.ai"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str = "https://api.hyphen.ai",
+        hedging: HedgePolicy | None = None,
+        metrics: Metrics | None = None,
+        coalesce_requests: bool = False,
+        codec: JsonCodec | None = None,
+        compression: CompressionPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        session_mode: str = "shared",
+        session_shards: int = 4,
+        pool_maxsize: int = 10,
+        dns_ttl: float | None = None,
+        warmup_connections: int = 0,
+        transport: Transport | None = None,
+        http_cache: HttpCache | None = None,
+        max_response_bytes: int | None = None,
+        response_size_limits: dict[str, int] | None = None,
+        max_workers: int = 8,
+        max_pending: int | None = None,
+    ):
         """
         Initialize the base client.
 
         Args:
             api_key: API key for authentication. If not provided, will check HYPHEN_API_KEY env var.
             base_url: Base URL for the Hyphen API.
+            hedging: Policy for hedging idempotent reads. Hedging is disabled if not provided.
+            metrics: Metrics registry to record client statistics in. A new
+                registry is created if not provided.
+            coalesce_requests: Whether identical idempotent requests made while
+                one is in flight share its result instead of being sent again.
+            codec: JSON codec for request and response bodies. Defaults to orjson
+                when it is installed, falling back to the standard library.
+            compression: Policy for compressing large request bodies. Request
+                bodies are sent uncompressed if not provided.
+            rate_limiter: Client-side rate limiter pacing the requests sent.
+                Requests are not paced if not provided.
+            concurrency_limiter: Adaptive limiter for the number of in-flight
+                requests. Concurrency is not limited if not provided.
+            session_mode: How HTTP sessions are shared between threads: "shared"
+                (one session), "thread_local" (one session per thread) or
+                "sharded" (threads spread over session_shards sessions).
+                Sessions are always rebuilt in processes forked from this one.
+                Ignored if a transport is provided.
+            session_shards: Number of sessions in "sharded" mode. Ignored if a
+                transport is provided.
+            pool_maxsize: Maximum number of pooled connections per session.
+                Ignored if a transport is provided.
+            dns_ttl: Seconds to cache resolved addresses of API hosts. Host names
+                are resolved for every new connection if not provided. Ignored
+                if a transport is provided.
+            warmup_connections: Number of connections to open while constructing
+                the client, see warmup(). Failures are recorded in the
+                warmup.errors counter instead of being raised.
+            transport: Transport sending the HTTP requests, e.g. an Http2Transport.
+                Defaults to a RequestsTransport configured by the session options.
+            http_cache: Cache storing GET responses, which are then served while
+                fresh and revalidated with conditional requests once stale.
+            max_response_bytes: Maximum decoded size of a response body. Bodies
+                are read incrementally and the request fails with
+                ResponseTooLargeError as soon as the limit is crossed, by the
+                default and HTTP/2 transports; custom transports that cannot
+                stream return the whole body first. Unlimited if not provided.
+            response_size_limits: Maximum body sizes for the endpoints matching
+                glob patterns, e.g. {"/api/organizations/*/link/codes": 50_000_000}.
+                The first matching pattern applies, then max_response_bytes.
+            max_workers: Number of threads running the calls of the futures-based
+                submit_* and map_* methods.
+            max_pending: Maximum number of submitted calls that have not finished;
+                further submissions block. Defaults to 4 * max_workers.
         """
-        self.api_key = api_key or os.environ.get("HYPHEN_API_KEY")
-        if not self.api_key:
+        resolved_api_key = api_key or os.environ.get("HYPHEN_API_KEY")
+        if not resolved_api_key:
             raise ValueError(
                 "API key is required. Provide it as a parameter or set "
                 "HYPHEN_API_KEY environment variable."
             )
+        self.api_key = resolved_api_key
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "x-api-key": self.api_key,
-            }
+        self.transport: Transport = transport or RequestsTransport(
+            session_mode=session_mode,
+            session_shards=session_shards,
+            pool_maxsize=pool_maxsize,
+            dns_ttl=dns_ttl,
         )
+        self.metrics = metrics or Metrics()
+        self.max_response_bytes = max_response_bytes
+        self.response_size_limits = response_size_limits or {}
+        self.http_cache = http_cache
+        self._caching_transport = (
+            CachingTransport(self.transport, http_cache, self.metrics)
+            if http_cache is not None
+            else None
+        )
+        self.codec = codec or default_codec()
+        self.compression = compression
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.hedger = Hedger(hedging, self.metrics) if hedging else None
+        self.singleflight = SingleFlight(self.metrics) if coalesce_requests else None
+        self.executor = BoundedExecutor(max_workers, max_pending)
+        if warmup_connections > 0:
+            try:
+                self.warmup(warmup_connections)
+            except (OSError, urllib3.exceptions.HTTPError):
+                self.metrics.increment("warmup.errors")
+
+    def close(self) -> None:
+        """
+        Release the connections and threads held by the client.
+
+        Submitted calls that have not started are cancelled, and running ones
+        are waited for.
+        """
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        if self.hedger is not None:
+            self.hedger.close()
+        self.transport.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """The session used by the calling thread, when using the requests transport."""
+        if not isinstance(self.transport, RequestsTransport):
+            raise AttributeError("session is only available with the requests transport.")
+        return self.transport.session
+
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Resolve the API host and open pooled connections before traffic arrives.
+
+        Args:
+            connections: Number of connections to have open, capped at pool_maxsize.
+                With the requests transport, connections are opened for every
+                session serving the calling thread (every shard in "sharded" mode).
+
+        Returns:
+            Number of connections newly opened.
+
+        Raises:
+            OSError: If the host cannot be resolved or connected to.
+        """
+        opened = self.transport.warmup(self.base_url, connections)
+        self.metrics.increment("warmup.connections", opened)
+        return opened
 
     def _request(
         self,
@@ -37,6 +186,7 @@ class BaseClient:
         endpoint: str,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        idempotent: bool | None = None,
     ) -> Any:
         """
         Make an HTTP request to the Hyphen API.
@@ -46,37 +196,277 @@ class BaseClient:
             endpoint: API endpoint path
             data: Request body data
             params: Query parameters
+            idempotent: Whether the request is a read that is safe to send more
+                than once. Defaults to True for GET, HEAD and OPTIONS requests.
 
         Returns:
             Response data as JSON
 
         Raises:
             requests.HTTPError: If the request fails
+            RateLimitExceededError: If the client-side rate limiter rejects the request
+            ResponseTooLargeError: If the response exceeds the size limit of the endpoint
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = {"Content-Type": "application/json"} if data is not None else {}
-        response = self.session.request(
-            method=method,
-            url=url,
-            json=data,
-            params=params,
-            headers=headers,
-        )
-        response.raise_for_status()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+
+        # Encode the body once; the same bytes are reused by hedged duplicates
+        body, headers = self._encode_body(data)
+
+        if self.singleflight is not None and idempotent:
+            key = self._request_key(method, endpoint, body, params)
+            return self.singleflight.do(
+                key, lambda: self._send(method, endpoint, body, params, headers, idempotent)
+            )
+        return self._send(method, endpoint, body, params, headers, idempotent)
+
+    def stream_items(
+        self,
+        method: str,
+        endpoint: str,
+        data: Any = None,
+        params: dict[str, Any] | None = None,
+        key: str | None = "data",
+    ) -> Iterator[Any]:
+        """
+        Make an HTTP request and decode the elements of a JSON array as they arrive.
+
+        The response body is parsed incrementally from the connection, so only
+        the element being decoded is held in memory instead of the whole body.
+        Streamed requests are neither hedged, coalesced nor stored in the HTTP
+        cache.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+            key: Member of the top-level response object holding the array, or
+                None if the response is the array itself.
+
+        Yields:
+            Each decoded array element, in order.
+
+        Raises:
+            requests.HTTPError: If the request fails
+            RateLimitExceededError: If the client-side rate limiter rejects the request
+            ResponseTooLargeError: If the response exceeds the size limit of the
+                endpoint. Elements parsed before the limit was crossed have
+                already been yielded.
+            ValueError: If the response is not a JSON document with the array
+        """
+        body, headers = self._encode_body(data)
+        response = self._send_once(method, endpoint, body, params, headers, stream=True)
+        try:
+            self._check_response(endpoint, response)
+            parser = JsonArrayParser(key, self.codec)
+            size_limit = self.response_size_limit(endpoint)
+            body_bytes = 0
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                body_bytes += len(chunk)
+                if size_limit is not None and body_bytes > size_limit:
+                    self._reject_too_large(response, endpoint, size_limit)
+                yield from parser.feed(chunk)
+            parser.close()
+        finally:
+            response.close()
+        self.metrics.increment("response.body_bytes", body_bytes)
+        self.metrics.increment("response.wire_bytes", self._wire_bytes(response, body_bytes))
+        self.metrics.increment("response.streamed")
+
+    def _encode_body(self, data: Any) -> tuple[bytes | None, dict[str, str]]:
+        """Encode and compress a request body, returning it with the request headers."""
+        headers: dict[str, str] = {"x-api-key": self.api_key}
+        if data is None:
+            return None, headers
+        body = self.codec.dumps(data)
+        headers["Content-Type"] = "application/json"
+        self.metrics.increment("request.body_bytes", len(body))
+        if self.compression is not None:
+            compressed = self.compression.compress(body)
+            if compressed is not None:
+                body = compressed
+                headers["Content-Encoding"] = self.compression.encoding
+                self.metrics.increment("request.compressed")
+        self.metrics.increment("request.wire_bytes", len(body))
+        return body, headers
+
+    @staticmethod
+    def _request_key(
+        method: str,
+        endpoint: str,
+        body: bytes | None,
+        params: dict[str, Any] | None,
+    ) -> Hashable:
+        """Build the identity of a request used to coalesce identical calls."""
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode())
+        if body is not None:
+            digest.update(body)
+        return (method, endpoint, body is not None, digest.hexdigest())
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        body: bytes | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+        idempotent: bool,
+    ) -> Any:
+        """Send a request and decode its response."""
+
+        def send() -> requests.Response:
+            return self._send_once(method, endpoint, body, params, headers)
+
+        response = None
+        if self._caching_transport is not None and method == "GET":
+            # Fresh cached responses skip the limiters, as nothing is sent
+            url = f"{self.base_url}{endpoint}"
+            response = self._caching_transport.lookup(url, params, headers)
+        if response is not None:
+            self._record_response_size(response)
+            response.raise_for_status()
+        else:
+            if self.hedger is not None and idempotent:
+                response = self.hedger.run(send, on_discard=requests.Response.close)
+            else:
+                response = send()
+            self._record_response_size(response)
+            self._check_response(endpoint, response)
 
         # Handle empty responses (like 204 No Content)
         if response.status_code == 204 or not response.content:
             return None
 
-        return response.json()
+        return self.codec.loads(response.content)
+
+    def _check_response(self, endpoint: str, response: requests.Response) -> None:
+        """Feed the response to the rate limiter and raise if it is an error."""
+        if self.rate_limiter is not None:
+            if response.status_code == 429:
+                self.metrics.increment("rate_limit.throttled")
+            self.rate_limiter.update_from_response(
+                endpoint, response.status_code, response.headers
+            )
+        response.raise_for_status()
+
+    def _send_once(
+        self,
+        method: str,
+        endpoint: str,
+        body: bytes | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+        stream: bool = False,
+    ) -> requests.Response:
+        """Put a single request on the wire, subject to the configured limiters."""
+        if self.rate_limiter is not None:
+            self._acquire_rate_limit(self.rate_limiter, endpoint)
+
+        limiter = self.concurrency_limiter
+        key = limiter.acquire(endpoint) if limiter is not None else None
+        start = time.monotonic()
+        success = False
+        try:
+            transport = self._caching_transport or self.transport
+            size_limit = self.response_size_limit(endpoint)
+            response = transport.request(
+                method=method,
+                url=f"{self.base_url}{endpoint}",
+                data=body,
+                params=params,
+                headers=headers,
+                stream=stream or size_limit is not None,
+            )
+            success = response.status_code != 429 and response.status_code < 500
+            if size_limit is not None and not stream:
+                self._read_limited(response, endpoint, size_limit)
+                if self._caching_transport is not None and method == "GET":
+                    self._caching_transport.store(
+                        f"{self.base_url}{endpoint}", params, headers, response
+                    )
+            return response
+        finally:
+            if limiter is not None and key is not None:
+                limiter.release(key, time.monotonic() - start, success)
+                self.metrics.set_gauge(f"concurrency.limit.{key}", limiter.limit(key))
+
+    def response_size_limit(self, endpoint: str) -> int | None:
+        """Get the maximum response body size for an endpoint, if limited."""
+        for pattern, limit in self.response_size_limits.items():
+            if fnmatchcase(endpoint, pattern):
+                return limit
+        return self.max_response_bytes
+
+    def _read_limited(self, response: requests.Response, endpoint: str, limit: int) -> None:
+        """Read a streamed response body, failing as soon as it exceeds the limit."""
+        length = response.headers.get("Content-Length")
+        if length is not None and "Content-Encoding" not in response.headers:
+            # The declared size is the decoded size, so fail before reading
+            try:
+                declared = int(length)
+            except ValueError:
+                declared = 0
+            if declared > limit:
+                self._reject_too_large(response, endpoint, limit)
+
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            size += len(chunk)
+            if size > limit:
+                self._reject_too_large(response, endpoint, limit)
+            chunks.append(chunk)
+        response._content = b"".join(chunks)
+
+    def _reject_too_large(self, response: requests.Response, endpoint: str, limit: int) -> None:
+        """Drop a response that is too large and raise."""
+        response.close()
+        self.metrics.increment("response.too_large")
+        raise ResponseTooLargeError(endpoint, limit)
+
+    def _acquire_rate_limit(self, limiter: RateLimiter, endpoint: str) -> None:
+        """Wait for the rate limiter to allow a request to the endpoint."""
+        try:
+            waited = limiter.acquire(endpoint)
+        except RateLimitExceededError:
+            self.metrics.increment("rate_limit.rejected")
+            raise
+        if waited > 0:
+            self.metrics.increment("rate_limit.waits")
+            self.metrics.increment("rate_limit.wait_seconds", waited)
+
+    def _record_response_size(self, response: requests.Response) -> None:
+        """Record the decoded and on-the-wire sizes of a response body."""
+        content = response.content
+        self.metrics.increment("response.body_bytes", len(content))
+        self.metrics.increment("response.wire_bytes", self._wire_bytes(response, len(content)))
+
+    @staticmethod
+    def _wire_bytes(response: requests.Response, body_bytes: int) -> int:
+        """Get the number of body bytes received for a fully read response."""
+        raw = response.raw
+        if isinstance(raw, (urllib3.HTTPResponse, BufferedBody, StreamedBody)):
+            # tell() counts bytes read from the socket, before decompression
+            return int(raw.tell())
+        return body_bytes
 
     def get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
         """Make a GET request."""
         return self._request("GET", endpoint, params=params)
 
-    def post(self, endpoint: str, data: dict[str, Any] | None = None) -> Any:
-        """Make a POST request with a dict body."""
-        return self._request("POST", endpoint, data=data)
+    def post(
+        self,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        idempotent: bool = False,
+    ) -> Any:
+        """Make a POST request with a dict body.
+
+        Pass idempotent=True for POST requests that only read data, so they
+        can be hedged.
+        """
+        return self._request("POST", endpoint, data=data, idempotent=idempotent)
 
     def post_raw(self, endpoint: str, data: Any) -> Any:
         """Make a POST request with raw data (e.g., a list)."""
@@ -93,3 +483,4 @@ class BaseClient:
     def delete(self, endpoint: str) -> Any:
         """Make a DELETE request."""
         return self._request("DELETE", endpoint)
+
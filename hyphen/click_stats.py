@@ -0,0 +1,335 @@
+"""Columnar short code statistics for Hyphen SDK."""
+
+import heapq
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+# Members naming the dimension value of a breakdown entry, by preference
+_LABEL_KEYS = ("country", "name", "referrer", "url", "domain", "browser", "device", "label")
+# Members holding the click count of an entry, by preference
+_COUNT_KEYS = ("total", "clicks", "count")
+_UNIQUE_KEYS = ("unique", "uniqueClicks", "unique_clicks")
+# Members holding the date of a time series entry, by preference
+_DATE_KEYS = ("date", "day", "timestamp", "time")
+
+
+def _number(entry: Mapping[str, Any], keys: Iterable[str]) -> int:
+    """Get the first numeric member of an entry among keys, or 0."""
+    for key in keys:
+        value = entry.get(key)
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            return int(value)
+    return 0
+
+
+def _epoch(moment: datetime) -> int:
+    """Convert a datetime to epoch seconds, taking naive ones as UTC like API dates."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+def _timestamp(value: Any) -> int | None:
+    """Convert an ISO date or epoch value to epoch seconds."""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        # Epoch values in milliseconds are too large to be seconds until 2286
+        return int(value / 1000) if value > 10_000_000_000 else int(value)
+    if isinstance(value, str):
+        if value.endswith(("Z", "z")):
+            # fromisoformat() only accepts the UTC designator from Python 3.11
+            value = value[:-1] + "+00:00"
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        return _epoch(moment)
+    return None
+
+
+@dataclass
+class ClickSeries:
+    """Clicks over time, one array per column.
+
+    The columns are ``array.array`` objects of 64-bit integers sorted by
+    timestamp, which NumPy reads without copying, e.g.
+    ``numpy.asarray(series.clicks)``. The helpers below make a single pass
+    over the columns without building per-row objects, but still loop in
+    Python; vectorized speed on large series needs NumPy on the columns.
+    Naive datetimes are taken as UTC, like the dates returned by the API.
+
+    Attributes:
+        timestamps: Start of each period, in epoch seconds (UTC).
+        clicks: Clicks in each period.
+        unique: Unique clicks in each period.
+    """
+
+    timestamps: array = field(default_factory=lambda: array("q"))
+    clicks: array = field(default_factory=lambda: array("q"))
+    unique: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Mapping[str, Any]]) -> "ClickSeries":
+        """Build a series from API entries such as ``{"date": ..., "total": ...}``."""
+        buckets: dict[int, tuple[int, int]] = {}
+        for entry in entries:
+            timestamp = next(
+                (
+                    found
+                    for found in (_timestamp(entry.get(key)) for key in _DATE_KEYS)
+                    if found is not None
+                ),
+                None,
+            )
+            if timestamp is None:
+                continue
+            clicks, unique = buckets.get(timestamp, (0, 0))
+            buckets[timestamp] = (
+                clicks + _number(entry, _COUNT_KEYS),
+                unique + _number(entry, _UNIQUE_KEYS),
+            )
+        return cls._from_buckets(buckets)
+
+    @classmethod
+    def _from_buckets(cls, buckets: Mapping[int, tuple[int, int]]) -> "ClickSeries":
+        timestamps = sorted(buckets)
+        return cls(
+            timestamps=array("q", timestamps),
+            clicks=array("q", (buckets[timestamp][0] for timestamp in timestamps)),
+            unique=array("q", (buckets[timestamp][1] for timestamp in timestamps)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def resample(self, period: timedelta, origin: datetime | None = None) -> "ClickSeries":
+        """
+        Sum the clicks into periods of a fixed length.
+
+        Unique clicks summed across the original periods are upper bounds.
+
+        Args:
+            period: Length of the new periods, e.g. timedelta(weeks=1).
+            origin: Start of one of the new periods, taken as UTC if naive.
+                Defaults to the epoch, which aligns days and hours in UTC.
+
+        Returns:
+            The resampled series, without empty periods.
+
+        Raises:
+            ValueError: If period is shorter than a second.
+        """
+        step = int(period.total_seconds())
+        if step < 1:
+            raise ValueError("period must be at least one second.")
+        offset = _epoch(origin) if origin is not None else 0
+        resampled = ClickSeries()
+        timestamps, clicks, unique = resampled.timestamps, resampled.clicks, resampled.unique
+        # Timestamps are sorted, so the periods come in order and only the last can grow
+        for timestamp, count, distinct in zip(self.timestamps, self.clicks, self.unique):
+            bucket = timestamp - (timestamp - offset) % step
+            if timestamps and timestamps[-1] == bucket:
+                clicks[-1] += count
+                unique[-1] += distinct
+            else:
+                timestamps.append(bucket)
+                clicks.append(count)
+                unique.append(distinct)
+        return resampled
+
+    def between(self, start: datetime, end: datetime) -> "ClickSeries":
+        """Get the periods starting from start (included) to end (excluded), naive as UTC."""
+        first = self._bisect(_epoch(start))
+        last = self._bisect(_epoch(end))
+        return ClickSeries(
+            timestamps=self.timestamps[first:last],
+            clicks=self.clicks[first:last],
+            unique=self.unique[first:last],
+        )
+
+    def _bisect(self, timestamp: int) -> int:
+        """Get the index of the first period starting at or after timestamp."""
+        low, high = 0, len(self.timestamps)
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamps[middle] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def total(self) -> int:
+        """Get the clicks of every period."""
+        return sum(self.clicks)
+
+    def combine(self, other: "ClickSeries") -> "ClickSeries":
+        """Add the clicks of another series, period by period."""
+        combined = ClickSeries()
+        timestamps, clicks, unique = combined.timestamps, combined.clicks, combined.unique
+        left, right = self.timestamps, other.timestamps
+        i = j = 0
+        # Merge the two sorted columns, summing the periods both series have
+        while i < len(left) or j < len(right):
+            if j == len(right) or (i < len(left) and left[i] < right[j]):
+                timestamps.append(left[i])
+                clicks.append(self.clicks[i])
+                unique.append(self.unique[i])
+                i += 1
+            elif i == len(left) or right[j] < left[i]:
+                timestamps.append(right[j])
+                clicks.append(other.clicks[j])
+                unique.append(other.unique[j])
+                j += 1
+            else:
+                timestamps.append(left[i])
+                clicks.append(self.clicks[i] + other.clicks[j])
+                unique.append(self.unique[i] + other.unique[j])
+                i += 1
+                j += 1
+        return combined
+
+
+@dataclass
+class Breakdown:
+    """Clicks per value of a dimension, such as country or referrer.
+
+    Values are stored once in ``labels`` and the counts in arrays of 64-bit
+    integers aligned with them, which NumPy reads without copying.
+
+    Attributes:
+        labels: The dimension values.
+        clicks: Clicks for each value.
+        unique: Unique clicks for each value.
+    """
+
+    labels: list[str] = field(default_factory=list)
+    clicks: array = field(default_factory=lambda: array("q"))
+    unique: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Mapping[str, Any]]) -> "Breakdown":
+        """Build a breakdown from API entries such as ``{"country": ..., "total": ...}``."""
+        breakdown = cls()
+        positions: dict[str, int] = {}
+        for entry in entries:
+            label = next(
+                (entry[key] for key in _LABEL_KEYS if isinstance(entry.get(key), str)), None
+            )
+            if label is None:
+                label = next((value for value in entry.values() if isinstance(value, str)), "")
+            breakdown._add(
+                positions, label, _number(entry, _COUNT_KEYS), _number(entry, _UNIQUE_KEYS)
+            )
+        return breakdown
+
+    def _add(self, positions: dict[str, int], label: str, clicks: int, unique: int) -> None:
+        """Add counts to a label, appending it if new."""
+        index = positions.get(label)
+        if index is None:
+            positions[label] = len(self.labels)
+            self.labels.append(label)
+            self.clicks.append(clicks)
+            self.unique.append(unique)
+        else:
+            self.clicks[index] += clicks
+            self.unique[index] += unique
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def top(self, n: int, unique: bool = False) -> list[tuple[str, int]]:
+        """
+        Get the values with the most clicks.
+
+        Args:
+            n: Maximum number of values returned.
+            unique: Whether to rank by unique clicks rather than clicks.
+
+        Returns:
+            (label, count) pairs, most clicked first.
+        """
+        counts = self.unique if unique else self.clicks
+        indices = heapq.nlargest(n, range(len(counts)), key=counts.__getitem__)
+        return [(self.labels[index], counts[index]) for index in indices]
+
+    def as_dict(self) -> dict[str, int]:
+        """Get the clicks of each value."""
+        return dict(zip(self.labels, self.clicks))
+
+    def combine(self, other: "Breakdown") -> "Breakdown":
+        """Add the counts of another breakdown, value by value."""
+        combined = Breakdown(list(self.labels), array("q", self.clicks), array("q", self.unique))
+        positions = {label: index for index, label in enumerate(combined.labels)}
+        for label, clicks, unique in zip(other.labels, other.clicks, other.unique):
+            combined._add(positions, label, clicks, unique)
+        return combined
+
+
+@dataclass
+class ShortCodeStats:
+    """Statistics of a short code, with array-backed columns.
+
+    Attributes:
+        total_clicks: Clicks in the requested period.
+        unique_clicks: Unique clicks in the requested period.
+        series: Clicks over time.
+        breakdowns: Clicks per value of each dimension, keyed by the API's
+            name for it, e.g. "locations", "referrals", "browsers" or "devices".
+    """
+
+    total_clicks: int = 0
+    unique_clicks: int = 0
+    series: ClickSeries = field(default_factory=ClickSeries)
+    breakdowns: dict[str, Breakdown] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ShortCodeStats":
+        """
+        Create ShortCodeStats from a get_short_code_stats response.
+
+        The click totals and the first dated list found in ``clicks`` (e.g.
+        ``byDay``) form the series; every other top-level list of objects
+        becomes a breakdown.
+        """
+        stats = cls()
+        clicks = data.get("clicks")
+        if isinstance(clicks, Mapping):
+            stats.total_clicks = _number(clicks, _COUNT_KEYS)
+            stats.unique_clicks = _number(clicks, _UNIQUE_KEYS)
+            for value in clicks.values():
+                if _is_entry_list(value):
+                    stats.series = ClickSeries.from_entries(value)
+                    break
+        elif isinstance(clicks, int | float):
+            stats.total_clicks = int(clicks)
+        for key, value in data.items():
+            if key != "clicks" and _is_entry_list(value):
+                stats.breakdowns[key] = Breakdown.from_entries(value)
+        return stats
+
+    def breakdown(self, name: str) -> Breakdown:
+        """Get a breakdown by name, empty if the API did not return it."""
+        return self.breakdowns.get(name) or Breakdown()
+
+    @classmethod
+    def combine(cls, stats: Iterable["ShortCodeStats"]) -> "ShortCodeStats":
+        """
+        Add up the statistics of several short codes or periods.
+
+        Unique clicks summed across short codes or periods are upper bounds.
+        """
+        combined = cls()
+        for item in stats:
+            combined.total_clicks += item.total_clicks
+            combined.unique_clicks += item.unique_clicks
+            combined.series = combined.series.combine(item.series)
+            for name, breakdown in item.breakdowns.items():
+                combined.breakdowns[name] = combined.breakdown(name).combine(breakdown)
+        return combined
+
+
+def _is_entry_list(value: Any) -> bool:
+    """Whether a value is a list of objects."""
+    return isinstance(value, list) and all(isinstance(item, Mapping) for item in value)
@@ -0,0 +1,255 @@
+"""Multi-tenant pooling of Hyphen SDK service clients."""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+import requests
+
+from hyphen.base_client import BaseClient
+from hyphen.feature_toggle import FeatureToggle
+from hyphen.link import Link
+from hyphen.metrics import Metrics
+from hyphen.net_info import NetInfo
+from hyphen.transport import RequestsTransport, Transport
+
+# BaseClient options that configure the default transport rather than a client
+_TRANSPORT_OPTIONS = ("session_mode", "session_shards", "pool_maxsize", "dns_ttl")
+
+
+class _Service(Protocol):
+    client: BaseClient
+
+    def close(self) -> None: ...
+
+
+S = TypeVar("S", bound=_Service)
+
+
+class _SharedTransport:
+    """Transport handed to pooled clients, which must not close it on eviction."""
+
+    def __init__(self, transport: Transport):
+        self.transport = transport
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request with the shared transport."""
+        return self.transport.request(method, url, data, params, headers, stream)
+
+    def warmup(self, url: str, connections: int) -> int:
+        """Open connections with the shared transport."""
+        return self.transport.warmup(url, connections)
+
+    def close(self) -> None:
+        """Do nothing; the pool closes the shared transport."""
+
+
+def _release_client(client: BaseClient) -> None:
+    """Stop the threads of a client dropped by the pool, without waiting for them."""
+    client.executor.shutdown(wait=False, cancel_futures=False)
+    if client.hedger is not None:
+        client.hedger.close()
+
+
+@dataclass
+class _Entry:
+    """A pooled client and when it was last handed out."""
+
+    client: Any
+    last_used: float
+
+
+class ClientPool:
+    """Caches service clients per tenant, sharing connections between them.
+
+    Clients are keyed by service and credentials. The least recently used
+    client is dropped once more than ``max_clients`` are pooled, and clients
+    unused for ``idle_timeout`` seconds are dropped on the next access. Every
+    client sends its requests through one transport, so connections to the
+    Hyphen API are reused across tenants; the API key is sent per request.
+
+    A dropped client is not closed while it may still be in use: it keeps
+    working for whoever holds it, including its iterators and futures, and
+    its threads are stopped once it is no longer referenced. Clients should
+    still be fetched from the pool for each unit of work rather than kept, so
+    that dropped ones are released.
+
+    Example:
+        >>> from hyphen import ClientPool
+        >>> pool = ClientPool(max_clients=500, idle_timeout=300, pool_maxsize=50)
+        >>> link = pool.link(organization_id="org_123", api_key="customer_key")
+        >>> codes = link.get_short_codes()
+    """
+
+    def __init__(
+        self,
+        max_clients: int = 256,
+        idle_timeout: float | None = 600.0,
+        transport: Transport | None = None,
+        metrics: Metrics | None = None,
+        **client_options: Any,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_clients: Maximum number of clients kept, across services.
+            idle_timeout: Seconds after which an unused client is dropped.
+                Clients are kept until evicted if not provided.
+            transport: Transport shared by every client. Defaults to a
+                RequestsTransport configured by the session options.
+            metrics: Registry shared by the pool and every client.
+            **client_options: Options passed to every client, such as hedging,
+                http_cache or the session options of the default transport.
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1.")
+        transport_options = {
+            name: client_options.pop(name)
+            for name in _TRANSPORT_OPTIONS
+            if name in client_options
+        }
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.transport = transport or RequestsTransport(**transport_options)
+        self.metrics = metrics or Metrics()
+        self.client_options = client_options
+        self._shared_transport = _SharedTransport(self.transport)
+        self._lock = threading.Lock()
+        self._clients: OrderedDict[Hashable, _Entry] = OrderedDict()
+
+    def link(
+        self,
+        organization_id: str,
+        api_key: str,
+        base_url: str = "https://api.hyphen.ai",
+    ) -> Link:
+        """
+        Get the Link client of a tenant.
+
+        Args:
+            organization_id: Organization ID of the tenant.
+            api_key: API key of the tenant.
+            base_url: Base URL for the Hyphen API.
+
+        Returns:
+            The pooled Link client, created on first use.
+        """
+        return self._get(
+            ("link", organization_id, api_key, base_url),
+            lambda options: Link(
+                organization_id=organization_id, api_key=api_key, base_url=base_url, **options
+            ),
+        )
+
+    def net_info(self, api_key: str, base_url: str = "https://net.info") -> NetInfo:
+        """
+        Get the NetInfo client of a tenant.
+
+        Args:
+            api_key: API key of the tenant.
+            base_url: Base URL for the Hyphen API.
+
+        Returns:
+            The pooled NetInfo client, created on first use.
+        """
+        return self._get(
+            ("net_info", api_key, base_url),
+            lambda options: NetInfo(api_key=api_key, base_url=base_url, **options),
+        )
+
+    def feature_toggle(
+        self,
+        application_id: str,
+        api_key: str,
+        environment: str = "production",
+        base_url: str = "https://toggle.hyphen.cloud",
+    ) -> FeatureToggle:
+        """
+        Get the FeatureToggle client of a tenant.
+
+        Args:
+            application_id: Application ID of the tenant.
+            api_key: API key of the tenant.
+            environment: Environment name (e.g., "production", "staging").
+            base_url: Base URL for the Hyphen API.
+
+        Returns:
+            The pooled FeatureToggle client, created on first use.
+        """
+        return self._get(
+            ("feature_toggle", application_id, environment, api_key, base_url),
+            lambda options: FeatureToggle(
+                application_id=application_id,
+                environment=environment,
+                api_key=api_key,
+                base_url=base_url,
+                **options,
+            ),
+        )
+
+    def _get(self, key: Hashable, factory: Callable[[dict[str, Any]], S]) -> S:
+        """Get a pooled client, creating it and evicting others as needed."""
+        now = time.monotonic()
+        client: S
+        with self._lock:
+            self._expire(now)
+            entry = self._clients.get(key)
+            if entry is not None:
+                entry.last_used = now
+                self._clients.move_to_end(key)
+                self.metrics.increment("client_pool.hits")
+                client = entry.client
+            else:
+                self.metrics.increment("client_pool.misses")
+                options = dict(
+                    self.client_options, transport=self._shared_transport, metrics=self.metrics
+                )
+                client = factory(options)
+                # Dropped clients may still be in use, so their threads are only
+                # stopped once the last reference to the client is gone
+                weakref.finalize(client, _release_client, client.client)
+                self._clients[key] = _Entry(client=client, last_used=now)
+                while len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+                    self.metrics.increment("client_pool.evictions")
+            self.metrics.set_gauge("client_pool.size", len(self._clients))
+        return client
+
+    def _expire(self, now: float) -> None:
+        """Drop the clients idle for longer than idle_timeout. Requires the lock."""
+        if self.idle_timeout is None:
+            return
+        # Entries are ordered by last use, so idle clients come first
+        while self._clients:
+            key, entry = next(iter(self._clients.items()))
+            if now - entry.last_used < self.idle_timeout:
+                break
+            del self._clients[key]
+            self.metrics.increment("client_pool.expired")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def close(self) -> None:
+        """Close every pooled client and the shared transport."""
+        with self._lock:
+            clients = [entry.client for entry in self._clients.values()]
+            self._clients.clear()
+            self.metrics.set_gauge("client_pool.size", 0)
+        for client in clients:
+            client.close()
+        self.transport.close()
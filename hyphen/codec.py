@@ -0,0 +1,76 @@
+"""JSON codecs for encoding requests and decoding responses in Hyphen SDK."""
+
+import json
+from typing import Any, Protocol
+
+
+class JsonCodec(Protocol):
+    """Encodes request bodies to bytes and decodes response bodies from bytes."""
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as JSON bytes."""
+        ...
+
+    def loads(self, data: bytes | bytearray | memoryview) -> Any:
+        """Decode JSON from a bytes buffer."""
+        ...
+
+
+class StdlibJsonCodec:
+    """JSON codec backed by the standard library json module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: bytes | bytearray | memoryview) -> Any:
+        """Decode JSON from a bytes buffer."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """JSON codec backed by orjson.
+
+    Requires the optional orjson package (``pip install hyphen[orjson]``).
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """
+        Initialize the codec.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes."""
+        return self._dumps(obj)
+
+    def loads(self, data: bytes | bytearray | memoryview) -> Any:
+        """Decode JSON from a bytes buffer without copying it."""
+        return self._loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """
+    Get the fastest available JSON codec.
+
+    Returns:
+        An OrjsonCodec if orjson is installed, otherwise a StdlibJsonCodec.
+    """
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibJsonCodec()
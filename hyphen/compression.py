@@ -0,0 +1,54 @@
+"""Request body compression for Hyphen SDK."""
+
+import gzip
+import zlib
+from dataclasses import dataclass
+
+SUPPORTED_ENCODINGS = ("gzip", "deflate")
+
+
+@dataclass
+class CompressionPolicy:
+    """Configuration for compressing request bodies.
+
+    Only enable compression for services that accept compressed request
+    bodies (signalled by the Content-Encoding header).
+
+    Attributes:
+        encoding: Content encoding to use, either "gzip" or "deflate".
+        threshold: Minimum body size in bytes before compression is applied.
+        level: Compression level from 1 (fastest) to 9 (smallest).
+    """
+
+    encoding: str = "gzip"
+    threshold: int = 1024
+    level: int = 6
+
+    def __post_init__(self) -> None:
+        """Validate the policy values."""
+        if self.encoding not in SUPPORTED_ENCODINGS:
+            raise ValueError(
+                f"Unsupported encoding {self.encoding!r}. "
+                f"Expected one of: {', '.join(SUPPORTED_ENCODINGS)}."
+            )
+        if not 1 <= self.level <= 9:
+            raise ValueError("level must be between 1 and 9.")
+
+    def compress(self, body: bytes) -> bytes | None:
+        """
+        Compress a request body if it is large enough to benefit.
+
+        Args:
+            body: Encoded request body.
+
+        Returns:
+            The compressed body, or None if the body is below the threshold
+            or compression would not make it smaller.
+        """
+        if len(body) < self.threshold:
+            return None
+        if self.encoding == "gzip":
+            compressed = gzip.compress(body, compresslevel=self.level, mtime=0)
+        else:
+            compressed = zlib.compress(body, self.level)
+        return compressed if len(compressed) < len(body) else None
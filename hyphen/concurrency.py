@@ -0,0 +1,151 @@
+"""Adaptive concurrency limiting for Hyphen SDK."""
+
+import threading
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+
+from hyphen.exceptions import ConcurrencyLimitExceededError
+
+DEFAULT_KEY = "*"
+
+
+@dataclass
+class _Limit:
+    """Concurrency state of one endpoint group."""
+
+    limit: float
+    in_flight: int = 0
+    min_latency: float | None = None
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits in-flight requests per endpoint group using AIMD.
+
+    The limit grows additively (by about one request per limit's worth of
+    successful calls) while latency stays close to the lowest latency seen,
+    and shrinks multiplicatively when a request fails, is throttled or takes
+    more than ``latency_tolerance`` times that baseline. The baseline slowly
+    forgets old samples so it can follow lasting changes in upstream latency.
+
+    Example:
+        >>> from hyphen import AdaptiveConcurrencyLimiter, NetInfo
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=64)
+        >>> net_info = NetInfo(api_key="key", concurrency_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.9,
+        baseline_decay: float = 1.001,
+        patterns: list[str] | None = None,
+        max_wait: float | None = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of in-flight requests per group.
+            min_limit: Lowest limit the limiter can back off to.
+            max_limit: Highest limit the limiter can grow to.
+            latency_tolerance: Latency, as a multiple of the baseline, above which
+                the limit is lowered.
+            backoff_ratio: Factor applied to the limit when backing off.
+            baseline_decay: Factor by which the baseline latency grows with
+                every sample, so that it forgets old minimums.
+            patterns: Glob patterns grouping endpoints that get their own limit,
+                e.g. "/ip/*". Other endpoints share one service-wide limit.
+            max_wait: Maximum seconds to wait for a free slot before raising
+                ConcurrencyLimitExceededError. Waits indefinitely if not provided.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1.")
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.baseline_decay = baseline_decay
+        self.patterns = patterns or []
+        self.max_wait = max_wait
+        self._condition = threading.Condition()
+        self._limits: dict[str, _Limit] = {}
+
+    def key(self, endpoint: str) -> str:
+        """Get the group an endpoint is limited in."""
+        for pattern in self.patterns:
+            if fnmatchcase(endpoint, pattern):
+                return pattern
+        return DEFAULT_KEY
+
+    def _state(self, key: str) -> _Limit:
+        """Get the state of a group, creating it on first use. Requires the lock."""
+        state = self._limits.get(key)
+        if state is None:
+            state = self._limits[key] = _Limit(limit=float(self.initial_limit))
+        return state
+
+    def limit(self, key: str) -> int:
+        """Get the current in-flight limit of a group."""
+        with self._condition:
+            return int(self._state(key).limit)
+
+    def in_flight(self, key: str) -> int:
+        """Get the number of in-flight requests of a group."""
+        with self._condition:
+            return self._state(key).in_flight
+
+    def acquire(self, endpoint: str) -> str:
+        """
+        Wait for a free slot for a request to the endpoint.
+
+        Args:
+            endpoint: API endpoint path of the request.
+
+        Returns:
+            The group key to pass to release().
+
+        Raises:
+            ConcurrencyLimitExceededError: If no slot frees up within max_wait.
+        """
+        key = self.key(endpoint)
+        deadline = time.monotonic() + self.max_wait if self.max_wait is not None else None
+        with self._condition:
+            state = self._state(key)
+            while state.in_flight >= int(state.limit):
+                timeout = deadline - time.monotonic() if deadline is not None else None
+                if timeout is not None and timeout <= 0:
+                    raise ConcurrencyLimitExceededError(endpoint, int(state.limit))
+                self._condition.wait(timeout)
+            state.in_flight += 1
+        return key
+
+    def release(self, key: str, latency: float, success: bool) -> None:
+        """
+        Free a slot and adjust the group's limit from the request outcome.
+
+        Args:
+            key: Group key returned by acquire().
+            latency: Duration of the request, in seconds.
+            success: Whether the request succeeded without being throttled.
+        """
+        with self._condition:
+            state = self._state(key)
+            state.in_flight -= 1
+            if state.min_latency is None:
+                state.min_latency = latency
+            else:
+                state.min_latency = min(latency, state.min_latency * self.baseline_decay)
+
+            if not success or latency > state.min_latency * self.latency_tolerance:
+                state.limit = max(float(self.min_limit), state.limit * self.backoff_ratio)
+            elif state.in_flight + 1 >= int(state.limit) / 2:
+                # Only grow while the current limit is actually being used
+                state.limit = min(float(self.max_limit), state.limit + 1 / state.limit)
+            self._condition.notify_all()
@@ -0,0 +1,126 @@
+"""DNS caching for HTTP connections in Hyphen SDK."""
+
+import ipaddress
+import socket
+import threading
+import time
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class DnsCache:
+    """Thread-safe cache of resolved host addresses with a time to live.
+
+    Only the host used to open the socket is replaced by the cached address;
+    TLS server name indication and certificate checks still use the host name.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a resolved address is reused before resolving again.
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, int], tuple[str, float]] = {}
+
+    def resolve(self, host: str, port: int) -> str:
+        """
+        Get an address for a host, resolving it if it is not cached.
+
+        Args:
+            host: Host name or IP address.
+            port: Port the connection will be made to.
+
+        Returns:
+            The IP address to connect to.
+
+        Raises:
+            socket.gaierror: If the host cannot be resolved.
+        """
+        try:
+            ipaddress.ip_address(host)
+            return host
+        except ValueError:
+            pass
+
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = str(infos[0][4][0])
+        with self._lock:
+            self._entries[key] = (address, now + self.ttl)
+        return address
+
+    def invalidate(self, host: str, port: int) -> None:
+        """Forget the cached address of a host, e.g. after a connection failure."""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        """Forget every cached address."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _pool_classes(dns_cache: DnsCache) -> dict[str, type[HTTPConnectionPool]]:
+    """Build connection pool classes whose connections resolve through a cache."""
+
+    def new_conn(conn: HTTPConnection, parent: Any) -> Any:
+        host = conn.host
+        try:
+            conn._dns_host = dns_cache.resolve(host, conn.port)
+        except OSError:
+            # Let urllib3 resolve the host itself and report the failure
+            conn._dns_host = host
+        try:
+            return parent._new_conn(conn)
+        except Exception:
+            dns_cache.invalidate(host, conn.port)
+            raise
+
+    class CachedDnsHTTPConnection(HTTPConnection):
+        def _new_conn(self) -> Any:
+            return new_conn(self, HTTPConnection)
+
+    class CachedDnsHTTPSConnection(HTTPSConnection):
+        def _new_conn(self) -> Any:
+            return new_conn(self, HTTPSConnection)
+
+    class CachedDnsHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = CachedDnsHTTPConnection
+
+    class CachedDnsHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = CachedDnsHTTPSConnection
+
+    return {"http": CachedDnsHTTPConnectionPool, "https": CachedDnsHTTPSConnectionPool}
+
+
+class DnsCachingAdapter(HTTPAdapter):
+    """HTTP adapter whose connections resolve host names through a DnsCache."""
+
+    def __init__(self, dns_cache: DnsCache, **kwargs: Any):
+        """
+        Initialize the adapter.
+
+        Args:
+            dns_cache: Cache used to resolve host names.
+            **kwargs: Arguments passed to requests' HTTPAdapter.
+        """
+        self.dns_cache = dns_cache
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool manager with DNS-caching connection pools."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _pool_classes(self.dns_cache)
@@ -0,0 +1,88 @@
+"""Exceptions raised by Hyphen SDK."""
+
+
+class HyphenError(Exception):
+    """Base class for errors raised by the SDK itself."""
+
+
+class RateLimitExceededError(HyphenError):
+    """Raised when a request is rejected by the client-side rate limiter.
+
+    Attributes:
+        endpoint: The API endpoint that was rate limited.
+        retry_after: Seconds until a request to the endpoint would be allowed.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float):
+        """
+        Initialize the error.
+
+        Args:
+            endpoint: The API endpoint that was rate limited.
+            retry_after: Seconds until a request to the endpoint would be allowed.
+        """
+        super().__init__(
+            f"Rate limit exceeded for {endpoint}. Retry after {retry_after:.3f} seconds."
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimitExceededError(HyphenError):
+    """Raised when no concurrency slot frees up within the configured wait.
+
+    Attributes:
+        endpoint: The API endpoint that could not be sent.
+        limit: The in-flight limit at the time of the error.
+    """
+
+    def __init__(self, endpoint: str, limit: int):
+        """
+        Initialize the error.
+
+        Args:
+            endpoint: The API endpoint that could not be sent.
+            limit: The in-flight limit at the time of the error.
+        """
+        super().__init__(f"Concurrency limit of {limit} in-flight requests reached for {endpoint}.")
+        self.endpoint = endpoint
+        self.limit = limit
+
+
+class ResponseTooLargeError(HyphenError):
+    """Raised when a response body exceeds the configured maximum size.
+
+    Attributes:
+        endpoint: The API endpoint whose response was too large.
+        limit: The maximum number of body bytes allowed for the endpoint.
+    """
+
+    def __init__(self, endpoint: str, limit: int):
+        """
+        Initialize the error.
+
+        Args:
+            endpoint: The API endpoint whose response was too large.
+            limit: The maximum number of body bytes allowed for the endpoint.
+        """
+        super().__init__(f"Response from {endpoint} exceeds the limit of {limit} bytes.")
+        self.endpoint = endpoint
+        self.limit = limit
+
+
+class ExecutorQueueFullError(HyphenError):
+    """Raised when a call cannot be submitted because too many are pending.
+
+    Attributes:
+        max_pending: The maximum number of unfinished calls allowed.
+    """
+
+    def __init__(self, max_pending: int):
+        """
+        Initialize the error.
+
+        Args:
+            max_pending: The maximum number of unfinished calls allowed.
+        """
+        super().__init__(f"Cannot submit more than {max_pending} unfinished calls.")
+        self.max_pending = max_pending
@@ -0,0 +1,149 @@
+"""Managed thread pool behind the futures-based API of Hyphen SDK services."""
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from hyphen.exceptions import ExecutorQueueFullError
+from hyphen.session_pool import register_fork_aware
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BoundedExecutor:
+    """Thread pool with a bounded number of submitted, unfinished calls.
+
+    Submitting more than ``max_pending`` calls blocks the caller until a call
+    finishes, or raises ExecutorQueueFullError after ``max_wait`` seconds, so a
+    producer cannot queue unbounded work. Threads are started on first use and
+    rebuilt in processes forked from this one.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_pending: int | None = None,
+        max_wait: float | None = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of threads running calls.
+            max_pending: Maximum number of submitted calls that have not
+                finished, running or queued. Defaults to 4 * max_workers.
+            max_wait: Maximum seconds submit() waits for room before raising
+                ExecutorQueueFullError. Waits indefinitely if not provided.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.max_workers = max_workers
+        self.max_pending = max_pending if max_pending is not None else 4 * max_workers
+        if self.max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        self.max_wait = max_wait
+        self._init_state()
+        register_fork_aware(self)
+
+    def _init_state(self) -> None:
+        """Reset the executor to have no threads and no pending calls."""
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    def _after_fork(self) -> None:
+        """Forget the parent's threads in a forked child process."""
+        self._init_state()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool, creating it on first use."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit calls after the client was closed.")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hyphen"
+                )
+            return self._executor
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """
+        Run a call in the thread pool.
+
+        Args:
+            fn: Function to call.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            A future for the call's result. Cancelling it before the call starts
+            frees its slot.
+
+        Raises:
+            ExecutorQueueFullError: If no slot frees up within max_wait.
+            RuntimeError: If the executor was shut down.
+        """
+        executor = self._get_executor()
+        if not self._slots.acquire(timeout=self.max_wait):
+            raise ExecutorQueueFullError(self.max_pending)
+        try:
+            future = executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """
+        Run a call for every item, yielding the results in order.
+
+        Items are submitted lazily, keeping at most max_pending calls in flight,
+        so arbitrarily long iterables can be processed in bounded memory. If a
+        call raises, its exception is raised when its result is reached and the
+        calls not started yet are cancelled; closing the iterator early cancels
+        them too.
+
+        Args:
+            fn: Function called with each item.
+            items: Items to process.
+
+        Returns:
+            Iterator of the results, in the order of items.
+
+        Raises:
+            RuntimeError: If the executor was shut down.
+        """
+        self._get_executor()
+        return self._map(fn, iter(items))
+
+    def _map(self, fn: Callable[[T], R], items: Iterator[T]) -> Iterator[R]:
+        pending: deque[Future[R]] = deque()
+        try:
+            for item in items:
+                if len(pending) >= self.max_pending:
+                    yield pending.popleft().result()
+                pending.append(self.submit(fn, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = True) -> None:
+        """
+        Stop the threads; later submissions raise RuntimeError.
+
+        Args:
+            wait: Whether to wait for running calls to finish.
+            cancel_futures: Whether to cancel the calls that have not started.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._closed = True
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -2,7 +2,8 @@
 
 import os
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
 from typing import Any
 
 from hyphen.base_client import BaseClient
@@ -32,6 +33,7 @@ class FeatureToggle:
         base_url: str = "https://toggle.hyphen.cloud",
         default_context: ToggleContext | None = None,
         on_error: Callable[[Exception], None] | None = None,
+        **client_options: Any,
     ):
         """
         Initialize the FeatureToggle client.
@@ -48,6 +50,8 @@ class FeatureToggle:
             default_context: Default targeting context for all evaluations.
             on_error: Callback function for error handling. If provided,
                 errors will be passed to this callback instead of being raised.
+            **client_options: Additional options passed to BaseClient, such as
+                hedging or metrics.
         """
         resolved_api_key = (
             api_key
@@ -67,7 +71,26 @@ class FeatureToggle:
         )
         self.default_context = default_context
         self.on_error = on_error
-        self.client = BaseClient(api_key=resolved_api_key, base_url=base_url)
+        self.client = BaseClient(api_key=resolved_api_key, base_url=base_url, **client_options)
+
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Resolve the API host and open pooled connections before traffic arrives.
+
+        Args:
+            connections: Number of connections to open.
+
+        Returns:
+            Number of connections newly opened.
+
+        Raises:
+            OSError: If the host cannot be resolved or connected to.
+        """
+        return self.client.warmup(connections)
+
+    def close(self) -> None:
+        """Release the connections and threads held by the client, cancelling queued calls."""
+        self.client.close()
 
     def _build_payload(
         self, context: ToggleContext | None = None
@@ -139,7 +162,7 @@ class FeatureToggle:
         """
         try:
             payload = self._build_payload(context)
-            response = self.client.post("/toggle/evaluate", data=payload)
+            response = self.client.post("/toggle/evaluate", data=payload, idempotent=True)
 
             toggles: dict[str, Evaluation] = {}
             if isinstance(response, dict) and "toggles" in response:
@@ -179,7 +202,7 @@ class FeatureToggle:
         try:
             payload = self._build_payload(context)
             payload["toggles"] = [toggle_name]
-            response = self.client.post("/toggle/evaluate", data=payload)
+            response = self.client.post("/toggle/evaluate", data=payload, idempotent=True)
 
             if isinstance(response, dict) and "toggles" in response:
                 toggle_data = response["toggles"].get(toggle_name)
@@ -300,7 +323,7 @@ class FeatureToggle:
         try:
             payload = self._build_payload(context)
             payload["toggles"] = toggle_names
-            response = self.client.post("/toggle/evaluate", data=payload)
+            response = self.client.post("/toggle/evaluate", data=payload, idempotent=True)
 
             result: dict[str, Any] = {}
             if isinstance(response, dict) and "toggles" in response:
@@ -312,3 +335,52 @@ class FeatureToggle:
         except Exception as e:
             self._handle_error(e, None)
             return {}
+
+    def submit_evaluate(self, context: ToggleContext | None = None) -> "Future[EvaluationResponse]":
+        """
+        Evaluate all feature toggles in the client's thread pool.
+
+        Args:
+            context: Targeting context for evaluation.
+
+        Returns:
+            Future for the EvaluationResponse.
+
+        Raises:
+            ExecutorQueueFullError: If too many submitted calls are unfinished.
+        """
+        return self.client.executor.submit(self.evaluate, context)
+
+    def map_evaluate(self, contexts: Iterable[ToggleContext]) -> Iterator[EvaluationResponse]:
+        """
+        Evaluate all feature toggles for many contexts concurrently.
+
+        Args:
+            contexts: Targeting contexts to evaluate.
+
+        Returns:
+            Iterator of EvaluationResponse, in the order of contexts.
+        """
+        return self.client.executor.map(self.evaluate, contexts)
+
+    def submit_get_toggle(
+        self,
+        toggle_name: str,
+        default: Any = None,
+        context: ToggleContext | None = None,
+    ) -> "Future[Any]":
+        """
+        Get a single feature toggle value in the client's thread pool.
+
+        Args:
+            toggle_name: Name of the toggle to retrieve.
+            default: Default value to return if toggle is not found or on error.
+            context: Targeting context for evaluation.
+
+        Returns:
+            Future for the toggle value.
+
+        Raises:
+            ExecutorQueueFullError: If too many submitted calls are unfinished.
+        """
+        return self.client.executor.submit(self.get_toggle, toggle_name, default, context)
@@ -0,0 +1,254 @@
+"""Request hedging for idempotent calls in Hyphen SDK."""
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TypeVar
+
+from hyphen.metrics import Metrics
+from hyphen.session_pool import register_fork_aware
+
+T = TypeVar("T")
+
+# Threads running original attempts are not capped: each one serves a caller
+# waiting for it, so their number never exceeds the number of calling threads.
+# Idle threads are reused rather than a new one started per call.
+_PRIMARY_WORKERS = 1 << 16
+
+
+@dataclass
+class HedgePolicy:
+    """Configuration for hedged requests.
+
+    When an idempotent request has not completed after a delay derived from
+    recently observed latencies, a duplicate request is sent and whichever
+    finishes first is used.
+
+    Attributes:
+        percentile: Latency percentile (0-100) used as the hedge delay.
+        min_delay: Lower bound for the hedge delay, in seconds.
+        max_delay: Upper bound for the hedge delay, in seconds.
+        initial_delay: Hedge delay used until min_samples latencies are observed.
+        min_samples: Number of latency samples needed before using the percentile.
+        window_size: Number of most recent latency samples to keep.
+        max_hedge_ratio: Maximum extra load from hedges, as a fraction of requests.
+        burst: Maximum number of hedges that can be sent back to back.
+        max_workers: Maximum number of threads sending duplicate requests.
+            Original requests are not limited, so hedging never queues them
+            behind other callers.
+    """
+
+    percentile: float = 95.0
+    min_delay: float = 0.005
+    max_delay: float = 1.0
+    initial_delay: float = 0.1
+    min_samples: int = 20
+    window_size: int = 1000
+    max_hedge_ratio: float = 0.1
+    burst: float = 10.0
+    max_workers: int = 32
+
+    def __post_init__(self) -> None:
+        """Validate the policy values."""
+        if not 0 < self.percentile <= 100:
+            raise ValueError("percentile must be in the range (0, 100].")
+        if self.min_delay < 0 or self.max_delay < self.min_delay:
+            raise ValueError("max_delay must be greater than or equal to min_delay >= 0.")
+        if self.max_hedge_ratio < 0:
+            raise ValueError("max_hedge_ratio must not be negative.")
+
+
+class LatencyTracker:
+    """Thread-safe rolling window of request latencies."""
+
+    def __init__(self, window_size: int = 1000):
+        """
+        Initialize the latency tracker.
+
+        Args:
+            window_size: Number of most recent samples to keep.
+        """
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=window_size)
+
+    def __len__(self) -> int:
+        """Return the number of samples currently in the window."""
+        with self._lock:
+            return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        """Record a latency sample, in seconds."""
+        with self._lock:
+            self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> float | None:
+        """
+        Get a latency percentile using the nearest-rank method.
+
+        Args:
+            percentile: Percentile in the range (0, 100].
+
+        Returns:
+            The latency at the given percentile, or None if no samples exist.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(1, math.ceil(percentile / 100 * len(samples)))
+        return samples[rank - 1]
+
+
+class Hedger:
+    """Runs idempotent calls with a hedged duplicate after a latency-derived delay.
+
+    The extra load is capped with a credit budget: every call earns
+    ``max_hedge_ratio`` credits (up to ``burst``) and every hedge spends one.
+    Processes forked from this one start with fresh threads and budget.
+
+    Metrics recorded:
+        hedge.calls: Calls run through the hedger.
+        hedge.sent: Duplicate requests sent.
+        hedge.wins: Calls answered by the duplicate rather than the original.
+        hedge.budget_exhausted: Hedges skipped because the budget was spent.
+    """
+
+    def __init__(self, policy: HedgePolicy, metrics: Metrics | None = None):
+        """
+        Initialize the hedger.
+
+        Args:
+            policy: Hedging configuration.
+            metrics: Metrics registry to record hedge statistics in.
+        """
+        self.policy = policy
+        self.metrics = metrics or Metrics()
+        self._init_state()
+        register_fork_aware(self)
+
+    def _init_state(self) -> None:
+        """Reset the hedger to have no threads, budget or latency samples."""
+        self.latencies = LatencyTracker(self.policy.window_size)
+        self._lock = threading.Lock()
+        self._credits = 0.0
+        self._primaries: ThreadPoolExecutor | None = None
+        self._hedges: ThreadPoolExecutor | None = None
+
+    def _after_fork(self) -> None:
+        """Forget the parent's threads, whose workers do not exist in the child."""
+        self._init_state()
+
+    def delay(self) -> float:
+        """Get the current hedge delay, in seconds."""
+        if len(self.latencies) < self.policy.min_samples:
+            delay = self.policy.initial_delay
+        else:
+            delay = self.latencies.percentile(self.policy.percentile) or 0.0
+        return min(max(delay, self.policy.min_delay), self.policy.max_delay)
+
+    def _try_spend_credit(self) -> bool:
+        """Take one hedge credit if the budget allows it."""
+        with self._lock:
+            if self._credits >= 1:
+                self._credits -= 1
+                return True
+            return False
+
+    def _earn_credit(self) -> None:
+        """Add credit for a new call, up to the burst size."""
+        with self._lock:
+            self._credits = min(self._credits + self.policy.max_hedge_ratio, self.policy.burst)
+
+    def _get_executors(self) -> tuple[ThreadPoolExecutor, ThreadPoolExecutor]:
+        """Get the executors running original and duplicate attempts, creating them on first use."""
+        with self._lock:
+            if self._primaries is None or self._hedges is None:
+                self._primaries = ThreadPoolExecutor(
+                    max_workers=_PRIMARY_WORKERS,
+                    thread_name_prefix="hyphen-call",
+                )
+                self._hedges = ThreadPoolExecutor(
+                    max_workers=self.policy.max_workers,
+                    thread_name_prefix="hyphen-hedge",
+                )
+            return self._primaries, self._hedges
+
+    def _timed(self, call: Callable[[], T]) -> Callable[[], T]:
+        """Wrap a call so that its latency is recorded on success."""
+
+        def run() -> T:
+            start = time.monotonic()
+            result = call()
+            self.latencies.record(time.monotonic() - start)
+            return result
+
+        return run
+
+    def run(self, call: Callable[[], T], on_discard: Callable[[T], None] | None = None) -> T:
+        """
+        Run a call, sending a duplicate if it is slower than the hedge delay.
+
+        The first attempt to complete successfully wins. If one attempt raises,
+        the other attempt's outcome is used instead.
+
+        Args:
+            call: Idempotent function performing the request.
+            on_discard: Called with the result of the losing attempt, if any,
+                e.g. to release its connection.
+
+        Returns:
+            The result of the first successful attempt.
+        """
+        self.metrics.increment("hedge.calls")
+        self._earn_credit()
+        primaries, hedges = self._get_executors()
+        primary = primaries.submit(self._timed(call))
+        done, _ = wait([primary], timeout=self.delay())
+        if done:
+            return primary.result()
+
+        if not self._try_spend_credit():
+            self.metrics.increment("hedge.budget_exhausted")
+            return primary.result()
+
+        self.metrics.increment("hedge.sent")
+        hedge = hedges.submit(self._timed(call))
+        pending: set[Future[T]] = {primary, hedge}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if future is hedge:
+                    self.metrics.increment("hedge.wins")
+                loser = hedge if future is primary else primary
+                if not loser.cancel() and on_discard is not None:
+                    loser.add_done_callback(_discard_callback(on_discard))
+                return future.result()
+        assert error is not None
+        raise error
+
+    def close(self) -> None:
+        """Shut down the hedging threads without waiting for running calls."""
+        with self._lock:
+            executors = (self._primaries, self._hedges)
+            self._primaries = self._hedges = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+def _discard_callback(on_discard: Callable[[T], None]) -> Callable[["Future[T]"], None]:
+    """Build a done-callback passing a losing attempt's result to on_discard."""
+
+    def callback(future: "Future[T]") -> None:
+        if not future.cancelled() and future.exception() is None:
+            on_discard(future.result())
+
+    return callback
@@ -0,0 +1,368 @@
+"""HTTP caching with conditional requests for Hyphen SDK."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import requests
+
+from hyphen.metrics import Metrics
+from hyphen.transport import Transport, build_response
+
+# Headers describing the encoded body, which cached bodies no longer match
+_BODY_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+# Headers describing the rate limits when the response was sent, which replaying
+# them from the cache would apply again
+_RATE_LIMIT_HEADERS = frozenset(
+    {
+        "retry-after",
+        "x-ratelimit-limit",
+        "x-ratelimit-remaining",
+        "x-ratelimit-reset",
+        "ratelimit-limit",
+        "ratelimit-remaining",
+        "ratelimit-reset",
+    }
+)
+
+CacheKey = tuple[str, str, str]
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body with its validators and freshness."""
+
+    content: bytes
+    headers: dict[str, str]
+    fresh_until: float
+
+    @property
+    def etag(self) -> str | None:
+        """The entity tag to revalidate with, if the server sent one."""
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """The modification date to revalidate with, if the server sent one."""
+        return self.headers.get("last-modified")
+
+    def is_fresh(self, now: float) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return now < self.fresh_until
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """
+    Parse a Cache-Control header.
+
+    Args:
+        value: Header value, e.g. 'max-age=60, must-revalidate'.
+
+    Returns:
+        Lower-cased directive names mapped to their unquoted values, or None for
+        directives without a value.
+    """
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, sep, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if sep else None
+    return directives
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> float:
+    """
+    Get how long a response stays fresh, following RFC 9111 for a private cache.
+
+    Args:
+        headers: Response headers with lower-cased names.
+
+    Returns:
+        Seconds the response can be served without revalidation, from now.
+    """
+    directives = parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in directives:
+        return 0.0
+
+    lifetime = 0.0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            lifetime = float(max_age)
+        except ValueError:
+            return 0.0
+    elif "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"])
+            date = parsedate_to_datetime(headers["date"]) if "date" in headers else None
+        except (TypeError, ValueError):
+            return 0.0
+        if date is None:
+            lifetime = expires.timestamp() - time.time()
+        else:
+            lifetime = (expires - date).total_seconds()
+
+    try:
+        age = float(headers.get("age", 0))
+    except ValueError:
+        age = 0.0
+    return max(0.0, lifetime - age)
+
+
+class HttpCache:
+    """Bounded, thread-safe store of GET responses for conditional requests.
+
+    Responses are kept if they carry an ``ETag`` or ``Last-Modified`` validator
+    or a freshness lifetime, unless ``Cache-Control: no-store`` forbids it.
+    Fresh responses are served without a request; stale ones are revalidated
+    with ``If-None-Match``/``If-Modified-Since`` and served from the store when
+    the server answers 304 Not Modified. The least recently used entries are
+    evicted first. Entries are scoped to the API key they were fetched with.
+
+    Example:
+        >>> from hyphen import HttpCache, Link
+        >>> link = Link(organization_id="org", api_key="key", http_cache=HttpCache())
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+    ) -> CacheKey:
+        """Build the key of a GET request."""
+        query = json.dumps(params, sort_keys=True, default=str) if params else ""
+        api_key = (headers or {}).get("x-api-key", "")
+        return (url, query, hashlib.sha256(api_key.encode()).hexdigest())
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """Get an entry, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: CacheKey, entry: CacheEntry) -> int:
+        """
+        Store an entry, evicting the least recently used ones beyond max_entries.
+
+        Returns:
+            Number of entries evicted.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def discard(self, key: CacheKey) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_url(self, url: str) -> None:
+        """Remove every entry for a URL, whatever its query parameters."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == url]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class CachingTransport:
+    """Transport answering GET requests from an HttpCache where possible.
+
+    Successful requests with other methods than GET, HEAD and OPTIONS
+    invalidate the cached responses of their URL, so writes through the SDK are
+    seen by the next read.
+
+    Metrics:
+        http_cache.hits: Fresh responses served without a request.
+        http_cache.revalidated: Stale responses confirmed unchanged by a 304.
+        http_cache.misses: GET requests answered with a full response.
+        http_cache.evictions: Entries dropped to stay within max_entries.
+    """
+
+    def __init__(self, transport: Transport, cache: HttpCache, metrics: Metrics):
+        """
+        Initialize the transport.
+
+        Args:
+            transport: Transport sending the requests that cannot be served
+                from the cache.
+            cache: Store of cached responses.
+            metrics: Registry receiving the cache metrics.
+        """
+        self.transport = transport
+        self.cache = cache
+        self.metrics = metrics
+
+    def lookup(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> requests.Response | None:
+        """
+        Get a fresh cached response to a GET request without sending it.
+
+        Returns:
+            The cached response, or None if the request has to be sent.
+        """
+        entry = self.cache.get(self.cache.key(url, params, headers))
+        if entry is None or not entry.is_fresh(time.monotonic()):
+            return None
+        self.metrics.increment("http_cache.hits")
+        return _cached_response(url, entry)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a request, revalidating or storing cached GET responses.
+
+        Streamed GET responses are still revalidated, but only stored once the
+        caller has read them and passes them to store().
+        """
+        if method != "GET":
+            response = self.transport.request(method, url, data, params, headers, stream)
+            if method not in ("HEAD", "OPTIONS") and response.status_code < 400:
+                self.cache.invalidate_url(url)
+            return response
+
+        key = self.cache.key(url, params, headers)
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh(time.monotonic()):
+            self.metrics.increment("http_cache.hits")
+            return _cached_response(url, entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag is not None:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        response = self.transport.request(method, url, data, params, request_headers, stream)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            merged = dict(entry.headers)
+            for name, value in response.headers.items():
+                if name.lower() not in _BODY_HEADERS:
+                    merged[name.lower()] = value
+            entry = CacheEntry(
+                content=entry.content,
+                headers=_cacheable_headers(merged),
+                fresh_until=time.monotonic() + freshness_lifetime(merged),
+            )
+            self.cache.put(key, entry)
+            self.metrics.increment("http_cache.revalidated")
+            # The 304 was sent now, so its rate-limit headers are still current
+            return build_response(url, 200, entry.content, merged, "OK", wire_bytes=0)
+
+        self.metrics.increment("http_cache.misses")
+        if not stream:
+            self.store(url, params, headers, response)
+        return response
+
+    def store(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        response: requests.Response,
+    ) -> None:
+        """
+        Store the fully read response to a GET request, if it may be cached.
+
+        Args:
+            url: URL of the request.
+            params: Query parameters of the request.
+            headers: Headers of the request, before validators were added.
+            response: The response, whose body has been read.
+        """
+        if response.status_code != 200:
+            return
+        key = self.cache.key(url, params, headers)
+        entry = _entry_from_response(response)
+        if entry is None:
+            self.cache.discard(key)
+            return
+        evicted = self.cache.put(key, entry)
+        if evicted:
+            self.metrics.increment("http_cache.evictions", evicted)
+
+    def warmup(self, url: str, connections: int) -> int:
+        """Open connections with the wrapped transport."""
+        return self.transport.warmup(url, connections)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
+
+
+def _entry_from_response(response: requests.Response) -> CacheEntry | None:
+    """Build a cache entry from a response, or None if it must not be stored."""
+    headers = _cacheable_headers(
+        {key.lower(): value for key, value in response.headers.items()}
+    )
+    if "no-store" in parse_cache_control(headers.get("cache-control")):
+        return None
+    lifetime = freshness_lifetime(headers)
+    if lifetime <= 0 and "etag" not in headers and "last-modified" not in headers:
+        return None
+    return CacheEntry(
+        content=response.content,
+        headers=headers,
+        fresh_until=time.monotonic() + lifetime,
+    )
+
+
+def _cacheable_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """Drop the lower-cased headers that must not be replayed with a cached body."""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name not in _BODY_HEADERS and name not in _RATE_LIMIT_HEADERS
+    }
+
+
+def _cached_response(url: str, entry: CacheEntry) -> requests.Response:
+    """Build a response from a cache entry; no bytes were received for it."""
+    return build_response(url, 200, entry.content, entry.headers, "OK", wire_bytes=0)
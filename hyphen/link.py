@@ -1,20 +1,42 @@
 """Link short code service for Hyphen SDK."""
 
 import os
-from datetime import datetime
+import random
+import time
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from itertools import islice
 from typing import Any, cast
 
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
 from hyphen.base_client import BaseClient
+from hyphen.click_stats import ShortCodeStats
+from hyphen.exceptions import HyphenError, RateLimitExceededError
+from hyphen.pagination import iter_pages
+from hyphen.rate_limit import _parse_seconds
+from hyphen.short_code_cache import ShortCodeCache
+from hyphen.stats_export import StatsRow, merge_stats, split_date_range
 from hyphen.types import (
     CreateQrCodeOptions,
     CreateShortCodeOptions,
     QrCode,
     QrCodesResponse,
     ShortCode,
+    ShortCodeCreationError,
     ShortCodesResponse,
     UpdateShortCodeOptions,
 )
 
+# Statuses of requests rejected before being processed, which are safe to retry.
+# Gateway errors (502, 504) are not: the upstream may have created the short code.
+RETRY_STATUSES = frozenset({429, 503})
+
+# An item of a bulk creation: (long_url, domain) or (long_url, domain, options)
+ShortCodeItem = tuple[str, str] | tuple[str, str, CreateShortCodeOptions | None]
+
 
 class Link:
     """Client for short code and QR code management in Hyphen."""
@@ -24,6 +46,8 @@ class Link:
         organization_id: str | None = None,
         api_key: str | None = None,
         base_url: str = "https://api.hyphen.ai",
+        short_code_cache: ShortCodeCache | None = None,
+        **client_options: Any,
     ):
         """
         Initialize the Link client.
@@ -34,6 +58,10 @@ class Link:
             api_key: API key for authentication. If not provided, will check
                 HYPHEN_API_KEY env var.
             base_url: Base URL for the Hyphen API.
+            short_code_cache: Cache answering get_short_code without requests,
+                kept up to date by the writes made through this client.
+            **client_options: Additional options passed to BaseClient, such as
+                hedging or metrics.
         """
         self.organization_id = organization_id or os.environ.get("HYPHEN_ORGANIZATION_ID")
         if not self.organization_id:
@@ -42,7 +70,27 @@ class Link:
                 "HYPHEN_ORGANIZATION_ID environment variable."
             )
 
-        self.client = BaseClient(api_key=api_key, base_url=base_url)
+        self.short_code_cache = short_code_cache
+        self.client = BaseClient(api_key=api_key, base_url=base_url, **client_options)
+
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Resolve the API host and open pooled connections before traffic arrives.
+
+        Args:
+            connections: Number of connections to open.
+
+        Returns:
+            Number of connections newly opened.
+
+        Raises:
+            OSError: If the host cannot be resolved or connected to.
+        """
+        return self.client.warmup(connections)
+
+    def close(self) -> None:
+        """Release the connections and threads held by the client, cancelling queued calls."""
+        self.client.close()
 
     def create_short_code(
         self,
@@ -73,7 +121,121 @@ class Link:
             data.update(options)
 
         response = self.client.post(endpoint, data=data)
-        return ShortCode.from_dict(response)
+        return self._cache_short_code(ShortCode.from_dict(response))
+
+    def create_short_codes(
+        self,
+        items: Iterable[ShortCodeItem],
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+    ) -> Iterator[ShortCode | ShortCodeCreationError]:
+        """
+        Create many short codes concurrently.
+
+        Creations run on the client's thread pool and are paced by its rate
+        limiter, if any. Creation is not idempotent, so only requests known
+        not to have been processed are retried: those rejected with 429 or
+        503, failing to connect or refused by a non-blocking rate limiter.
+        They are retried after the advertised delay or an exponential
+        backoff. A creation that still fails is reported in place of its short
+        code without aborting the others; it is marked ambiguous if the
+        request may have created the short code anyway, e.g. after a 502, a
+        timeout or a connection dropped mid-request. Items are consumed
+        lazily, so large batches use bounded memory.
+
+        Args:
+            items: (long_url, domain) or (long_url, domain, options) tuples
+            max_attempts: Maximum number of attempts per short code
+            backoff: Seconds to wait before the first retry, doubled for
+                each following retry
+
+        Returns:
+            Iterator of ShortCode or ShortCodeCreationError for each item,
+            in the order of items
+
+        Raises:
+            ValueError: If max_attempts is less than 1
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+        def create(indexed: tuple[int, ShortCodeItem]) -> ShortCode | ShortCodeCreationError:
+            index, item = indexed
+            return self._create_with_retries(index, item, max_attempts, backoff)
+
+        return self.client.executor.map(create, enumerate(items))
+
+    def _create_with_retries(
+        self, index: int, item: ShortCodeItem, max_attempts: int, backoff: float
+    ) -> ShortCode | ShortCodeCreationError:
+        """Create a short code of a bulk creation, retrying transient failures."""
+        long_url, domain = item[0], item[1]
+        options = item[2] if len(item) > 2 else None
+        attempt = 1
+        while True:
+            try:
+                return self.create_short_code(long_url, domain, options)
+            except (requests.RequestException, HyphenError) as error:
+                delay = self._retry_delay(error, attempt, backoff)
+                if delay is None or attempt >= max_attempts:
+                    self.client.metrics.increment("short_codes.create_failures")
+                    return ShortCodeCreationError(
+                        index=index,
+                        long_url=long_url,
+                        domain=domain,
+                        error=error,
+                        attempts=attempt,
+                        ambiguous=self._may_have_been_processed(error),
+                    )
+            self.client.metrics.increment("short_codes.create_retries")
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int, backoff: float) -> float | None:
+        """Get the seconds to wait before retrying a failed creation, or None."""
+        if isinstance(error, RateLimitExceededError):
+            return error.retry_after
+        if isinstance(error, requests.HTTPError):
+            response = error.response
+            if response is None or response.status_code not in RETRY_STATUSES:
+                return None
+            retry_after = _parse_seconds(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        elif not Link._failed_before_sending(error):
+            return None
+        # Full jitter spreads out the retries of concurrent creations
+        return random.uniform(0, backoff * 2 ** (attempt - 1))
+
+    @staticmethod
+    def _failed_before_sending(error: Exception) -> bool:
+        """Whether a request failed while connecting, before any byte was sent."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if not isinstance(error, requests.ConnectionError):
+            return False
+        cause: BaseException | None = error
+        while cause is not None:
+            if isinstance(cause, NewConnectionError):
+                return True
+            reasons = [arg.reason for arg in cause.args if isinstance(arg, MaxRetryError)]
+            if any(isinstance(reason, NewConnectionError) for reason in reasons):
+                return True
+            cause = cause.__cause__ or cause.__context__
+        return False
+
+    @staticmethod
+    def _may_have_been_processed(error: Exception) -> bool:
+        """Whether a failed creation request may still have created the short code."""
+        if isinstance(error, HyphenError):
+            return False
+        if isinstance(error, requests.HTTPError):
+            response = error.response
+            return response is None or (
+                response.status_code >= 500 and response.status_code not in RETRY_STATUSES
+            )
+        return not Link._failed_before_sending(error)
 
     def update_short_code(
         self,
@@ -94,13 +256,22 @@ class Link:
             requests.HTTPError: If the request fails
         """
         endpoint = f"/api/organizations/{self.organization_id}/link/codes/{code}"
-        response = self.client.patch(endpoint, data=cast(dict[str, Any], options))
-        return ShortCode.from_dict(response)
+        try:
+            response = self.client.patch(endpoint, data=cast(dict[str, Any], options))
+        except Exception:
+            # The update may have been applied, so the cached code is suspect
+            if self.short_code_cache is not None:
+                self.short_code_cache.discard(str(self.organization_id), code)
+            raise
+        return self._cache_short_code(ShortCode.from_dict(response))
 
     def get_short_code(self, code: str) -> ShortCode:
         """
         Get a specific short code by its identifier.
 
+        With a short_code_cache, cached short codes are returned without any
+        request.
+
         Args:
             code: The code identifier for the short code to retrieve
 
@@ -110,9 +281,25 @@ class Link:
         Raises:
             requests.HTTPError: If the request fails
         """
+        cache = self.short_code_cache
+        if cache is not None:
+            cached = cache.get(str(self.organization_id), code)
+            if cached is not None:
+                self.client.metrics.increment("short_code_cache.hits")
+                return cached
+            self.client.metrics.increment("short_code_cache.misses")
+
         endpoint = f"/api/organizations/{self.organization_id}/link/codes/{code}"
         response = self.client.get(endpoint)
-        return ShortCode.from_dict(response)
+        return self._cache_short_code(ShortCode.from_dict(response))
+
+    def _cache_short_code(self, short_code: ShortCode) -> ShortCode:
+        """Store a short code read or written through the API in the cache."""
+        if self.short_code_cache is not None and short_code.code:
+            evicted = self.short_code_cache.put(str(self.organization_id), short_code)
+            if evicted:
+                self.client.metrics.increment("short_code_cache.evictions", evicted)
+        return short_code
 
     def get_short_codes(
         self,
@@ -137,8 +324,139 @@ class Link:
             requests.HTTPError: If the request fails
         """
         endpoint = f"/api/organizations/{self.organization_id}/link/codes"
-        params: dict[str, Any] = {}
+        params = self._short_codes_params(title, tags, page_number, page_size)
+        response = self.client.get(endpoint, params=params if params else None)
+        return ShortCodesResponse.from_dict(response)
+
+    def stream_short_codes(
+        self,
+        title: str | None = None,
+        tags: list[str] | None = None,
+        page_number: int | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[ShortCode]:
+        """
+        Get a page of short codes, parsing them one at a time as they arrive.
+
+        Unlike get_short_codes, the page is never held in memory as a whole,
+        which keeps memory flat for large page sizes.
+
+        Args:
+            title: Optional title to filter short codes
+            tags: Optional list of tags to filter short codes
+            page_number: Optional page number for pagination
+            page_size: Optional page size for pagination
+
+        Yields:
+            Each ShortCode of the page, in order
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        endpoint = f"/api/organizations/{self.organization_id}/link/codes"
+        params = self._short_codes_params(title, tags, page_number, page_size)
+        for item in self.client.stream_items("GET", endpoint, params=params if params else None):
+            yield ShortCode.from_dict(item)
 
+    def iter_short_codes(
+        self,
+        title: str | None = None,
+        tags: list[str] | None = None,
+        page_size: int | None = None,
+        prefetch_pages: int = 1,
+    ) -> Iterator[ShortCode]:
+        """
+        Iterate over every short code, walking the pages of the listing.
+
+        The next pages are fetched in the background while the current one is
+        consumed, keeping at most prefetch_pages + 1 pages in memory.
+
+        Args:
+            title: Optional title to filter short codes
+            tags: Optional list of tags to filter short codes
+            page_size: Optional page size for pagination
+            prefetch_pages: Number of pages fetched ahead; 0 fetches sequentially
+
+        Yields:
+            Each ShortCode, in listing order
+
+        Raises:
+            requests.HTTPError: If a request fails
+        """
+
+        for page in self.iter_short_code_pages(title, tags, page_size, prefetch_pages):
+            yield from page.data
+
+    def iter_short_code_pages(
+        self,
+        title: str | None = None,
+        tags: list[str] | None = None,
+        page_size: int | None = None,
+        prefetch_pages: int = 1,
+    ) -> Generator[ShortCodesResponse, None, None]:
+        """
+        Iterate over the pages of the short code listing, like iter_short_codes.
+
+        Args:
+            title: Optional title to filter short codes
+            tags: Optional list of tags to filter short codes
+            page_size: Optional page size for pagination
+            prefetch_pages: Number of pages fetched ahead; 0 fetches sequentially
+
+        Yields:
+            Each ShortCodesResponse page, in order
+
+        Raises:
+            requests.HTTPError: If a request fails
+        """
+
+        def fetch(page_number: int) -> ShortCodesResponse:
+            return self.get_short_codes(title, tags, page_number, page_size)
+
+        return iter_pages(fetch, self.client.executor.submit, prefetch_pages)
+
+    def fetch_all_short_codes(
+        self,
+        title: str | None = None,
+        tags: list[str] | None = None,
+        page_size: int | None = None,
+        max_concurrency: int = 8,
+    ) -> Iterator[ShortCode]:
+        """
+        Iterate over every short code, fetching the pages concurrently.
+
+        Once the first page reports the total, up to max_concurrency of the
+        remaining pages are requested at once on the client's thread pool and
+        their short codes are yielded in listing order as pages complete.
+        Concurrency is also bounded by the client's max_workers.
+
+        Args:
+            title: Optional title to filter short codes
+            tags: Optional list of tags to filter short codes
+            page_size: Optional page size for pagination
+            max_concurrency: Maximum number of pages requested at once
+
+        Returns:
+            Iterator of every ShortCode, in listing order. The first page is
+            requested when iteration starts.
+
+        Raises:
+            requests.HTTPError: If a request fails
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        return self.iter_short_codes(title, tags, page_size, prefetch_pages=max_concurrency)
+
+    @staticmethod
+    def _short_codes_params(
+        title: str | None,
+        tags: list[str] | None,
+        page_number: int | None,
+        page_size: int | None,
+    ) -> dict[str, Any]:
+        """Build the query parameters of a short code listing."""
+        params: dict[str, Any] = {}
         if title:
             params["title"] = title
         if tags:
@@ -147,9 +465,7 @@ class Link:
             params["pageNum"] = page_number
         if page_size is not None:
             params["pageSize"] = page_size
-
-        response = self.client.get(endpoint, params=params if params else None)
-        return ShortCodesResponse.from_dict(response)
+        return params
 
     def get_tags(self) -> list[str]:
         """
@@ -195,6 +511,150 @@ class Link:
 
         return dict(self.client.get(endpoint, params=params if params else None))
 
+    def get_columnar_short_code_stats(
+        self,
+        code: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> ShortCodeStats:
+        """
+        Get statistics for a short code as array-backed columns.
+
+        Args:
+            code: The code identifier for the short code
+            start_date: Optional start date for the stats
+            end_date: Optional end date for the stats
+
+        Returns:
+            ShortCodeStats with the click series and breakdowns
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        return ShortCodeStats.from_dict(self.get_short_code_stats(code, start_date, end_date))
+
+    def submit_get_short_code(self, code: str) -> "Future[ShortCode]":
+        """
+        Get a specific short code in the client's thread pool.
+
+        Args:
+            code: The code identifier for the short code to retrieve
+
+        Returns:
+            Future for the ShortCode
+
+        Raises:
+            ExecutorQueueFullError: If too many submitted calls are unfinished
+        """
+        return self.client.executor.submit(self.get_short_code, code)
+
+    def map_get_short_code(self, codes: Iterable[str]) -> Iterator[ShortCode]:
+        """
+        Get many short codes concurrently.
+
+        Args:
+            codes: The code identifiers of the short codes to retrieve
+
+        Returns:
+            Iterator of ShortCode, in the order of codes
+        """
+        return self.client.executor.map(self.get_short_code, codes)
+
+    def submit_get_short_code_stats(
+        self,
+        code: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> "Future[dict[str, Any]]":
+        """
+        Get statistics for a short code in the client's thread pool.
+
+        Args:
+            code: The code identifier for the short code
+            start_date: Optional start date for the stats
+            end_date: Optional end date for the stats
+
+        Returns:
+            Future for the dictionary containing statistics information
+
+        Raises:
+            ExecutorQueueFullError: If too many submitted calls are unfinished
+        """
+        return self.client.executor.submit(self.get_short_code_stats, code, start_date, end_date)
+
+    def map_get_short_code_stats(
+        self,
+        codes: Iterable[str],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Get statistics for many short codes concurrently.
+
+        Args:
+            codes: The code identifiers of the short codes
+            start_date: Optional start date for the stats
+            end_date: Optional end date for the stats
+
+        Returns:
+            Iterator of statistics dictionaries, in the order of codes
+        """
+        return self.client.executor.map(
+            lambda code: self.get_short_code_stats(code, start_date, end_date), codes
+        )
+
+    def iter_short_code_stats(
+        self,
+        codes: Iterable[str],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        window: timedelta | None = None,
+    ) -> Iterator[StatsRow]:
+        """
+        Get statistics for many short codes concurrently, in bounded memory.
+
+        With a window, the date range is split into windows of that length
+        whose statistics are fetched in parallel and merged with merge_stats.
+        Codes are consumed lazily and at most the client's max_pending
+        requests are in flight, so the results can be written out with
+        write_ndjson or write_csv in constant memory.
+
+        Args:
+            codes: The code identifiers of the short codes
+            start_date: Optional start date for the stats
+            end_date: Optional end date for the stats
+            window: Optional length of the windows the date range is split into.
+                Requires start_date and end_date.
+
+        Returns:
+            Iterator of (code, statistics) pairs, in the order of codes
+
+        Raises:
+            ValueError: If window is given without both dates
+        """
+        if window is None:
+            windows: list[tuple[datetime | None, datetime | None]] = [(start_date, end_date)]
+        elif start_date is None or end_date is None:
+            raise ValueError("start_date and end_date are required to split stats into windows.")
+        else:
+            windows = list(split_date_range(start_date, end_date, window))
+
+        fetches = ((code, start, end) for code in codes for start, end in windows)
+        results = self.client.executor.map(
+            lambda fetch: (fetch[0], self.get_short_code_stats(*fetch)), fetches
+        )
+        return self._merge_windows(results, len(windows))
+
+    @staticmethod
+    def _merge_windows(results: Iterator[StatsRow], count: int) -> Iterator[StatsRow]:
+        """Merge each run of count consecutive window results, which share a code."""
+        for code, stats in results:
+            if count == 1:
+                yield code, stats
+                continue
+            parts = [stats, *(part for _, part in islice(results, count - 1))]
+            yield code, merge_stats(parts)
+
     def delete_short_code(self, code: str) -> None:
         """
         Delete a short code.
@@ -206,7 +666,12 @@ class Link:
             requests.HTTPError: If the request fails
         """
         endpoint = f"/api/organizations/{self.organization_id}/link/codes/{code}"
-        self.client.delete(endpoint)
+        try:
+            self.client.delete(endpoint)
+        finally:
+            # Whether or not the delete was applied, the cached code is gone or suspect
+            if self.short_code_cache is not None:
+                self.short_code_cache.discard(str(self.organization_id), code)
 
     def create_qr_code(
         self,
@@ -286,6 +751,36 @@ class Link:
         response = self.client.get(endpoint, params=params if params else None)
         return QrCodesResponse.from_dict(response)
 
+    def iter_qr_codes(
+        self,
+        code: str,
+        page_size: int | None = None,
+        prefetch_pages: int = 1,
+    ) -> Iterator[QrCode]:
+        """
+        Iterate over every QR code of a short code, walking the pages.
+
+        The next pages are fetched in the background while the current one is
+        consumed, keeping at most prefetch_pages + 1 pages in memory.
+
+        Args:
+            code: The code identifier for the short code
+            page_size: Optional page size for pagination
+            prefetch_pages: Number of pages fetched ahead; 0 fetches sequentially
+
+        Yields:
+            Each QrCode, in listing order
+
+        Raises:
+            requests.HTTPError: If a request fails
+        """
+
+        def fetch(page_number: int) -> QrCodesResponse:
+            return self.get_qr_codes(code, page_number, page_size)
+
+        for page in iter_pages(fetch, self.client.executor.submit, prefetch_pages):
+            yield from page.data
+
     def delete_qr_code(self, code: str, qr_id: str) -> None:
         """
         Delete a QR code.
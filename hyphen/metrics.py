@@ -0,0 +1,79 @@
+"""Client-side metrics for Hyphen SDK."""
+
+import threading
+
+
+class Metrics:
+    """Thread-safe registry of counters and gauges recorded by the SDK clients.
+
+    Counters only ever increase (e.g. ``hedge.wins``), while gauges hold the
+    latest observed value (e.g. a current concurrency limit). A single instance
+    can be shared between several clients to aggregate their metrics.
+
+    Example:
+        >>> from hyphen import Metrics, NetInfo
+        >>> metrics = Metrics()
+        >>> net_info = NetInfo(api_key="your_api_key", metrics=metrics)
+        >>> metrics.snapshot()
+        {}
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty metrics registry."""
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Increase a counter.
+
+        Args:
+            name: Counter name.
+            value: Amount to add to the counter.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Set a gauge to its latest value.
+
+        Args:
+            name: Gauge name.
+            value: Current value of the gauge.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def get(self, name: str, default: float = 0) -> float:
+        """
+        Get the current value of a counter or gauge.
+
+        Args:
+            name: Counter or gauge name.
+            default: Value returned if nothing was recorded under this name.
+
+        Returns:
+            The recorded value, or the default.
+        """
+        with self._lock:
+            if name in self._counters:
+                return self._counters[name]
+            return self._gauges.get(name, default)
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Get a point-in-time copy of all counters and gauges.
+
+        Returns:
+            Dictionary mapping metric names to their values.
+        """
+        with self._lock:
+            return {**self._counters, **self._gauges}
+
+    def reset(self) -> None:
+        """Clear all recorded counters and gauges."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
@@ -1,5 +1,8 @@
 """NetInfo for IP geolocation in Hyphen SDK."""
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from typing import Any
 
 from hyphen.base_client import BaseClient
 from hyphen.types import IpInfo, IpInfoError
@@ -12,6 +15,7 @@ class NetInfo:
         self,
         api_key: str | None = None,
         base_url: str = "https://net.info",
+        **client_options: Any,
     ):
         """
         Initialize the NetInfo client.
@@ -19,8 +23,29 @@ class NetInfo:
         Args:
             api_key: API key for authentication. If not provided, will check HYPHEN_API_KEY env var.
             base_url: Base URL for the Hyphen API.
+            **client_options: Additional options passed to BaseClient, such as
+                hedging or metrics.
         """
-        self.client = BaseClient(api_key=api_key, base_url=base_url)
+        self.client = BaseClient(api_key=api_key, base_url=base_url, **client_options)
+
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Resolve the API host and open pooled connections before traffic arrives.
+
+        Args:
+            connections: Number of connections to open.
+
+        Returns:
+            Number of connections newly opened.
+
+        Raises:
+            OSError: If the host cannot be resolved or connected to.
+        """
+        return self.client.warmup(connections)
+
+    def close(self) -> None:
+        """Release the connections and threads held by the client, cancelling queued calls."""
+        self.client.close()
 
     def get_ip_info(self, ip_address: str) -> IpInfo | IpInfoError:
         """
@@ -70,3 +95,73 @@ class NetInfo:
             else:
                 results.append(IpInfo.from_dict(item))
         return results
+
+    def stream_ip_infos(self, ip_addresses: list[str]) -> Iterator[IpInfo | IpInfoError]:
+        """
+        Get geolocation information for multiple IP addresses, parsing results as they arrive.
+
+        Unlike get_ip_infos, the response is never held in memory as a whole,
+        which keeps memory flat for large lookups.
+
+        Args:
+            ip_addresses: List of IP addresses to look up
+
+        Returns:
+            Iterator of IpInfo or IpInfoError for each IP, in order. The request
+            is sent when iteration starts.
+
+        Raises:
+            requests.HTTPError: If the request fails
+            ValueError: If ip_addresses is empty
+        """
+        if not ip_addresses:
+            raise ValueError(
+                "The provided IPs array is invalid. It should be a non-empty array of strings."
+            )
+        items = self.client.stream_items("POST", "/ip", data=ip_addresses)
+        return (
+            IpInfoError.from_dict(item) if "errorMessage" in item else IpInfo.from_dict(item)
+            for item in items
+        )
+
+    def submit_get_ip_info(self, ip_address: str) -> "Future[IpInfo | IpInfoError]":
+        """
+        Get geolocation information for a single IP address in the client's thread pool.
+
+        Args:
+            ip_address: IP address to look up
+
+        Returns:
+            Future for the IpInfo or IpInfoError
+
+        Raises:
+            ExecutorQueueFullError: If too many submitted calls are unfinished
+        """
+        return self.client.executor.submit(self.get_ip_info, ip_address)
+
+    def map_get_ip_info(self, ip_addresses: Iterable[str]) -> Iterator[IpInfo | IpInfoError]:
+        """
+        Get geolocation information for many IP addresses with concurrent single lookups.
+
+        Args:
+            ip_addresses: IP addresses to look up
+
+        Returns:
+            Iterator of IpInfo or IpInfoError, in the order of ip_addresses
+        """
+        return self.client.executor.map(self.get_ip_info, ip_addresses)
+
+    def submit_get_ip_infos(self, ip_addresses: list[str]) -> "Future[list[IpInfo | IpInfoError]]":
+        """
+        Get geolocation information for multiple IP addresses in the client's thread pool.
+
+        Args:
+            ip_addresses: List of IP addresses to look up
+
+        Returns:
+            Future for the list of IpInfo or IpInfoError objects
+
+        Raises:
+            ExecutorQueueFullError: If too many submitted calls are unfinished
+        """
+        return self.client.executor.submit(self.get_ip_infos, ip_addresses)
@@ -0,0 +1,81 @@
+"""Auto-pagination with prefetching for Hyphen SDK listings."""
+
+import math
+from collections import deque
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import Future
+from typing import Any, Protocol, TypeVar
+
+
+class Page(Protocol):
+    """A page of a paginated listing, such as ShortCodesResponse."""
+
+    @property
+    def total(self) -> int: ...
+
+    @property
+    def page_size(self) -> int: ...
+
+    @property
+    def data(self) -> Sequence[Any]: ...
+
+
+P = TypeVar("P", bound=Page)
+
+
+def iter_pages(
+    fetch: Callable[[int], P],
+    submit: Callable[[Callable[[int], P], int], "Future[P]"],
+    prefetch_pages: int = 1,
+    first_page: int = 1,
+) -> Generator[P, None, None]:
+    """
+    Walk the pages of a listing, fetching the next pages while one is consumed.
+
+    Pages are only prefetched once the first page's total shows they exist,
+    and at most ``prefetch_pages + 1`` pages are held at once: the page being
+    consumed and those fetched ahead. Pages still being prefetched when the
+    iterator is closed are cancelled if they have not started.
+
+    Args:
+        fetch: Function fetching a page by number.
+        submit: Function running fetch for a page number in the background,
+            e.g. an executor's submit.
+        prefetch_pages: Number of pages fetched ahead. 0 fetches sequentially.
+        first_page: Number of the first page.
+
+    Yields:
+        Each page, in order, until an empty or last page.
+    """
+    if prefetch_pages < 0:
+        raise ValueError("prefetch_pages must not be negative.")
+    pending: deque[Future[P]] = deque()
+    number = first_page
+    next_number = first_page + 1
+    last_page: int | None = None
+    page = fetch(first_page)
+    try:
+        while True:
+            if last_page is None and page.page_size > 0:
+                last_page = first_page - 1 + math.ceil(page.total / page.page_size)
+            has_more = bool(page.data) and (last_page is None or number < last_page)
+            while (
+                has_more
+                and len(pending) < prefetch_pages
+                and (last_page is None or next_number <= last_page)
+            ):
+                pending.append(submit(fetch, next_number))
+                next_number += 1
+
+            yield page
+            if not has_more:
+                return
+            number += 1
+            if pending:
+                page = pending.popleft().result()
+            else:
+                page = fetch(number)
+                next_number = number + 1
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,246 @@
+"""Client-side rate limiting for Hyphen SDK."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+
+from hyphen.exceptions import RateLimitExceededError
+
+# Reset values above this are absolute epoch timestamps rather than delays
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens are added continuously at ``rate`` per second up to ``capacity``.
+    Each request takes one token. The bucket can also be paused until a
+    point in time, e.g. when the server asks clients to back off.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Initialize a full token bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens, i.e. the allowed burst.
+                Defaults to one second worth of tokens (at least 1).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update. Requires the lock."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, otherwise the number of seconds until
+            one is expected to be available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def limit_tokens(self, remaining: float) -> None:
+        """Lower the available tokens to what the server reports as remaining."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, remaining)
+
+
+@dataclass
+class RateLimitRule:
+    """Rate limit for the endpoints matching a pattern.
+
+    Attributes:
+        pattern: Glob pattern matched against the endpoint path, e.g.
+            "/api/organizations/*/link/codes/*/stats".
+        rate: Requests allowed per second.
+        burst: Maximum number of requests sent back to back. Defaults to
+            one second worth of requests.
+    """
+
+    pattern: str
+    rate: float
+    burst: float | None = None
+
+
+class RateLimiter:
+    """Token-bucket rate limiter for one service and its endpoints.
+
+    Every request takes a token from the service-wide bucket (if a rate is
+    set) and from the bucket of the first rule matching its endpoint.
+    Rate-limit headers returned by the API (Retry-After, X-RateLimit-Remaining
+    and X-RateLimit-Reset) adjust the buckets so the client backs off.
+    A limiter can be shared by several clients to pace them together.
+
+    Example:
+        >>> from hyphen import Link, RateLimiter, RateLimitRule
+        >>> limiter = RateLimiter(
+        ...     rate=20,
+        ...     rules=[RateLimitRule("/api/organizations/*/link/codes/*/stats", rate=2)],
+        ... )
+        >>> link = Link(organization_id="org_id", api_key="key", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        rules: list[RateLimitRule] | None = None,
+        block: bool = True,
+        max_wait: float | None = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Requests per second allowed for the whole service. Unlimited
+                if not provided.
+            burst: Maximum number of service requests sent back to back.
+            rules: Per-endpoint limits. The first matching rule applies.
+            block: Whether to wait for a token. If False, requests that would
+                have to wait raise RateLimitExceededError immediately.
+            max_wait: Maximum seconds to wait for a token before raising
+                RateLimitExceededError. Waits indefinitely if not provided.
+        """
+        self.block = block
+        self.max_wait = max_wait
+        self._service_bucket = TokenBucket(rate, burst) if rate is not None else None
+        self._rules = [(rule, TokenBucket(rule.rate, rule.burst)) for rule in rules or []]
+
+    def _buckets(self, endpoint: str) -> list[TokenBucket]:
+        """Get the buckets a request to the endpoint takes tokens from."""
+        buckets = [self._service_bucket] if self._service_bucket is not None else []
+        for rule, bucket in self._rules:
+            if fnmatchcase(endpoint, rule.pattern):
+                buckets.append(bucket)
+                break
+        return buckets
+
+    def _next_wait(self, endpoint: str, bucket: TokenBucket, waited: float) -> float:
+        """Get how long to wait for a bucket, raising if the policy forbids it."""
+        wait = bucket.try_acquire()
+        if wait <= 0:
+            return 0.0
+        if not self.block or (self.max_wait is not None and waited + wait > self.max_wait):
+            raise RateLimitExceededError(endpoint, wait)
+        return wait
+
+    def acquire(self, endpoint: str) -> float:
+        """
+        Take the tokens for a request, blocking the calling thread if needed.
+
+        Args:
+            endpoint: API endpoint path of the request.
+
+        Returns:
+            Seconds spent waiting for tokens.
+
+        Raises:
+            RateLimitExceededError: If no token is available within the policy.
+        """
+        waited = 0.0
+        for bucket in self._buckets(endpoint):
+            while wait := self._next_wait(endpoint, bucket, waited):
+                time.sleep(wait)
+                waited += wait
+        return waited
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """
+        Take the tokens for a request without blocking the event loop.
+
+        Args:
+            endpoint: API endpoint path of the request.
+
+        Returns:
+            Seconds spent waiting for tokens.
+
+        Raises:
+            RateLimitExceededError: If no token is available within the policy.
+        """
+        waited = 0.0
+        for bucket in self._buckets(endpoint):
+            while wait := self._next_wait(endpoint, bucket, waited):
+                await asyncio.sleep(wait)
+                waited += wait
+        return waited
+
+    def update_from_response(
+        self, endpoint: str, status_code: int, headers: Mapping[str, str]
+    ) -> None:
+        """
+        Adapt the buckets to the rate-limit information returned by the API.
+
+        Args:
+            endpoint: API endpoint path of the request.
+            status_code: HTTP status code of the response.
+            headers: Response headers.
+        """
+        buckets = self._buckets(endpoint)
+        if status_code == 429:
+            retry_after = _parse_seconds(headers.get("Retry-After"))
+            for bucket in buckets:
+                bucket.pause(retry_after if retry_after is not None else 1 / bucket.rate)
+
+        remaining = _parse_float(
+            headers.get("X-RateLimit-Remaining") or headers.get("RateLimit-Remaining")
+        )
+        if remaining is None:
+            return
+        for bucket in buckets:
+            bucket.limit_tokens(remaining)
+        if remaining < 1:
+            reset = _parse_seconds(
+                headers.get("X-RateLimit-Reset") or headers.get("RateLimit-Reset")
+            )
+            if reset is not None:
+                for bucket in buckets:
+                    bucket.pause(reset)
+
+
+def _parse_float(value: object) -> float | None:
+    """Parse a numeric header value, returning None if it is missing or invalid."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_seconds(value: object) -> float | None:
+    """Parse a delay header given in seconds or as an epoch timestamp."""
+    seconds = _parse_float(value)
+    if seconds is None:
+        return None
+    if seconds > _EPOCH_THRESHOLD:
+        seconds -= time.time()
+    return max(seconds, 0.0)
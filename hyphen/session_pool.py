@@ -0,0 +1,182 @@
+"""Fork-safe and thread-safe management of HTTP sessions for Hyphen SDK."""
+
+import itertools
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Protocol
+
+import requests
+
+SESSION_MODES = ("shared", "thread_local", "sharded")
+
+
+class _ForkAware(Protocol):
+    def _after_fork(self) -> None: ...
+
+
+# Objects whose connections are rebuilt in child processes after a fork
+_fork_aware: "weakref.WeakSet[_ForkAware]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    """Drop the connections inherited from the parent process."""
+    for obj in list(_fork_aware):
+        obj._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def register_fork_aware(obj: _ForkAware) -> None:
+    """Have obj._after_fork() called in child processes forked after this call."""
+    _fork_aware.add(obj)
+
+
+class _ThreadSession:
+    """A thread's session, finalized when the thread ends and drops it."""
+
+    __slots__ = ("session", "__weakref__")
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+
+def _release_session(pool_ref: "weakref.ref[SessionPool]", session: requests.Session) -> None:
+    """Close the session of a thread that ended, unless its pool is gone."""
+    pool = pool_ref()
+    if pool is not None:
+        pool._release(session)
+
+
+class SessionPool:
+    """Hands out requests sessions to threads.
+
+    Modes:
+        shared: One session is used by every thread.
+        thread_local: Each thread gets its own session, closed when the
+            thread ends.
+        sharded: Threads are spread round-robin over a fixed number of sessions.
+
+    Sessions inherited across ``os.fork()`` are never reused: the child process
+    starts with fresh sessions, so parent and child never share sockets.
+    Inherited sessions are dropped without being closed, which would otherwise
+    tear down connections still in use by the parent.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], requests.Session],
+        mode: str = "shared",
+        shards: int = 4,
+    ):
+        """
+        Initialize the session pool.
+
+        Args:
+            factory: Function creating a configured session.
+            mode: Session sharing mode: "shared", "thread_local" or "sharded".
+            shards: Number of sessions in "sharded" mode.
+        """
+        if mode not in SESSION_MODES:
+            raise ValueError(
+                f"Unsupported session mode {mode!r}. Expected one of: {', '.join(SESSION_MODES)}."
+            )
+        if shards < 1:
+            raise ValueError("shards must be at least 1.")
+        self.factory = factory
+        self.mode = mode
+        self.shards = shards
+        self._init_state()
+        register_fork_aware(self)
+
+    def _init_state(self) -> None:
+        """Reset the pool to hold no sessions."""
+        # Reentrant, as dropping thread-local sessions under the lock runs
+        # their finalizers, which take it again
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._shared: requests.Session | None = None
+        self._shard_counter = itertools.count()
+
+    def _after_fork(self) -> None:
+        """Forget the parent's sessions in a forked child process."""
+        self._init_state()
+
+    def _new_session(self) -> requests.Session:
+        """Create a session and track it for close(). Requires the lock."""
+        session = self.factory()
+        self._sessions.append(session)
+        return session
+
+    def get(self) -> requests.Session:
+        """Get the session the calling thread should use."""
+        if self.mode == "shared":
+            session = self._shared
+            if session is None:
+                with self._lock:
+                    if self._shared is None:
+                        self._shared = self._new_session()
+                    session = self._shared
+            return session
+
+        if self.mode == "thread_local":
+            holder = getattr(self._local, "holder", None)
+            if holder is None:
+                with self._lock:
+                    session = self._new_session()
+                holder = _ThreadSession(session)
+                # The thread's locals are dropped when it ends, finalizing the holder
+                weakref.finalize(holder, _release_session, weakref.ref(self), session)
+                self._local.holder = holder
+            return holder.session
+
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = next(self._shard_counter) % self.shards
+        sessions = self._sessions
+        if shard < len(sessions):
+            return sessions[shard]
+        with self._lock:
+            while len(self._sessions) <= shard:
+                self._new_session()
+            return self._sessions[shard]
+
+    def serving_sessions(self) -> list[requests.Session]:
+        """
+        Get the sessions that can serve the calling thread, creating them if needed.
+
+        Returns:
+            Every shard in "sharded" mode, otherwise the calling thread's session.
+        """
+        if self.mode != "sharded":
+            return [self.get()]
+        with self._lock:
+            while len(self._sessions) < self.shards:
+                self._new_session()
+            return list(self._sessions)
+
+    def sessions(self) -> list[requests.Session]:
+        """Get every session created by the pool in this process."""
+        with self._lock:
+            return list(self._sessions)
+
+    def _release(self, session: requests.Session) -> None:
+        """Close a thread's session, unless close() or a fork already dropped it."""
+        with self._lock:
+            if not any(tracked is session for tracked in self._sessions):
+                return
+            self._sessions = [tracked for tracked in self._sessions if tracked is not session]
+        session.close()
+
+    def close(self) -> None:
+        """Close every session created by the pool in this process."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+            self._shared = None
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
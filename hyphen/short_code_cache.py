@@ -0,0 +1,112 @@
+"""In-process cache of short codes for Hyphen SDK."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from hyphen.types import ShortCode
+
+ShortCodeKey = tuple[str, str]
+
+
+@dataclass
+class _Entry:
+    """A cached short code and when it stops being served."""
+
+    short_code: ShortCode
+    expires_at: float
+
+
+class ShortCodeCache:
+    """Bounded, thread-safe cache of ShortCode objects keyed by code.
+
+    A Link client with a cache answers ``get_short_code`` from it without any
+    request while the entry is younger than ``ttl`` seconds. Short codes
+    created or updated through the client are written to the cache and
+    deleted ones are removed, so its own writes are seen immediately; changes
+    made elsewhere are seen once entries expire. The least recently used
+    entries are evicted beyond ``max_entries``. A cache can be shared by
+    several clients, entries being scoped to the organization.
+
+    Cached objects are shared between callers and must not be modified.
+
+    Example:
+        >>> from hyphen import Link, ShortCodeCache
+        >>> cache = ShortCodeCache(max_entries=10_000, ttl=30)
+        >>> link = Link(organization_id="org", api_key="key", short_code_cache=cache)
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of short codes kept.
+            ttl: Seconds a short code is served from the cache.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ShortCodeKey, _Entry] = OrderedDict()
+
+    def get(self, organization_id: str, code: str) -> ShortCode | None:
+        """
+        Get a short code, marking it as recently used.
+
+        Args:
+            organization_id: Organization owning the short code.
+            code: The code identifier of the short code.
+
+        Returns:
+            The cached ShortCode, or None if it is missing or expired.
+        """
+        key = (organization_id, code)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry.expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.short_code
+
+    def put(self, organization_id: str, short_code: ShortCode) -> int:
+        """
+        Store a short code, evicting the least recently used ones beyond max_entries.
+
+        Args:
+            organization_id: Organization owning the short code.
+            short_code: The short code to store, keyed by its code.
+
+        Returns:
+            Number of entries evicted.
+        """
+        key = (organization_id, short_code.code)
+        with self._lock:
+            self._entries[key] = _Entry(short_code, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def discard(self, organization_id: str, code: str) -> None:
+        """Remove a short code if present."""
+        with self._lock:
+            self._entries.pop((organization_id, code), None)
+
+    def clear(self) -> None:
+        """Remove every short code."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
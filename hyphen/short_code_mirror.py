@@ -0,0 +1,307 @@
+"""Local SQLite mirror of an organization's short codes for Hyphen SDK."""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from hyphen.link import Link
+from hyphen.types import ShortCode
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS short_codes (
+    id TEXT PRIMARY KEY,
+    code TEXT NOT NULL,
+    long_url TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    title TEXT,
+    tags TEXT,
+    organization TEXT,
+    sync_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS short_codes_code ON short_codes (code);
+CREATE INDEX IF NOT EXISTS short_codes_title ON short_codes (title);
+CREATE INDEX IF NOT EXISTS short_codes_domain ON short_codes (domain);
+CREATE INDEX IF NOT EXISTS short_codes_long_url ON short_codes (long_url);
+CREATE INDEX IF NOT EXISTS short_codes_created_at ON short_codes (created_at);
+CREATE TABLE IF NOT EXISTS short_code_tags (
+    tag TEXT NOT NULL,
+    short_code_id TEXT NOT NULL REFERENCES short_codes (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, short_code_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS short_code_tags_short_code ON short_code_tags (short_code_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_COLUMNS = "id, code, long_url, domain, created_at, title, tags, organization"
+
+
+@dataclass
+class MirrorSyncResult:
+    """Outcome of a mirror sync.
+
+    Attributes:
+        fetched: Number of short codes fetched and stored.
+        removed: Number of short codes removed because the API no longer lists
+            them. Only full syncs remove short codes.
+        watermark: Creation timestamp of the newest mirrored short code.
+    """
+
+    fetched: int
+    removed: int
+    watermark: str | None
+
+
+class ShortCodeMirror:
+    """SQLite copy of an organization's short codes, kept up to date by syncs.
+
+    A sync walks the short code listing with prefetching and upserts every
+    short code. Incremental syncs rely on the listing being ordered newest
+    first: they stop after the first page reaching short codes created before
+    the newest one mirrored so far (the watermark). If the listing turns out to
+    be oldest first, the sync walks every page instead. Full syncs also remove
+    the short codes the API no longer lists, such as deleted ones.
+
+    Queries by code, title, tag, domain and long URL use indexes and return
+    ShortCode objects without any request. They can run during a sync, and
+    see the pages stored so far.
+
+    Example:
+        >>> from hyphen import Link, ShortCodeMirror
+        >>> mirror = ShortCodeMirror(Link(organization_id="org", api_key="key"), "codes.db")
+        >>> mirror.sync()
+        >>> campaign = mirror.find(tag="campaign", domain="h4n.link")
+    """
+
+    def __init__(
+        self,
+        link: Link,
+        path: str | os.PathLike[str] = ":memory:",
+        page_size: int = 500,
+        prefetch_pages: int = 1,
+    ):
+        """
+        Open the mirror, creating its tables if needed.
+
+        Args:
+            link: Client of the organization to mirror.
+            path: SQLite database file. Defaults to an in-memory database.
+            page_size: Number of short codes requested per page.
+            prefetch_pages: Number of pages fetched ahead during syncs.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
+        self.link = link
+        self.page_size = page_size
+        self.prefetch_pages = prefetch_pages
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    @property
+    def watermark(self) -> str | None:
+        """Creation timestamp of the newest mirrored short code, if any."""
+        with self._lock:
+            return self._get_state("watermark")
+
+    def sync(self, full: bool = False) -> MirrorSyncResult:
+        """
+        Fetch new short codes from the API into the mirror.
+
+        Args:
+            full: Whether to walk the whole listing and remove the short codes
+                it no longer contains, rather than stopping at the watermark.
+
+        Returns:
+            The number of short codes fetched and removed, and the new watermark.
+
+        Raises:
+            requests.HTTPError: If a request fails
+        """
+        # Syncs run one at a time, but queries only wait for the database
+        # writes of each page, not for the requests
+        with self._sync_lock:
+            with self._lock, self._connection:
+                watermark = None if full else self._get_state("watermark")
+                sync_id = int(self._get_state("sync_id") or 0) + 1
+                # Claimed before storing any page, so rows of a sync that fails
+                # are never mistaken for rows of the next one
+                self._set_state("sync_id", str(sync_id))
+                newest = self._get_state("watermark")
+            fetched = 0
+            previous: str | None = None
+            descending = True
+            pages = self.link.iter_short_code_pages(
+                page_size=self.page_size, prefetch_pages=self.prefetch_pages
+            )
+            try:
+                for page in pages:
+                    with self._lock, self._connection:
+                        self._upsert(page.data, sync_id)
+                    fetched += len(page.data)
+                    for short_code in page.data:
+                        if previous is not None and short_code.created_at > previous:
+                            descending = False
+                        previous = short_code.created_at
+                        if newest is None or short_code.created_at > newest:
+                            newest = short_code.created_at
+                    if watermark is not None and descending and previous is not None:
+                        if previous < watermark:
+                            break
+            finally:
+                pages.close()
+
+            removed = 0
+            with self._lock, self._connection:
+                if full:
+                    cursor = self._connection.execute(
+                        "DELETE FROM short_codes WHERE sync_id != ?", (sync_id,)
+                    )
+                    removed = cursor.rowcount
+                if newest is not None:
+                    self._set_state("watermark", newest)
+            return MirrorSyncResult(fetched=fetched, removed=removed, watermark=newest)
+
+    def get(self, code: str) -> ShortCode | None:
+        """
+        Get a mirrored short code by its code.
+
+        Args:
+            code: The code identifier for the short code
+
+        Returns:
+            The ShortCode, or None if it is not mirrored
+        """
+        found = self._query(f"SELECT {_COLUMNS} FROM short_codes WHERE code = ?", [code])
+        return found[0] if found else None
+
+    def find(
+        self,
+        title: str | None = None,
+        tag: str | None = None,
+        domain: str | None = None,
+        long_url: str | None = None,
+        limit: int | None = None,
+    ) -> list[ShortCode]:
+        """
+        Find the mirrored short codes matching every given criterion.
+
+        Args:
+            title: Exact title of the short codes
+            tag: Tag the short codes have
+            domain: Domain of the short codes
+            long_url: Exact URL the short codes redirect to
+            limit: Maximum number of short codes returned
+
+        Returns:
+            The matching ShortCodes, newest first
+        """
+        conditions = []
+        args: list[Any] = []
+        for column, value in (("title", title), ("domain", domain), ("long_url", long_url)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                args.append(value)
+        if tag is not None:
+            conditions.append(
+                "id IN (SELECT short_code_id FROM short_code_tags WHERE tag = ?)"
+            )
+            args.append(tag)
+        sql = f"SELECT {_COLUMNS} FROM short_codes"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY created_at DESC, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+        return self._query(sql, args)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM short_codes").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def _upsert(self, short_codes: list[ShortCode], sync_id: int) -> None:
+        """Store short codes and their tags. Requires the lock and a transaction."""
+        rows = [
+            (
+                short_code.id,
+                short_code.code,
+                short_code.long_url,
+                short_code.domain,
+                short_code.created_at,
+                short_code.title,
+                json.dumps(short_code.tags) if short_code.tags is not None else None,
+                json.dumps(short_code.organization_id)
+                if short_code.organization_id is not None
+                else None,
+                sync_id,
+            )
+            for short_code in short_codes
+        ]
+        self._connection.executemany(
+            f"INSERT INTO short_codes ({_COLUMNS}, sync_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET code = excluded.code, "
+            "long_url = excluded.long_url, domain = excluded.domain, "
+            "created_at = excluded.created_at, title = excluded.title, "
+            "tags = excluded.tags, organization = excluded.organization, "
+            "sync_id = excluded.sync_id",
+            rows,
+        )
+        self._connection.executemany(
+            "DELETE FROM short_code_tags WHERE short_code_id = ?",
+            [(short_code.id,) for short_code in short_codes],
+        )
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO short_code_tags (tag, short_code_id) VALUES (?, ?)",
+            [
+                (tag, short_code.id)
+                for short_code in short_codes
+                for tag in short_code.tags or []
+            ],
+        )
+
+    def _query(self, sql: str, args: list[Any]) -> list[ShortCode]:
+        """Run a query selecting _COLUMNS and build ShortCodes from the rows."""
+        with self._lock:
+            rows = self._connection.execute(sql, args).fetchall()
+        return [
+            ShortCode(
+                id=row[0],
+                code=row[1],
+                long_url=row[2],
+                domain=row[3],
+                created_at=row[4],
+                title=row[5],
+                tags=json.loads(row[6]) if row[6] is not None else None,
+                organization_id=json.loads(row[7]) if row[7] is not None else None,
+            )
+            for row in rows
+        ]
+
+    def _get_state(self, name: str) -> str | None:
+        """Read a sync state value. Requires the lock."""
+        row = self._connection.execute(
+            "SELECT value FROM sync_state WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, name: str, value: str) -> None:
+        """Write a sync state value. Requires the lock and a transaction."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO sync_state (name, value) VALUES (?, ?)", (name, value)
+        )
@@ -0,0 +1,79 @@
+"""Coalescing of identical in-flight calls for Hyphen SDK."""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from hyphen.metrics import Metrics
+
+
+class _Call:
+    """An in-flight call and the outcome shared with its waiters."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Ensures only one call per key is in flight at a time.
+
+    Callers arriving while a call with the same key is running wait for it
+    and receive the same result, or the same exception, instead of making
+    their own call. Shared results must be treated as read-only.
+
+    Metrics recorded:
+        singleflight.calls: Calls made on behalf of one or more callers.
+        singleflight.coalesced: Callers served by another caller's call.
+    """
+
+    def __init__(self, metrics: Metrics | None = None):
+        """
+        Initialize the call group.
+
+        Args:
+            metrics: Metrics registry to record coalescing statistics in.
+        """
+        self.metrics = metrics or Metrics()
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Identity of the call.
+            fn: Function making the call.
+
+        Returns:
+            The result of the call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.metrics.increment("singleflight.coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        self.metrics.increment("singleflight.calls")
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,176 @@
+"""Bulk short code statistics: window merging and NDJSON/CSV export for Hyphen SDK."""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from typing import IO, Any
+
+StatsRow = tuple[str, dict[str, Any]]
+
+
+def split_date_range(
+    start: datetime, end: datetime, window: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """
+    Split a date range into consecutive windows.
+
+    Stats dates are sent with second precision and both bounds included, so
+    each window ends one second before the next one starts.
+
+    Args:
+        start: Start of the range.
+        end: End of the range.
+        window: Length of each window. The last window may be shorter.
+
+    Returns:
+        (start, end) of each window, in order.
+
+    Raises:
+        ValueError: If window is shorter than a second or end is before start.
+    """
+    if window < timedelta(seconds=1):
+        raise ValueError("window must be at least one second.")
+    if end < start:
+        raise ValueError("end must not be before start.")
+    windows = []
+    window_start = start
+    while window_start + window <= end:
+        next_start = window_start + window
+        windows.append((window_start, next_start - timedelta(seconds=1)))
+        window_start = next_start
+    if window_start <= end:
+        windows.append((window_start, end))
+    return windows
+
+
+def merge_stats(parts: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Merge the statistics of consecutive windows of one short code.
+
+    Numbers are summed and objects are merged member by member. Lists, such
+    as daily series or browser breakdowns, are combined by entry: entries of
+    objects with the same non-numeric members (e.g. the same date or name)
+    have their numbers summed, other entries are appended. Other values are
+    taken from the last window.
+
+    Counts of unique visitors summed across windows are upper bounds, as a
+    visitor may be counted in several windows.
+
+    Args:
+        parts: Statistics of each window.
+
+    Returns:
+        The merged statistics.
+    """
+    merged: dict[str, Any] = {}
+    for part in parts:
+        merged = _merge(merged, part)
+    return merged
+
+
+def _merge(left: Any, right: Any) -> Any:
+    """Merge two statistics values."""
+    if _is_number(left) and _is_number(right):
+        return left + right
+    if isinstance(left, dict) and isinstance(right, dict):
+        merged = dict(left)
+        for key, value in right.items():
+            merged[key] = _merge(merged[key], value) if key in merged else value
+        return merged
+    if isinstance(left, list) and isinstance(right, list):
+        merged_list = list(left)
+        positions: dict[tuple[tuple[str, str], ...], int] = {}
+        for index, item in enumerate(merged_list):
+            identity = _identity(item)
+            if identity is not None:
+                positions.setdefault(identity, index)
+        for item in right:
+            identity = _identity(item)
+            if identity is not None and identity in positions:
+                index = positions[identity]
+                merged_list[index] = _merge(merged_list[index], item)
+                continue
+            if identity is not None:
+                positions[identity] = len(merged_list)
+            merged_list.append(item)
+        return merged_list
+    return right
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _identity(item: Any) -> tuple[tuple[str, str], ...] | None:
+    """Get what identifies a list entry across windows, or None if nothing does."""
+    if not isinstance(item, dict):
+        return None
+    identity = tuple(
+        sorted((key, str(value)) for key, value in item.items() if not _is_number(value))
+    )
+    return identity or None
+
+
+def write_ndjson(rows: Iterable[StatsRow], file: IO[str]) -> int:
+    """
+    Write statistics as newline-delimited JSON, one object per short code.
+
+    Each line holds a "code" member followed by the statistics. Rows are
+    written as they are produced, so memory use does not grow with the rows.
+
+    Args:
+        rows: (code, stats) pairs, e.g. from Link.iter_short_code_stats.
+        file: Text file to write to.
+
+    Returns:
+        Number of rows written.
+    """
+    count = 0
+    for code, stats in rows:
+        file.write(json.dumps({"code": code, **stats}, default=str))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(rows: Iterable[StatsRow], file: IO[str], columns: Sequence[str] | None = None) -> int:
+    """
+    Write statistics as CSV, one row per short code.
+
+    Nested objects are flattened into dotted columns (e.g. "clicks.total")
+    and lists are written as JSON. Rows are written as they are produced, so
+    memory use does not grow with the rows.
+
+    Args:
+        rows: (code, stats) pairs, e.g. from Link.iter_short_code_stats.
+        file: Text file to write to, opened with newline="".
+        columns: Columns written after "code". Defaults to the columns of the
+            first row; members missing from it are not written.
+
+    Returns:
+        Number of rows written.
+    """
+    writer: csv.DictWriter[str] | None = None
+    count = 0
+    for code, stats in rows:
+        flat = dict(_flatten(stats))
+        if writer is None:
+            fieldnames = ["code", *(columns if columns is not None else flat)]
+            writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+        writer.writerow({"code": code, **flat})
+        count += 1
+    return count
+
+
+def _flatten(value: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """Flatten nested objects into dotted keys, encoding lists as JSON."""
+    for key, item in value.items():
+        name = f"{prefix}{key}"
+        if isinstance(item, dict):
+            yield from _flatten(item, f"{name}.")
+        elif isinstance(item, list):
+            yield name, json.dumps(item, default=str)
+        else:
+            yield name, item
@@ -0,0 +1,222 @@
+"""Incremental parsing of large JSON list responses for Hyphen SDK."""
+
+import re
+from typing import Any
+
+from hyphen.codec import JsonCodec, default_codec
+
+# Characters that change the parser state outside of strings
+_STRUCTURAL = re.compile(rb'[\[\]{},:"]')
+# Characters that end or escape inside of strings
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+class JsonArrayParser:
+    """Parses the elements of a JSON array incrementally, as bytes arrive.
+
+    Only the bytes of the element being parsed are kept in memory, so a large
+    list response can be converted into objects one element at a time instead
+    of being decoded as a whole. Each complete element is decoded with the
+    codec. Other members of the enclosing object, such as pagination totals,
+    are decoded into ``fields``.
+
+    Example:
+        >>> parser = JsonArrayParser("data")
+        >>> parser.feed(b'{"total": 2, "data": [{"id": 1}, {"i')
+        [{'id': 1}]
+        >>> parser.feed(b'd": 2}]}')
+        [{'id': 2}]
+        >>> parser.close()
+        >>> parser.fields
+        {'total': 2}
+    """
+
+    def __init__(self, key: str | None = "data", codec: JsonCodec | None = None):
+        """
+        Initialize the parser.
+
+        Args:
+            key: Member of the top-level object holding the array, or None if
+                the top-level value is the array itself.
+            codec: Codec decoding each element. Defaults to the fastest
+                installed codec.
+        """
+        self.key = key
+        self.codec = codec or default_codec()
+        self.fields: dict[str, Any] = {}
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._done = False
+        # Position where the current top-level key, member value or element starts
+        self._key_start: int | None = None
+        self._member_key: str | None = None
+        self._member_start: int | None = None
+        self._array_depth: int | None = None
+        self._element_start: int | None = None
+        self._array_found = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Parse the next chunk of the document.
+
+        Args:
+            chunk: Next bytes of the JSON document.
+
+        Returns:
+            The array elements completed by this chunk, decoded.
+
+        Raises:
+            ValueError: If the document is not valid JSON of the expected shape.
+        """
+        if self._done:
+            if chunk.strip():
+                raise ValueError("Unexpected data after the end of the JSON document.")
+            return []
+        self._buffer.extend(chunk)
+        items: list[Any] = []
+        buffer = self._buffer
+        pos = self._pos
+        while not self._done:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == b"\\":
+                    if match.end() >= len(buffer):
+                        # The escaped character has not arrived yet
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                if self._key_start is not None:
+                    self._member_key = self.codec.loads(bytes(buffer[self._key_start : pos]))
+                    self._key_start = None
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            index = match.start()
+            pos = match.end()
+            self._structural(buffer[index], index, items)
+        self._pos = pos
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """
+        Check that the whole document was parsed.
+
+        Raises:
+            ValueError: If the document ended early or had no array.
+        """
+        if not self._done:
+            raise ValueError("Incomplete JSON document.")
+        if not self._array_found:
+            raise ValueError(f"JSON document has no {self.key!r} array.")
+
+    def _structural(self, char: int, index: int, items: list[Any]) -> None:
+        """Update the parser state for a structural character."""
+        depth = self._depth
+        if char == ord('"'):
+            self._in_string = True
+            if depth == 1 and self.key is not None and self._member_start is None:
+                self._key_start = index
+            return
+
+        if char == ord("[") or char == ord("{"):
+            if depth == 0 and (char == ord("{")) != (self.key is None):
+                self._depth = 1
+                if self.key is None:
+                    self._open_array(index)
+                return
+            if depth == 0:
+                raise ValueError("Unexpected top-level JSON value.")
+            if (
+                depth == 1
+                and char == ord("[")
+                and self._member_key == self.key
+                and self._member_start is not None
+                and not self._buffer[self._member_start : index].strip()
+            ):
+                self._depth = 2
+                self._open_array(index)
+                return
+            self._depth += 1
+            return
+
+        if char == ord("]") or char == ord("}"):
+            if self._array_depth is not None and depth == self._array_depth:
+                self._emit_element(index, items)
+                self._array_depth = None
+                self._element_start = None
+                self._member_key = None
+            elif depth == 1 and self.key is not None:
+                self._end_member(index)
+            self._depth -= 1
+            if self._depth == 0:
+                self._done = True
+            elif self._depth < 0:
+                raise ValueError("Unbalanced JSON document.")
+            return
+
+        if char == ord(","):
+            if self._array_depth is not None and depth == self._array_depth:
+                self._emit_element(index, items)
+                self._element_start = index + 1
+            elif depth == 1 and self.key is not None:
+                self._end_member(index)
+            return
+
+        if char == ord(":") and depth == 1 and self.key is not None:
+            self._member_start = index + 1
+
+    def _open_array(self, index: int) -> None:
+        """Start collecting the elements of the target array."""
+        self._array_found = True
+        self._array_depth = self._depth
+        self._element_start = index + 1
+        self._member_start = None
+
+    def _emit_element(self, end: int, items: list[Any]) -> None:
+        """Decode the element ending at end, if any."""
+        assert self._element_start is not None
+        element = bytes(self._buffer[self._element_start : end]).strip()
+        if element:
+            items.append(self.codec.loads(element))
+        elif self._buffer[end] == ord(","):
+            raise ValueError("Empty element in JSON array.")
+
+    def _end_member(self, end: int) -> None:
+        """Decode a top-level member other than the target array."""
+        if self._member_key is not None and self._member_start is not None:
+            self.fields[self._member_key] = self.codec.loads(
+                bytes(self._buffer[self._member_start : end])
+            )
+        self._member_key = None
+        self._member_start = None
+
+    def _compact(self) -> None:
+        """Drop the parsed bytes that are no longer needed."""
+        starts = [
+            start
+            for start in (self._key_start, self._member_start, self._element_start)
+            if start is not None
+        ]
+        keep = min(starts, default=self._pos)
+        if keep == 0:
+            return
+        del self._buffer[:keep]
+        self._pos -= keep
+        if self._key_start is not None:
+            self._key_start -= keep
+        if self._member_start is not None:
+            self._member_start -= keep
+        if self._element_start is not None:
+            self._element_start -= keep
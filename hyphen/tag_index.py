@@ -0,0 +1,257 @@
+"""In-memory inverted index of short code tags for Hyphen SDK."""
+
+import threading
+from collections.abc import Iterable
+from typing import cast
+
+from hyphen.link import Link
+from hyphen.types import ShortCode
+
+
+class _State:
+    """Codes, their integer ids and the tag bitmaps over those ids."""
+
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+        self.codes: list[str | None] = []
+        self.free_ids: list[int] = []
+        self.code_tags: dict[str, frozenset[str]] = {}
+        # Bit i of a bitmap is set if the code with id i is in the set
+        self.bitmaps: dict[str, int] = {}
+        self.all = 0
+
+    @classmethod
+    def build(cls, entries: Iterable[tuple[str, Iterable[str]]]) -> "_State":
+        """
+        Index codes with their tags, the last entry of a code winning.
+
+        Each bitmap is built once from the ids carrying its tag: ORing bits into
+        immutable integers one code at a time would copy them for every code.
+        """
+        state = cls()
+        for code, tags in entries:
+            state.code_tags[code] = frozenset(tags)
+        ids_by_tag: dict[str, list[int]] = {}
+        for code_id, (code, tags) in enumerate(state.code_tags.items()):
+            state.ids[code] = code_id
+            state.codes.append(code)
+            for tag in tags:
+                ids_by_tag.setdefault(tag, []).append(code_id)
+        size = (len(state.codes) + 7) // 8
+        for tag, ids in ids_by_tag.items():
+            bits = bytearray(size)
+            for code_id in ids:
+                bits[code_id >> 3] |= 1 << (code_id & 7)
+            state.bitmaps[tag] = int.from_bytes(bits, "little")
+        state.all = (1 << len(state.codes)) - 1
+        return state
+
+    def add(self, code: str, tags: Iterable[str]) -> None:
+        """Index a code with its tags, replacing the tags it had."""
+        self.remove(code)
+        if self.free_ids:
+            code_id = self.free_ids.pop()
+            self.codes[code_id] = code
+        else:
+            code_id = len(self.codes)
+            self.codes.append(code)
+        self.ids[code] = code_id
+        bit = 1 << code_id
+        self.all |= bit
+        unique = frozenset(tags)
+        self.code_tags[code] = unique
+        for tag in unique:
+            self.bitmaps[tag] = self.bitmaps.get(tag, 0) | bit
+
+    def remove(self, code: str) -> bool:
+        """Drop a code from the index, returning whether it was indexed."""
+        code_id = self.ids.pop(code, None)
+        if code_id is None:
+            return False
+        mask = ~(1 << code_id)
+        self.all &= mask
+        for tag in self.code_tags.pop(code):
+            bitmap = self.bitmaps[tag] & mask
+            if bitmap:
+                self.bitmaps[tag] = bitmap
+            else:
+                del self.bitmaps[tag]
+        self.codes[code_id] = None
+        self.free_ids.append(code_id)
+        return True
+
+
+class TagIndex:
+    """Inverted index from tags to short codes, for local tag queries.
+
+    Codes get compact integer ids and each tag maps to a bitmap of the ids
+    carrying it, stored as a Python integer. AND, OR and NOT queries are then
+    bitwise operations and cardinalities are bit counts, answered in
+    microseconds without any request.
+
+    The index is built from the short code listing by ``refresh()``, which
+    swaps the new index in atomically, and can be kept up to date between
+    refreshes with ``update()`` and ``remove()``.
+
+    Example:
+        >>> from hyphen import Link, TagIndex
+        >>> index = TagIndex(Link(organization_id="org", api_key="key"))
+        >>> index.refresh()
+        >>> codes = index.query(all_of=["sale"], any_of=["spring", "summer"], none_of=["archived"])
+        >>> index.count(all_of=["sale"])
+    """
+
+    def __init__(self, link: Link | None = None, page_size: int = 500, prefetch_pages: int = 1):
+        """
+        Initialize an empty index.
+
+        Args:
+            link: Client whose short code listing refresh() indexes.
+            page_size: Number of short codes requested per page by refresh().
+            prefetch_pages: Number of pages fetched ahead by refresh().
+        """
+        self.link = link
+        self.page_size = page_size
+        self.prefetch_pages = prefetch_pages
+        self._lock = threading.Lock()
+        self._state = _State()
+
+    def refresh(self) -> int:
+        """
+        Rebuild the index from the short code listing of the client.
+
+        Queries keep using the previous index until the listing was read.
+
+        Returns:
+            Number of short codes indexed.
+
+        Raises:
+            ValueError: If the index has no client.
+            requests.HTTPError: If a request fails
+        """
+        if self.link is None:
+            raise ValueError("A Link client is required to refresh the index.")
+        short_codes = self.link.iter_short_codes(
+            page_size=self.page_size, prefetch_pages=self.prefetch_pages
+        )
+        state = _State.build((short_code.code, short_code.tags or []) for short_code in short_codes)
+        with self._lock:
+            self._state = state
+        return len(state.ids)
+
+    def build(self, short_codes: Iterable[ShortCode]) -> None:
+        """
+        Replace the index with the given short codes.
+
+        Args:
+            short_codes: Short codes to index.
+        """
+        state = _State.build((short_code.code, short_code.tags or []) for short_code in short_codes)
+        with self._lock:
+            self._state = state
+
+    def update(self, short_code: ShortCode) -> None:
+        """
+        Index a created or updated short code, replacing its previous tags.
+
+        Args:
+            short_code: The short code to index.
+        """
+        with self._lock:
+            self._state.add(short_code.code, short_code.tags or [])
+
+    def remove(self, code: str) -> bool:
+        """
+        Drop a deleted short code from the index.
+
+        Args:
+            code: The code identifier of the short code.
+
+        Returns:
+            Whether the short code was indexed.
+        """
+        with self._lock:
+            return self._state.remove(code)
+
+    def query(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> list[str]:
+        """
+        Find the codes matching a tag query.
+
+        Args:
+            all_of: Tags the codes must all have.
+            any_of: Tags the codes must have at least one of, if any are given.
+            none_of: Tags the codes must not have.
+
+        Returns:
+            The matching codes, in index order. Without any tag, every code.
+        """
+        with self._lock:
+            state = self._state
+            bitmap = self._match(state, all_of, any_of, none_of)
+            codes = state.codes
+            # Scanning the binary digits is linear, unlike clearing bits one by one
+            bits = bin(bitmap)[:1:-1]
+            matches: list[str] = []
+            position = bits.find("1")
+            while position != -1:
+                matches.append(cast(str, codes[position]))
+                position = bits.find("1", position + 1)
+            return matches
+
+    def count(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+    ) -> int:
+        """
+        Count the codes matching a tag query, like query().
+
+        Returns:
+            Number of matching codes.
+        """
+        with self._lock:
+            return self._match(self._state, all_of, any_of, none_of).bit_count()
+
+    def cardinality(self, tag: str) -> int:
+        """Get the number of codes carrying a tag."""
+        with self._lock:
+            return self._state.bitmaps.get(tag, 0).bit_count()
+
+    def cardinalities(self) -> dict[str, int]:
+        """Get the number of codes carrying each tag, most used first."""
+        with self._lock:
+            counts = {tag: bitmap.bit_count() for tag, bitmap in self._state.bitmaps.items()}
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+    def tags(self, code: str) -> frozenset[str]:
+        """Get the tags of an indexed code, or an empty set if it is not indexed."""
+        with self._lock:
+            return self._state.code_tags.get(code, frozenset())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._state.ids)
+
+    @staticmethod
+    def _match(
+        state: _State, all_of: Iterable[str], any_of: Iterable[str], none_of: Iterable[str]
+    ) -> int:
+        """Compute the bitmap of a tag query. Requires the lock."""
+        bitmaps = state.bitmaps
+        result = state.all
+        for tag in all_of:
+            result &= bitmaps.get(tag, 0)
+        union = None
+        for tag in any_of:
+            union = (union or 0) | bitmaps.get(tag, 0)
+        if union is not None:
+            result &= union
+        for tag in none_of:
+            result &= ~bitmaps.get(tag, 0)
+        return result
@@ -0,0 +1,538 @@
+"""HTTP transports used by the Hyphen SDK clients."""
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Protocol
+from urllib.parse import urlsplit
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+from hyphen.dns import DnsCache, DnsCachingAdapter
+from hyphen.session_pool import SessionPool, register_fork_aware
+
+
+class Transport(Protocol):
+    """Sends HTTP requests on behalf of BaseClient.
+
+    Transports return ``requests.Response`` objects whatever library they use,
+    so that errors are always reported as ``requests.HTTPError``.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a request and return its response.
+
+        The body is fully read unless stream is True, in which case it may be
+        read incrementally with ``iter_content()``. Transports that cannot
+        stream return the body already read.
+        """
+        ...
+
+    def warmup(self, url: str, connections: int) -> int:
+        """Open connections to the host of url, returning how many were opened."""
+        ...
+
+    def close(self) -> None:
+        """Release the connections held by the transport."""
+        ...
+
+
+class BufferedBody:
+    """Raw body of a response that was fully read before being returned.
+
+    Used as ``requests.Response.raw`` by transports that do not read responses
+    with urllib3, so the number of bytes received can still be reported.
+    """
+
+    def __init__(self, wire_bytes: int):
+        """
+        Initialize the body.
+
+        Args:
+            wire_bytes: Number of body bytes received, before decompression.
+        """
+        self.wire_bytes = wire_bytes
+
+    def tell(self) -> int:
+        """Get the number of body bytes received."""
+        return self.wire_bytes
+
+    def close(self) -> None:
+        """Do nothing; the body was already read."""
+
+
+class StreamedBody:
+    """Raw body of an httpx response, read incrementally by iter_content().
+
+    Used as ``requests.Response.raw`` by the HTTP/2 transport for streamed
+    requests, so size limits are enforced while the body is received.
+    """
+
+    def __init__(self, response: Any):
+        """
+        Initialize the body.
+
+        Args:
+            response: The httpx response, sent with stream=True.
+        """
+        self._response = response
+
+    def stream(self, chunk_size: int, decode_content: bool = True) -> Iterator[bytes]:
+        """Yield the decoded body in chunks as it is received."""
+        yield from self._response.iter_bytes(chunk_size)
+
+    def tell(self) -> int:
+        """Get the number of body bytes received so far, before decompression."""
+        return int(self._response.num_bytes_downloaded)
+
+    def close(self) -> None:
+        """Close the response, releasing its stream."""
+        self._response.close()
+
+
+def build_response(
+    url: str,
+    status_code: int,
+    content: bytes,
+    headers: Mapping[str, str] | None = None,
+    reason: str = "",
+    wire_bytes: int | None = None,
+) -> requests.Response:
+    """
+    Build a fully read requests.Response.
+
+    Args:
+        url: URL of the request.
+        status_code: HTTP status code.
+        content: Decoded response body.
+        headers: Response headers.
+        reason: HTTP reason phrase.
+        wire_bytes: Number of body bytes received. Defaults to len(content).
+
+    Returns:
+        A response whose raise_for_status() and content behave as with requests.
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = content
+    response._content_consumed = True  # type: ignore[attr-defined]
+    response.raw = BufferedBody(len(content) if wire_bytes is None else wire_bytes)
+    return response
+
+
+class RequestsTransport:
+    """Transport sending HTTP/1.1 requests with pooled requests sessions."""
+
+    def __init__(
+        self,
+        session_mode: str = "shared",
+        session_shards: int = 4,
+        pool_maxsize: int = 10,
+        dns_ttl: float | None = None,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            session_mode: How sessions are shared between threads: "shared"
+                (one session), "thread_local" (one session per thread) or
+                "sharded" (threads spread over session_shards sessions).
+                Sessions are always rebuilt in processes forked from this one.
+            session_shards: Number of sessions in "sharded" mode.
+            pool_maxsize: Maximum number of pooled connections per session.
+            dns_ttl: Seconds to cache resolved host addresses. Host names are
+                resolved for every new connection if not provided.
+        """
+        self.pool_maxsize = pool_maxsize
+        self.dns_cache = DnsCache(dns_ttl) if dns_ttl is not None else None
+        self.session_pool = SessionPool(self._create_session, session_mode, session_shards)
+
+    @property
+    def session(self) -> requests.Session:
+        """The session used by the calling thread."""
+        return self.session_pool.get()
+
+    def _create_session(self) -> requests.Session:
+        """Create a session with the configured connection pool."""
+        session = requests.Session()
+        if self.dns_cache is not None:
+            adapter: HTTPAdapter = DnsCachingAdapter(
+                self.dns_cache, pool_connections=1, pool_maxsize=self.pool_maxsize
+            )
+        else:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept-Encoding": DEFAULT_ACCEPT_ENCODING})
+        return session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request with the calling thread's session."""
+        return self.session.request(
+            method=method,
+            url=url,
+            data=data,
+            params=params,
+            headers=headers,
+            stream=stream,
+        )
+
+    def warmup(self, url: str, connections: int) -> int:
+        """
+        Resolve the host and open pooled connections to it.
+
+        Connections are opened in parallel, including the TLS handshake, and
+        kept in the connection pool of every session serving the calling
+        thread (every shard in "sharded" mode). Requests sent through a proxy
+        do not use these connections.
+
+        Args:
+            url: URL of the host to connect to.
+            connections: Number of connections to have open per session, capped
+                at pool_maxsize.
+
+        Returns:
+            Number of connections newly opened.
+
+        Raises:
+            OSError: If the host cannot be resolved or connected to.
+        """
+        parsed = urllib3.util.parse_url(url)
+        if self.dns_cache is not None and parsed.host:
+            port = parsed.port or (443 if parsed.scheme == "https" else 80)
+            self.dns_cache.resolve(parsed.host, port)
+
+        opened = 0
+        count = min(connections, self.pool_maxsize)
+        for session in self.session_pool.serving_sessions():
+            adapter = session.get_adapter(url)
+            if not isinstance(adapter, HTTPAdapter) or count < 1:
+                continue
+            pool = adapter.poolmanager.connection_from_url(url)
+            conns = [pool._get_conn() for _ in range(count)]
+            try:
+                with ThreadPoolExecutor(max_workers=count) as executor:
+                    opened += sum(executor.map(_connect, conns))
+            finally:
+                for conn in conns:
+                    pool._put_conn(conn)
+        return opened
+
+    def close(self) -> None:
+        """Close every session."""
+        self.session_pool.close()
+
+
+class Http2Transport:
+    """Transport multiplexing concurrent requests over HTTP/2 connections.
+
+    Requires the optional httpx and h2 packages (``pip install hyphen[http2]``).
+    Over https, HTTP/2 is negotiated with the server and HTTP/1.1 is used as a
+    fallback. The underlying client is rebuilt in processes forked from this one.
+
+    Requests from several threads share a connection. Their headers are sent
+    one at a time, since httpx's HTTP/2 connections can otherwise send them
+    with stream ids out of order, which servers reject by closing the
+    connection; bodies and responses are still multiplexed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        prior_knowledge: bool = False,
+        timeout: float | None = None,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            max_connections: Maximum number of connections per transport.
+                Concurrent requests to a host share one HTTP/2 connection.
+            prior_knowledge: Whether to speak HTTP/2 directly without
+                negotiation. Required for plain-text (h2c) servers.
+            timeout: Request timeout in seconds. No timeout if not provided.
+
+        Raises:
+            ImportError: If httpx or h2 is not installed.
+        """
+        import h2  # noqa: F401 - fail early rather than on the first request
+        import httpx
+
+        self._httpx = httpx
+        self.max_connections = max_connections
+        self.prior_knowledge = prior_knowledge
+        self.timeout = timeout
+        self._client = self._create_client()
+        self._headers_lock = threading.Lock()
+        register_fork_aware(self)
+
+    def _create_client(self) -> Any:
+        """Create the httpx client."""
+        return self._httpx.Client(
+            http1=not self.prior_knowledge,
+            http2=True,
+            limits=self._httpx.Limits(max_connections=self.max_connections),
+            timeout=self.timeout,
+        )
+
+    def _after_fork(self) -> None:
+        """Forget the parent's connections in a forked child process."""
+        self._client = self._create_client()
+        self._headers_lock = threading.Lock()
+
+    def _send(self, request: Any, stream: bool = False) -> Any:
+        """Send an httpx request, holding the headers lock until its headers are sent."""
+        lock = self._headers_lock
+        lock.acquire()
+        held = True
+
+        def trace(event: str, info: Any) -> None:
+            nonlocal held
+            if held and event.endswith(".send_request_headers.complete"):
+                held = False
+                lock.release()
+
+        request.extensions = {**request.extensions, "trace": trace}
+        try:
+            return self._client.send(request, stream=stream)
+        finally:
+            if held:
+                held = False
+                lock.release()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a request over a shared HTTP/2 connection.
+
+        The whole body is read unless stream is True, in which case it is
+        received as the response is iterated with ``iter_content()``.
+        """
+        request = self._client.build_request(
+            method,
+            url,
+            content=data,
+            params=params,
+            headers=headers,
+        )
+        response = self._send(request, stream=stream)
+        if stream:
+            streamed = requests.Response()
+            streamed.url = str(response.url)
+            streamed.status_code = response.status_code
+            streamed.reason = response.reason_phrase
+            streamed.headers = CaseInsensitiveDict(response.headers)
+            streamed.raw = StreamedBody(response)
+            return streamed
+        return build_response(
+            url=str(response.url),
+            status_code=response.status_code,
+            content=response.content,
+            headers=response.headers,
+            reason=response.reason_phrase,
+            wire_bytes=response.num_bytes_downloaded,
+        )
+
+    def warmup(self, url: str, connections: int) -> int:
+        """
+        Open the HTTP/2 connection to the host of url.
+
+        A single connection is opened with a HEAD request, since HTTP/2
+        multiplexes concurrent requests over it.
+
+        Args:
+            url: URL of the host to connect to.
+            connections: Ignored; one connection serves all requests.
+
+        Returns:
+            1, once the connection is open.
+
+        Raises:
+            OSError: If the host cannot be resolved or connected to.
+        """
+        try:
+            self._send(self._client.build_request("HEAD", url))
+        except self._httpx.TransportError as e:
+            raise OSError(f"Failed to connect to {url}: {e}") from e
+        return 1
+
+    def close(self) -> None:
+        """Close the connections."""
+        self._client.close()
+
+
+@dataclass
+class InMemoryRequest:
+    """A request received by an InMemoryTransport."""
+
+    method: str
+    url: str
+    path: str
+    params: dict[str, Any]
+    headers: dict[str, str]
+    body: bytes | None
+
+
+@dataclass
+class InMemoryResponse:
+    """A response served by an InMemoryTransport."""
+
+    status: int = 200
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, data: Any, status: int = 200) -> "InMemoryResponse":
+        """Build a JSON response from a Python object."""
+        return cls(
+            status=status,
+            body=json.dumps(data).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+
+
+InMemoryHandler = Callable[[InMemoryRequest], InMemoryResponse]
+
+
+class InMemoryTransport:
+    """Transport serving canned or programmed responses without sockets.
+
+    Used to measure the SDK's own cost per call and to run deterministic load
+    tests. Responses are looked up by method and path among the registered
+    routes, then produced by the fallback handler; unmatched requests get a 404.
+    Response bodies are already in memory, so size limits still reject them
+    but do not save any memory.
+
+    Example:
+        >>> from hyphen import InMemoryResponse, InMemoryTransport, NetInfo
+        >>> transport = InMemoryTransport(latency=0.005)
+        >>> transport.route("GET", "/ip/8.8.8.8", InMemoryResponse.json({"ip": "8.8.8.8"}))
+        >>> net_info = NetInfo(api_key="key", transport=transport)
+    """
+
+    def __init__(
+        self,
+        handler: InMemoryHandler | None = None,
+        latency: float | Callable[[InMemoryRequest], float] = 0.0,
+        record: bool = True,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            handler: Function producing responses for requests without a route.
+            latency: Seconds every request takes, or a function returning the
+                latency of a request, e.g. to inject jitter or slow endpoints.
+            record: Whether to keep received requests in ``requests``. Disable
+                for long benchmarks to keep memory use flat.
+        """
+        self.handler = handler
+        self.latency = latency
+        self.record = record
+        self.requests: list[InMemoryRequest] = []
+        self._routes: dict[tuple[str, str], InMemoryResponse | InMemoryHandler] = {}
+        self._lock = threading.Lock()
+
+    def route(
+        self, method: str, path: str, response: InMemoryResponse | InMemoryHandler
+    ) -> None:
+        """
+        Register the response to a method and path.
+
+        Args:
+            method: HTTP method, e.g. "GET".
+            path: URL path without query string, e.g. "/ip/8.8.8.8".
+            response: Response to serve, or a function producing it.
+        """
+        self._routes[(method.upper(), path)] = response
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Serve a request from the routes or handler after the configured latency."""
+        request = InMemoryRequest(
+            method=method.upper(),
+            url=url,
+            path=urlsplit(url).path,
+            params=dict(params or {}),
+            headers=dict(headers or {}),
+            body=data,
+        )
+        if self.record:
+            with self._lock:
+                self.requests.append(request)
+
+        latency = self.latency(request) if callable(self.latency) else self.latency
+        if latency > 0:
+            time.sleep(latency)
+
+        route = self._routes.get((request.method, request.path))
+        if isinstance(route, InMemoryResponse):
+            response = route
+        elif route is not None:
+            response = route(request)
+        elif self.handler is not None:
+            response = self.handler(request)
+        else:
+            response = InMemoryResponse(status=404)
+        try:
+            reason = HTTPStatus(response.status).phrase
+        except ValueError:
+            reason = ""
+        return build_response(url, response.status, response.body, response.headers, reason)
+
+    def warmup(self, url: str, connections: int) -> int:
+        """Do nothing; there are no connections to open."""
+        return 0
+
+    def close(self) -> None:
+        """Do nothing; there are no connections to release."""
+
+
+def _connect(conn: Any) -> int:
+    """Open a pooled connection if it is not connected yet, returning 1 if opened."""
+    if conn.sock is not None:
+        return 0
+    conn.connect()
+    return 1
@@ -1,8 +1,10 @@
 """Type definitions for Hyphen SDK."""
 
+import base64
+import os
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, BinaryIO
 
 from typing_extensions import TypedDict
 
@@ -213,36 +215,181 @@ class ShortCodesResponse:
 
 
 @dataclass
+class ShortCodeCreationError:
+    """A short code of a bulk creation that could not be created.
+
+    Attributes:
+        index: Position of the item in the bulk creation input.
+        long_url: The URL the short code was requested for.
+        domain: The domain the short code was requested on.
+        error: The exception raised by the last attempt.
+        attempts: Number of attempts made.
+        ambiguous: Whether the last request may have been processed anyway,
+            e.g. after a gateway error or a dropped connection, in which case
+            the short code may exist.
+    """
+
+    index: int
+    long_url: str
+    domain: str
+    error: Exception
+    attempts: int
+    ambiguous: bool = False
+
+
+class QrCodeImage:
+    """QR code image decoded from the API payload on first access.
+
+    The payload is kept as received, either the base64 ``qrCode`` string
+    (optionally a ``data:`` URL) or the ``qrCodeBytes`` integer array, and only
+    decoded when the image bytes are needed. Decoding replaces the payload, so
+    a single representation of the image is held at any time.
+    """
+
+    # The payload, or the image bytes once decoded. A single attribute holds
+    # either, so concurrent readers never see a half-replaced payload.
+    __slots__ = ("_source", "_prefix")
+
+    def __init__(
+        self,
+        base64_data: str | None = None,
+        integers: list[int] | None = None,
+        data: bytes | None = None,
+    ):
+        """
+        Initialize the image from one of its representations.
+
+        Args:
+            base64_data: Base64 encoded image, optionally as a data URL.
+            integers: Image bytes as a list of integers.
+            data: Image bytes.
+        """
+        self._source: bytes | list[int] | str
+        if data is not None:
+            self._source = data
+        elif integers is not None:
+            self._source = integers
+        else:
+            self._source = base64_data or ""
+        self._prefix = ""
+        if base64_data is not None and base64_data.startswith("data:"):
+            self._prefix = base64_data[: base64_data.find(",") + 1]
+
+    def tobytes(self) -> bytes:
+        """Get the image bytes, decoding the payload on first access."""
+        source = self._source
+        if isinstance(source, bytes):
+            return source
+        if isinstance(source, list):
+            data = bytes(source)
+        else:
+            data = base64.b64decode(source[len(self._prefix) :])
+        # Threads decoding concurrently publish equal bytes
+        self._source = data
+        return data
+
+    def memoryview(self) -> memoryview:
+        """Get a read-only view of the image bytes, without copying them."""
+        return memoryview(self.tobytes())
+
+    @property
+    def base64(self) -> str:
+        """The image as base64, with the data URL prefix of the payload if any."""
+        source = self._source
+        if isinstance(source, str):
+            return source
+        return self._prefix + base64.b64encode(self.tobytes()).decode("ascii")
+
+    def write_to(self, target: str | os.PathLike[str] | BinaryIO) -> int:
+        """
+        Write the image to a file or binary stream.
+
+        Args:
+            target: Path of the file to create, or a stream opened for writing.
+
+        Returns:
+            Number of bytes written.
+        """
+        view = self.memoryview()
+        if isinstance(target, str | os.PathLike):
+            with open(target, "wb") as file:
+                file.write(view)
+        else:
+            target.write(view)
+        return len(view)
+
+    def __len__(self) -> int:
+        return len(self.tobytes())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, QrCodeImage):
+            return NotImplemented
+        return self.tobytes() == other.tobytes()
+
+    def __repr__(self) -> str:
+        state = "decoded" if isinstance(self._source, bytes) else "encoded"
+        return f"QrCodeImage({state})"
+
+
+@dataclass(init=False)
 class QrCode:
     """A QR code response.
 
     Attributes:
         id: Unique identifier for the QR code.
         title: Optional title for the QR code.
+        qr_link: URL to the QR code image.
+        image: The QR code image, decoded on first access.
         qr_code: Base64 encoded QR code image.
         qr_code_bytes: Raw bytes of the QR code image.
-        qr_link: URL to the QR code image.
     """
 
     id: str
-    title: str | None = None
-    qr_code: str | None = None
-    qr_code_bytes: bytes | None = None
-    qr_link: str | None = None
+    title: str | None
+    qr_link: str | None
+    image: QrCodeImage | None
+
+    def __init__(
+        self,
+        id: str,
+        title: str | None = None,
+        qr_code: str | None = None,
+        qr_code_bytes: bytes | None = None,
+        qr_link: str | None = None,
+        image: QrCodeImage | None = None,
+    ):
+        """Create a QrCode from an image or one of its representations."""
+        self.id = id
+        self.title = title
+        self.qr_link = qr_link
+        if image is None and (qr_code is not None or qr_code_bytes is not None):
+            image = QrCodeImage(base64_data=qr_code, data=qr_code_bytes)
+        self.image = image
+
+    @property
+    def qr_code(self) -> str | None:
+        """Base64 encoded QR code image."""
+        return self.image.base64 if self.image is not None else None
+
+    @property
+    def qr_code_bytes(self) -> bytes | None:
+        """Raw bytes of the QR code image."""
+        return self.image.tobytes() if self.image is not None else None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "QrCode":
         """Create a QrCode from an API response dictionary."""
-        qr_code_bytes = None
-        if "qrCodeBytes" in data and data["qrCodeBytes"]:
-            # Convert from array to bytes if provided
-            qr_code_bytes = bytes(data["qrCodeBytes"])
+        image = None
+        # Both fields hold the same image; keep the compact base64 one if present
+        if data.get("qrCode"):
+            image = QrCodeImage(base64_data=data["qrCode"])
+        elif data.get("qrCodeBytes"):
+            image = QrCodeImage(integers=data["qrCodeBytes"])
         return cls(
             id=data.get("id", ""),
             title=data.get("title"),
-            qr_code=data.get("qrCode"),
-            qr_code_bytes=qr_code_bytes,
             qr_link=data.get("qrLink"),
+            image=image,
         )
 
 
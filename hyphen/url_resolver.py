@@ -0,0 +1,313 @@
+"""Compact code to long URL resolution for Hyphen SDK."""
+
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from collections.abc import Iterable
+
+from hyphen.link import Link
+
+_MAGIC = b"HYUR"
+_VERSION = 2
+# Magic, version, record count, slot count, domains size, strings size
+_HEADER = struct.Struct("<4sIIIII")
+# 1-based record index, 0 for an empty slot
+_SLOT = struct.Struct("<I")
+# Offset of the code in the strings, code size, domain id, URL size
+_RECORD = struct.Struct("<IHHI")
+# Size of an interned domain name, which is followed by its UTF-8 bytes
+_DOMAIN_SIZE = struct.Struct("<I")
+
+
+class UrlTable:
+    """Immutable hash table from codes to their domain and long URL.
+
+    The whole table is one buffer: an open-addressing slot array, fixed-size
+    records, the interned domain names and the packed UTF-8 codes and URLs.
+    It takes a few dozen bytes per short code instead of the hundreds used by
+    ShortCode objects in a dict, and can be saved to a file and memory-mapped
+    so that processes share one copy of it.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap):
+        """
+        Wrap a table built by build() or saved by save().
+
+        Args:
+            buffer: The table's bytes.
+
+        Raises:
+            ValueError: If the buffer does not hold a complete table.
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Buffer is too small to hold a URL table.")
+        magic, version, count, slot_count, domains_size, strings_size = _HEADER.unpack_from(
+            buffer, 0
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Buffer does not hold a URL table.")
+        self._buffer = buffer
+        self._count: int = count
+        self._mask = slot_count - 1
+        self._slots_offset = _HEADER.size
+        self._records_offset = self._slots_offset + slot_count * _SLOT.size
+        domains_offset = self._records_offset + count * _RECORD.size
+        self._strings_offset = domains_offset + domains_size
+        if len(buffer) < self._strings_offset + strings_size:
+            raise ValueError("URL table is truncated.")
+        self.domains: list[str] = []
+        position = domains_offset
+        while position < self._strings_offset:
+            (size,) = _DOMAIN_SIZE.unpack_from(buffer, position)
+            position += _DOMAIN_SIZE.size
+            self.domains.append(bytes(buffer[position : position + size]).decode())
+            position += size
+
+    @classmethod
+    def build(cls, entries: Iterable[tuple[str, str, str]]) -> "UrlTable":
+        """
+        Build a table.
+
+        Args:
+            entries: (code, domain, long_url) tuples. The last entry of a code wins.
+
+        Returns:
+            The table.
+
+        Raises:
+            ValueError: If a code is longer than 65535 bytes, there are more
+                than 65536 domains or the strings exceed 4 GiB.
+        """
+        latest: dict[str, tuple[str, str]] = {}
+        for code, domain, long_url in entries:
+            latest[code] = (domain, long_url)
+
+        count = len(latest)
+        # At least twice as many slots as records keeps probe sequences short
+        slot_count = 1 << max(1, (2 * count - 1).bit_length())
+        mask = slot_count - 1
+        slots = bytearray(slot_count * _SLOT.size)
+        records = bytearray(count * _RECORD.size)
+        strings = bytearray()
+        domains: dict[str, int] = {}
+        for index, (code, (domain, long_url)) in enumerate(latest.items()):
+            code_bytes = code.encode()
+            url_bytes = long_url.encode()
+            domain_id = domains.setdefault(domain, len(domains))
+            if len(code_bytes) > 0xFFFF:
+                raise ValueError(f"Code {code[:32]!r}... is too long for a URL table.")
+            if domain_id > 0xFFFF:
+                raise ValueError("Too many domains for a URL table.")
+            _RECORD.pack_into(
+                records,
+                index * _RECORD.size,
+                len(strings),
+                len(code_bytes),
+                domain_id,
+                len(url_bytes),
+            )
+            strings += code_bytes
+            strings += url_bytes
+            slot = zlib.crc32(code_bytes) & mask
+            while _SLOT.unpack_from(slots, slot * _SLOT.size)[0]:
+                slot = (slot + 1) & mask
+            _SLOT.pack_into(slots, slot * _SLOT.size, index + 1)
+        if len(strings) > 0xFFFFFFFF:
+            raise ValueError("Codes and URLs are too large for a URL table.")
+
+        domains_blob = bytearray()
+        for domain in domains:
+            domain_bytes = domain.encode()
+            domains_blob += _DOMAIN_SIZE.pack(len(domain_bytes))
+            domains_blob += domain_bytes
+        header = _HEADER.pack(_MAGIC, _VERSION, count, slot_count, len(domains_blob), len(strings))
+        return cls(b"".join((header, slots, records, domains_blob, strings)))
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> "UrlTable":
+        """
+        Memory-map a table saved by save().
+
+        Args:
+            path: File holding the table.
+
+        Returns:
+            The table, reading its file on demand.
+        """
+        with open(path, "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write the table to a file, replacing it atomically.
+
+        Processes that memory-mapped the previous file keep reading it.
+
+        Args:
+            path: File to write.
+        """
+        directory = os.path.dirname(os.fspath(path)) or "."
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix=".urltable-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self._buffer)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def lookup(self, code: str) -> tuple[str, str] | None:
+        """
+        Get the domain and long URL of a code.
+
+        Args:
+            code: The code identifier.
+
+        Returns:
+            (domain, long_url), or None if the code is not in the table.
+        """
+        key = code.encode()
+        buffer = self._buffer
+        slot = zlib.crc32(key) & self._mask
+        while True:
+            (index,) = _SLOT.unpack_from(buffer, self._slots_offset + slot * _SLOT.size)
+            if not index:
+                return None
+            offset, code_size, domain_id, url_size = _RECORD.unpack_from(
+                buffer, self._records_offset + (index - 1) * _RECORD.size
+            )
+            start = self._strings_offset + offset
+            if code_size == len(key) and buffer[start : start + code_size] == key:
+                url_start = start + code_size
+                long_url = buffer[url_start : url_start + url_size].decode()
+                return self.domains[domain_id], long_url
+            slot = (slot + 1) & self._mask
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the table in bytes."""
+        return len(self._buffer)
+
+
+class UrlResolver:
+    """Resolves codes to long URLs locally, from a table of a Link listing.
+
+    Lookups are hash table probes in a compact UrlTable and never make a
+    request. ``refresh()`` builds a new table from the short code listing and
+    swaps it in atomically, so lookups running concurrently see either the old
+    or the new table. With a path, the table is saved to that file and
+    memory-mapped, and other processes can ``load()`` it instead of fetching
+    the listing themselves.
+
+    Example:
+        >>> from hyphen import Link, UrlResolver
+        >>> resolver = UrlResolver(Link(organization_id="org", api_key="key"), "urls.table")
+        >>> resolver.refresh()
+        >>> resolver.resolve("abc123")
+        'https://hyphen.ai'
+    """
+
+    def __init__(
+        self,
+        link: Link | None = None,
+        path: str | os.PathLike[str] | None = None,
+        page_size: int = 500,
+        prefetch_pages: int = 1,
+    ):
+        """
+        Initialize an empty resolver.
+
+        Args:
+            link: Client whose short code listing refresh() resolves from.
+            path: File the table is saved to and memory-mapped from. The table
+                is kept in memory if not provided.
+            page_size: Number of short codes requested per page by refresh().
+            prefetch_pages: Number of pages fetched ahead by refresh().
+        """
+        self.link = link
+        self.path = path
+        self.page_size = page_size
+        self.prefetch_pages = prefetch_pages
+        self._table = UrlTable.build([])
+
+    @property
+    def table(self) -> UrlTable:
+        """The table lookups are currently answered from."""
+        return self._table
+
+    def refresh(self) -> int:
+        """
+        Rebuild the table from the short code listing of the client.
+
+        Lookups keep using the previous table until the new one is complete.
+
+        Returns:
+            Number of codes in the new table.
+
+        Raises:
+            ValueError: If the resolver has no client.
+            requests.HTTPError: If a request fails
+        """
+        if self.link is None:
+            raise ValueError("A Link client is required to refresh the resolver.")
+        short_codes = self.link.iter_short_codes(
+            page_size=self.page_size, prefetch_pages=self.prefetch_pages
+        )
+        table = UrlTable.build(
+            (short_code.code, short_code.domain, short_code.long_url) for short_code in short_codes
+        )
+        if self.path is not None:
+            table.save(self.path)
+            table = UrlTable.open(self.path)
+        # Readers only ever load this attribute once per lookup
+        self._table = table
+        return len(table)
+
+    def load(self) -> int:
+        """
+        Swap in the table saved at path, e.g. by another process's refresh().
+
+        Returns:
+            Number of codes in the table.
+
+        Raises:
+            ValueError: If the resolver has no path.
+            OSError: If the file cannot be read.
+        """
+        if self.path is None:
+            raise ValueError("A path is required to load a table.")
+        self._table = UrlTable.open(self.path)
+        return len(self._table)
+
+    def resolve(self, code: str) -> str | None:
+        """
+        Get the long URL of a code.
+
+        Args:
+            code: The code identifier.
+
+        Returns:
+            The long URL, or None if the code is unknown.
+        """
+        found = self._table.lookup(code)
+        return found[1] if found is not None else None
+
+    def lookup(self, code: str) -> tuple[str, str] | None:
+        """
+        Get the domain and long URL of a code.
+
+        Args:
+            code: The code identifier.
+
+        Returns:
+            (domain, long_url), or None if the code is unknown.
+        """
+        return self._table.lookup(code)
+
+    def __len__(self) -> int:
+        return len(self._table)
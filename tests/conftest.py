@@ -0,0 +1,158 @@
+"""Shared fixtures for unit tests."""
+
+import socket
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+
+@dataclass
+class StubRequest:
+    """A request received by the stub server."""
+
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass
+class StubResponse:
+    """A response returned by the stub server."""
+
+    status: int = 200
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class StubServer:
+    """Local HTTP server answering requests with a programmable handler."""
+
+    def __init__(self) -> None:
+        self.requests: list[StubRequest] = []
+        self.handler: Callable[[StubRequest], StubResponse] = lambda request: StubResponse()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                request = StubRequest(
+                    method=self.command,
+                    path=self.path,
+                    headers={key.lower(): value for key, value in self.headers.items()},
+                    body=self.rfile.read(length),
+                )
+                stub.requests.append(request)
+                response = stub.handler(request)
+                self.send_response(response.status)
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(response.body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle  # noqa: N815
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class H2StubServer:
+    """Local plain-text HTTP/2 (h2c) server answering with a programmable handler."""
+
+    def __init__(self) -> None:
+        self.requests: list[StubRequest] = []
+        self.handler: Callable[[StubRequest], StubResponse] = lambda request: StubResponse()
+        self._socket = socket.create_server(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{self._socket.getsockname()[1]}"
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self._socket.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        h2_conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        h2_conn.initiate_connection()
+        conn.sendall(h2_conn.data_to_send())
+        streams: dict[int, tuple[dict[str, str], bytearray]] = {}
+        with conn:
+            while data := conn.recv(65536):
+                for event in h2_conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers = {key.decode(): value.decode() for key, value in event.headers}
+                        streams[event.stream_id] = (headers, bytearray())
+                    elif isinstance(event, h2.events.DataReceived):
+                        streams[event.stream_id][1].extend(event.data)
+                        h2_conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        self._respond(h2_conn, event.stream_id, *streams.pop(event.stream_id))
+                conn.sendall(h2_conn.data_to_send())
+
+    def _respond(self, h2_conn: Any, stream_id: int, headers: dict[str, str], body: bytes) -> None:
+        request = StubRequest(
+            method=headers[":method"],
+            path=headers[":path"],
+            headers={key: value for key, value in headers.items() if not key.startswith(":")},
+            body=bytes(body),
+        )
+        self.requests.append(request)
+        response = self.handler(request)
+        response_headers = [(":status", str(response.status))]
+        response_headers += [(key.lower(), value) for key, value in response.headers.items()]
+        response_headers.append(("content-length", str(len(response.body))))
+        h2_conn.send_headers(stream_id, response_headers, end_stream=not response.body)
+        if response.body:
+            h2_conn.send_data(stream_id, response.body, end_stream=True)
+
+    def close(self) -> None:
+        """Stop accepting connections."""
+        self._socket.close()
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    """Local HTTP server for tests that exercise real sockets."""
+    server = StubServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def h2_stub_server() -> Iterator[H2StubServer]:
+    """Local HTTP/2 server for tests of the HTTP/2 transport."""
+    pytest.importorskip("h2")
+    server = H2StubServer()
+    yield server
+    server.close()
@@ -1,11 +1,32 @@
 """Tests for base client."""
 
+import gc
+import gzip
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
+from hyphen import (
+    AdaptiveConcurrencyLimiter,
+    CompressionPolicy,
+    HedgePolicy,
+    HttpCache,
+    InMemoryResponse,
+    InMemoryTransport,
+    RateLimiter,
+    RateLimitExceededError,
+    ResponseTooLargeError,
+)
 from hyphen.base_client import BaseClient
+from hyphen.codec import StdlibJsonCodec
+from tests.conftest import StubResponse, StubServer
 
 
 def test_base_client_with_api_key() -> None:
@@ -41,7 +62,7 @@ def test_base_client_request(mock_session_class: Mock) -> None:
     mock_session = Mock()
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"data": "test"}
+    mock_response.content = b'{"data": "test"}'
     mock_session.request.return_value = mock_response
     mock_session_class.return_value = mock_session
 
@@ -66,3 +87,352 @@ def test_base_client_request_no_content(mock_session_class: Mock) -> None:
     result = client.delete("/test")
 
     assert result is None
+
+
+@patch("hyphen.base_client.requests.Session")
+def test_base_client_hedges_idempotent_requests(mock_session_class: Mock) -> None:
+    """Test BaseClient only hedges idempotent requests."""
+    mock_session = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+    mock_session.request.return_value = mock_response
+    mock_session_class.return_value = mock_session
+
+    client = BaseClient(api_key="test_key", hedging=HedgePolicy())
+    client.get("/test")
+    client.post("/test", data={"a": 1})
+    client.post("/test", data={"a": 1}, idempotent=True)
+    client.close()
+
+    assert client.metrics.get("hedge.calls") == 2
+    assert mock_session.request.call_count == 3
+    mock_session.close.assert_called_once()
+
+
+@patch("hyphen.base_client.requests.Session")
+def test_base_client_coalesces_identical_requests(mock_session_class: Mock) -> None:
+    """Test BaseClient sends one request for identical concurrent reads."""
+    release = threading.Event()
+    mock_session = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+
+    def request(**kwargs: Any) -> Mock:
+        release.wait(5)
+        return mock_response
+
+    mock_session.request.side_effect = request
+    mock_session_class.return_value = mock_session
+
+    client = BaseClient(api_key="test_key", coalesce_requests=True)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(client.get, "/test", {"q": "a"}) for _ in range(5)]
+        while client.metrics.get("singleflight.coalesced") < 4:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [{"data": "test"}] * 5
+    assert mock_session.request.call_count == 1
+    assert client.metrics.get("singleflight.calls") == 1
+
+
+@patch("hyphen.base_client.requests.Session")
+def test_base_client_does_not_coalesce_writes(mock_session_class: Mock) -> None:
+    """Test BaseClient never coalesces non-idempotent requests."""
+    mock_session = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+    mock_session.request.return_value = mock_response
+    mock_session_class.return_value = mock_session
+
+    client = BaseClient(api_key="test_key", coalesce_requests=True)
+    client.post("/test", data={"a": 1})
+    client.post("/test", data={"a": 1})
+
+    assert mock_session.request.call_count == 2
+    assert client.metrics.get("singleflight.calls") == 0
+
+
+def test_base_client_request_key() -> None:
+    """Test request keys depend on method, URL, params and body."""
+    key = BaseClient._request_key("GET", "https://a/x", None, {"a": 1, "b": 2})
+
+    assert key == BaseClient._request_key("GET", "https://a/x", None, {"b": 2, "a": 1})
+    assert key != BaseClient._request_key("GET", "https://a/x", None, {"a": 2, "b": 2})
+    assert key != BaseClient._request_key("POST", "https://a/x", None, {"a": 1, "b": 2})
+    assert key != BaseClient._request_key("GET", "https://a/x", b'{"c": 1}', {"a": 1, "b": 2})
+
+
+@patch("hyphen.base_client.requests.Session")
+def test_base_client_encodes_body_with_codec(mock_session_class: Mock) -> None:
+    """Test BaseClient sends the body encoded by its codec."""
+    mock_session = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = b'["ok"]'
+    mock_session.request.return_value = mock_response
+    mock_session_class.return_value = mock_session
+
+    client = BaseClient(api_key="test_key", codec=StdlibJsonCodec())
+    result = client.post_raw("/test", data=["8.8.8.8"])
+
+    assert result == ["ok"]
+    kwargs = mock_session.request.call_args.kwargs
+    assert kwargs["data"] == b'["8.8.8.8"]'
+    assert kwargs["headers"] == {"x-api-key": "test_key", "Content-Type": "application/json"}
+
+
+def test_base_client_compresses_large_bodies(stub_server: StubServer) -> None:
+    """Test BaseClient compresses large bodies and records byte counts."""
+    response_body = gzip.compress(b'{"data": [' + b'{"ip": "8.8.8.8"},' * 100 + b'{}]}')
+    stub_server.handler = lambda request: StubResponse(
+        body=response_body,
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    client = BaseClient(
+        api_key="test_key",
+        base_url=stub_server.url,
+        compression=CompressionPolicy(threshold=1024),
+    )
+    ips = ["8.8.8.8"] * 200
+
+    result = client.post_raw("/ip", data=ips)
+    client.close()
+
+    request = stub_server.requests[0]
+    assert request.headers["content-encoding"] == "gzip"
+    assert "gzip" in request.headers["accept-encoding"]
+    assert json.loads(gzip.decompress(request.body)) == ips
+    assert len(result["data"]) == 101
+    assert client.metrics.get("request.compressed") == 1
+    assert client.metrics.get("request.wire_bytes") == len(request.body)
+    assert client.metrics.get("request.body_bytes") > len(request.body)
+    assert client.metrics.get("response.wire_bytes") == len(response_body)
+    assert client.metrics.get("response.body_bytes") > len(response_body)
+
+
+def test_base_client_does_not_compress_small_bodies(stub_server: StubServer) -> None:
+    """Test BaseClient sends bodies below the threshold uncompressed."""
+    client = BaseClient(
+        api_key="test_key",
+        base_url=stub_server.url,
+        compression=CompressionPolicy(threshold=1024),
+    )
+
+    client.post("/test", data={"a": 1})
+    client.close()
+
+    request = stub_server.requests[0]
+    assert "content-encoding" not in request.headers
+    assert json.loads(request.body) == {"a": 1}
+    assert client.metrics.get("request.compressed") == 0
+
+
+def test_base_client_rate_limiter(stub_server: StubServer) -> None:
+    """Test BaseClient paces requests and backs off on 429 responses."""
+    stub_server.handler = lambda request: StubResponse(
+        status=429, headers={"Retry-After": "30"}
+    )
+    client = BaseClient(
+        api_key="test_key",
+        base_url=stub_server.url,
+        rate_limiter=RateLimiter(rate=100, block=False),
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.get("/test")
+    with pytest.raises(RateLimitExceededError):
+        client.get("/test")
+    client.close()
+
+    assert len(stub_server.requests) == 1
+    assert client.metrics.get("rate_limit.throttled") == 1
+    assert client.metrics.get("rate_limit.rejected") == 1
+
+
+def test_base_client_concurrency_limiter(stub_server: StubServer) -> None:
+    """Test BaseClient reports the adaptive concurrency limit as a gauge."""
+    stub_server.handler = lambda request: StubResponse(status=503)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+    client = BaseClient(api_key="test_key", base_url=stub_server.url, concurrency_limiter=limiter)
+
+    with pytest.raises(requests.HTTPError):
+        client.get("/test")
+    client.close()
+
+    assert client.metrics.get("concurrency.limit.*") == 5
+    assert limiter.in_flight("*") == 0
+
+
+def test_base_client_thread_local_sessions(stub_server: StubServer) -> None:
+    """Test BaseClient uses a separate session per thread in thread_local mode."""
+    client = BaseClient(api_key="test_key", base_url=stub_server.url, session_mode="thread_local")
+
+    sent = threading.Event()
+    finish = threading.Event()
+
+    def run() -> None:
+        client.get("/test")
+        sent.set()
+        finish.wait()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    sent.wait()
+    client.get("/test")
+
+    pool = client.transport.session_pool
+    assert len(pool.sessions()) == 2
+    assert client.session is pool.sessions()[1]
+    assert stub_server.requests[0].headers["x-api-key"] == "test_key"
+    finish.set()
+    thread.join()
+    gc.collect()
+    assert pool.sessions() == [client.session]
+    client.close()
+
+
+def test_base_client_warmup_opens_pooled_connections(stub_server: StubServer) -> None:
+    """Test warmup opens connections that later requests reuse."""
+    client = BaseClient(api_key="test_key", base_url=stub_server.url, dns_ttl=60)
+
+    assert client.warmup(connections=3) == 3
+    assert client.warmup(connections=3) == 0
+    client.get("/test")
+    client.close()
+
+    assert client.metrics.get("warmup.connections") == 3
+    assert stub_server.requests[0].path == "/test"
+
+
+def test_base_client_eager_warmup(stub_server: StubServer) -> None:
+    """Test warmup_connections warms each shard while constructing the client."""
+    client = BaseClient(
+        api_key="test_key",
+        base_url=stub_server.url,
+        session_mode="sharded",
+        session_shards=2,
+        warmup_connections=2,
+    )
+    client.close()
+
+    assert client.metrics.get("warmup.connections") == 4
+
+
+def test_base_client_eager_warmup_failure_is_recorded() -> None:
+    """Test eager warmup failures do not prevent constructing the client."""
+    client = BaseClient(api_key="test_key", base_url="http://127.0.0.1:9", warmup_connections=1)
+    client.close()
+
+    assert client.metrics.get("warmup.errors") == 1
+
+
+def test_base_client_stream_items(stub_server: StubServer) -> None:
+    """Test stream_items decodes array elements read incrementally from the socket."""
+    items = [{"id": i, "code": f"c{i}"} for i in range(2000)]
+    body = json.dumps({"total": 2000, "data": items}).encode()
+    stub_server.handler = lambda request: StubResponse(
+        body=gzip.compress(body), headers={"Content-Encoding": "gzip"}
+    )
+    client = BaseClient(api_key="test_key", base_url=stub_server.url)
+
+    result = list(client.stream_items("GET", "/codes", params={"pageSize": 2000}))
+    client.close()
+
+    assert result == items
+    assert stub_server.requests[0].path == "/codes?pageSize=2000"
+    assert client.metrics.get("response.streamed") == 1
+    assert client.metrics.get("response.body_bytes") == len(body)
+    assert client.metrics.get("response.wire_bytes") == len(gzip.compress(body))
+
+
+def test_base_client_stream_items_raises_http_errors(stub_server: StubServer) -> None:
+    """Test stream_items raises HTTPError before parsing an error response."""
+    stub_server.handler = lambda request: StubResponse(status=500, body=b"oops")
+    client = BaseClient(api_key="test_key", base_url=stub_server.url)
+
+    with pytest.raises(requests.HTTPError):
+        list(client.stream_items("POST", "/ip", data=["8.8.8.8"]))
+    client.close()
+
+
+def test_base_client_rejects_declared_oversized_response(stub_server: StubServer) -> None:
+    """Test a Content-Length above the limit fails before the body is read."""
+    stub_server.handler = lambda request: StubResponse(body=b"[" + b"1," * 500 + b"1]")
+    client = BaseClient(api_key="test_key", base_url=stub_server.url, max_response_bytes=100)
+
+    with pytest.raises(ResponseTooLargeError) as exc_info:
+        client.get("/test")
+    client.close()
+
+    assert exc_info.value.endpoint == "/test"
+    assert exc_info.value.limit == 100
+    assert client.metrics.get("response.too_large") == 1
+
+
+def test_base_client_limits_decoded_size(stub_server: StubServer) -> None:
+    """Test compressed bodies are limited by their decoded size while streaming."""
+    body = json.dumps({"data": "x" * 1_000_000}).encode()
+    stub_server.handler = lambda request: StubResponse(
+        body=gzip.compress(body), headers={"Content-Encoding": "gzip"}
+    )
+    client = BaseClient(api_key="test_key", base_url=stub_server.url, max_response_bytes=100_000)
+
+    with pytest.raises(ResponseTooLargeError):
+        client.get("/test")
+    client.close()
+
+
+def test_base_client_response_size_limits_per_endpoint(stub_server: StubServer) -> None:
+    """Test the first matching pattern overrides the default limit."""
+    stub_server.handler = lambda request: StubResponse(body=json.dumps(["x" * 500]).encode())
+    client = BaseClient(
+        api_key="test_key",
+        base_url=stub_server.url,
+        max_response_bytes=100,
+        response_size_limits={"/codes/*": 1000},
+    )
+
+    assert client.get("/codes/abc") == ["x" * 500]
+    with pytest.raises(ResponseTooLargeError):
+        client.get("/tags")
+    client.close()
+
+    assert client.response_size_limit("/codes/abc") == 1000
+    assert client.response_size_limit("/tags") == 100
+
+
+def test_base_client_stream_items_enforces_size_limit(stub_server: StubServer) -> None:
+    """Test streaming stops once the body crosses the limit."""
+    items = [{"id": i} for i in range(100_000)]
+    stub_server.handler = lambda request: StubResponse(body=json.dumps({"data": items}).encode())
+    client = BaseClient(api_key="test_key", base_url=stub_server.url, max_response_bytes=200_000)
+
+    received = []
+    with pytest.raises(ResponseTooLargeError):
+        for item in client.stream_items("GET", "/codes"):
+            received.append(item)
+    client.close()
+
+    assert 0 < len(received) < len(items)
+    assert client.metrics.get("response.too_large") == 1
+
+
+def test_base_client_size_limit_keeps_http_cache() -> None:
+    """Test responses read under a size limit are still stored in the HTTP cache."""
+    response = InMemoryResponse.json(["a"])
+    response.headers["ETag"] = '"v1"'
+    transport = InMemoryTransport()
+    transport.route("GET", "/tags", response)
+    client = BaseClient(
+        api_key="test_key", transport=transport, http_cache=HttpCache(), max_response_bytes=1000
+    )
+
+    assert client.get("/tags") == ["a"]
+    assert client.get("/tags") == ["a"]
+
+    assert transport.requests[1].headers["If-None-Match"] == '"v1"'
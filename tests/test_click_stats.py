@@ -0,0 +1,133 @@
+"""Tests for columnar short code statistics."""
+
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from hyphen import Breakdown, ClickSeries, InMemoryResponse, InMemoryTransport, Link, ShortCodeStats
+
+STATS = {
+    "clicks": {
+        "total": 10,
+        "unique": 7,
+        "byDay": [
+            {"date": "2025-01-01T00:00:00.000Z", "total": 2, "unique": 2},
+            {"date": "2025-01-02T00:00:00.000Z", "total": 3, "unique": 2},
+            {"date": "2025-01-08T00:00:00.000Z", "total": 5, "unique": 3},
+        ],
+    },
+    "locations": [
+        {"country": "US", "total": 6, "unique": 4},
+        {"country": "FR", "total": 3, "unique": 2},
+        {"country": "DE", "total": 1, "unique": 1},
+    ],
+    "referrals": [{"url": "https://news.example", "total": 4}, {"url": "direct", "total": 6}],
+    "browsers": [{"name": "Chrome", "total": 8}],
+}
+
+
+def epoch(day: int) -> int:
+    """Get the epoch seconds of a day of January 2025."""
+    return int(datetime(2025, 1, day, tzinfo=timezone.utc).timestamp())
+
+
+def test_from_dict_builds_columns() -> None:
+    """Test the response is parsed into a series and breakdowns."""
+    stats = ShortCodeStats.from_dict(STATS)
+
+    assert (stats.total_clicks, stats.unique_clicks) == (10, 7)
+    assert stats.series.timestamps == array("q", [epoch(1), epoch(2), epoch(8)])
+    assert stats.series.clicks == array("q", [2, 3, 5])
+    assert stats.series.total() == 10
+    assert stats.breakdown("locations").as_dict() == {"US": 6, "FR": 3, "DE": 1}
+    assert stats.breakdown("referrals").labels == ["https://news.example", "direct"]
+    assert len(stats.breakdown("devices")) == 0
+    assert memoryview(stats.series.clicks).format == "q"
+
+
+def test_resample_and_between() -> None:
+    """Test series are summed into periods and sliced by date."""
+    series = ShortCodeStats.from_dict(STATS).series
+
+    weekly = series.resample(timedelta(weeks=1), origin=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    assert weekly.timestamps == array("q", [epoch(1), epoch(8)])
+    assert weekly.clicks == array("q", [5, 5])
+    assert weekly.unique == array("q", [4, 3])
+    window = series.between(
+        datetime(2025, 1, 2, tzinfo=timezone.utc), datetime(2025, 1, 8, tzinfo=timezone.utc)
+    )
+    assert window.clicks == array("q", [3])
+    with pytest.raises(ValueError):
+        series.resample(timedelta(0))
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="time.tzset is not available")
+def test_naive_datetimes_are_utc(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test naive arguments are taken as UTC, like naive API dates, whatever the local zone."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        series = ShortCodeStats.from_dict(STATS).series
+
+        window = series.between(datetime(2025, 1, 1), datetime(2025, 1, 2))
+        daily = series.resample(timedelta(days=1), origin=datetime(2025, 1, 1))
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert window.clicks == array("q", [2])
+    assert daily.timestamps == series.timestamps
+
+
+def test_top_values() -> None:
+    """Test the most clicked values are ranked by clicks or unique clicks."""
+    locations = ShortCodeStats.from_dict(STATS).breakdown("locations")
+
+    assert locations.top(2) == [("US", 6), ("FR", 3)]
+    assert locations.top(1, unique=True) == [("US", 4)]
+    assert Breakdown().top(3) == []
+
+
+def test_combine_stats_of_several_codes() -> None:
+    """Test statistics are added period by period and value by value."""
+    other = ShortCodeStats.from_dict(
+        {
+            "clicks": {"total": 4, "byDay": [{"date": "2025-01-02", "total": 4}]},
+            "locations": [{"country": "FR", "total": 4}, {"country": "JP", "total": 1}],
+        }
+    )
+
+    combined = ShortCodeStats.combine([ShortCodeStats.from_dict(STATS), other])
+
+    assert combined.total_clicks == 14
+    assert combined.series.clicks == array("q", [2, 7, 5])
+    assert combined.series.timestamps == array("q", [epoch(1), epoch(2), epoch(8)])
+    assert ClickSeries().combine(other.series).clicks == array("q", [4])
+    assert combined.breakdown("locations").top(2) == [("FR", 7), ("US", 6)]
+    assert combined.breakdown("browsers").as_dict() == {"Chrome": 8}
+
+
+def test_click_series_from_epoch_entries() -> None:
+    """Test epoch seconds and milliseconds are accepted as dates."""
+    series = ClickSeries.from_entries(
+        [{"timestamp": epoch(1), "clicks": 1}, {"timestamp": epoch(1) * 1000, "clicks": 2}]
+    )
+
+    assert series.timestamps == array("q", [epoch(1)])
+    assert series.clicks == array("q", [3])
+
+
+def test_get_columnar_short_code_stats() -> None:
+    """Test the Link client returns typed statistics."""
+    transport = InMemoryTransport()
+    transport.route(
+        "GET", "/api/organizations/org_123/link/codes/abc/stats", InMemoryResponse.json(STATS)
+    )
+    link = Link(organization_id="org_123", api_key="key", transport=transport)
+
+    stats = link.get_columnar_short_code_stats("abc")
+
+    assert stats.breakdown("locations").top(1) == [("US", 6)]
@@ -0,0 +1,135 @@
+"""Tests for the multi-tenant client pool."""
+
+import gc
+from unittest.mock import patch
+
+import pytest
+
+from hyphen import (
+    ClientPool,
+    FeatureToggle,
+    InMemoryRequest,
+    InMemoryResponse,
+    InMemoryTransport,
+    Link,
+    NetInfo,
+)
+
+
+def build_pool(**options) -> tuple[ClientPool, InMemoryTransport]:
+    """Build a pool whose clients share an in-memory transport."""
+    transport = InMemoryTransport(handler=lambda request: InMemoryResponse.json({"data": []}))
+    return ClientPool(transport=transport, **options), transport
+
+
+def test_pool_reuses_clients_per_tenant() -> None:
+    """Test the same credentials get the same client and others get their own."""
+    pool, _ = build_pool()
+
+    first = pool.link(organization_id="org_1", api_key="key_1")
+    again = pool.link(organization_id="org_1", api_key="key_1")
+    other = pool.link(organization_id="org_2", api_key="key_2")
+
+    assert isinstance(first, Link)
+    assert first is again
+    assert other is not first
+    assert isinstance(pool.net_info(api_key="key_1"), NetInfo)
+    assert isinstance(pool.feature_toggle(application_id="app", api_key="key_1"), FeatureToggle)
+    assert len(pool) == 4
+    assert pool.metrics.get("client_pool.hits") == 1
+    assert pool.metrics.get("client_pool.misses") == 4
+    assert pool.metrics.get("client_pool.size") == 4
+
+
+def test_pool_shares_transport_and_sends_tenant_credentials() -> None:
+    """Test tenants share one transport while sending their own API key."""
+    pool, transport = build_pool()
+
+    pool.link(organization_id="org_1", api_key="key_1").get_tags()
+    pool.link(organization_id="org_2", api_key="key_2").get_tags()
+
+    assert [request.headers["x-api-key"] for request in transport.requests] == ["key_1", "key_2"]
+    assert [request.path for request in transport.requests] == [
+        "/api/organizations/org_1/link/codes/tags",
+        "/api/organizations/org_2/link/codes/tags",
+    ]
+
+
+def test_pool_evicts_least_recently_used_client() -> None:
+    """Test clients beyond max_clients are dropped, least recently used first."""
+    pool, transport = build_pool(max_clients=2)
+    first = pool.net_info(api_key="key_1")
+    second = pool.net_info(api_key="key_2")
+    pool.net_info(api_key="key_1")
+
+    pool.net_info(api_key="key_3")
+
+    assert pool.net_info(api_key="key_1") is first
+    assert pool.net_info(api_key="key_2") is not second
+    assert pool.metrics.get("client_pool.evictions") == 2
+    # Evicted clients keep working for their holder and share the transport
+    assert second.submit_get_ip_info("8.8.8.8").result() is not None
+    assert pool.net_info(api_key="key_1").get_ip_info("8.8.8.8") is not None
+    assert len(transport.requests) == 2
+
+    # Their threads are stopped once they are no longer referenced
+    executor = second.client.executor
+    del second
+    gc.collect()
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+def test_pool_does_not_close_clients_in_use() -> None:
+    """Test a client evicted by another tenant finishes iterating its listing."""
+
+    def listing(request: InMemoryRequest) -> InMemoryResponse:
+        page_num = int(request.params.get("pageNum", 1))
+        code = {"id": f"id_{page_num}", "code": f"c{page_num}", "long_url": "u", "domain": "d"}
+        return InMemoryResponse.json(
+            {"total": 3, "pageNum": page_num, "pageSize": 1, "data": [code]}
+        )
+
+    pool = ClientPool(max_clients=1, transport=InMemoryTransport(handler=listing))
+    codes = pool.link(organization_id="org_1", api_key="key_1").iter_short_codes(page_size=1)
+
+    first = next(codes)
+    pool.link(organization_id="org_2", api_key="key_2")
+
+    assert [first.code, *(short_code.code for short_code in codes)] == ["c1", "c2", "c3"]
+    assert pool.metrics.get("client_pool.evictions") == 1
+
+
+def test_pool_expires_idle_clients() -> None:
+    """Test clients unused for idle_timeout are replaced on the next access."""
+    pool, _ = build_pool(idle_timeout=60)
+    with patch("hyphen.client_pool.time.monotonic", return_value=1000.0):
+        idle = pool.net_info(api_key="key_1")
+        active = pool.net_info(api_key="key_2")
+    with patch("hyphen.client_pool.time.monotonic", return_value=1030.0):
+        pool.net_info(api_key="key_2")
+    with patch("hyphen.client_pool.time.monotonic", return_value=1070.0):
+        assert pool.net_info(api_key="key_2") is active
+        assert pool.net_info(api_key="key_1") is not idle
+
+    assert pool.metrics.get("client_pool.expired") == 1
+
+
+def test_pool_builds_default_transport_from_session_options() -> None:
+    """Test session options configure the shared default transport."""
+    pool = ClientPool(pool_maxsize=50, session_mode="thread_local", coalesce_requests=True)
+
+    link = pool.link(organization_id="org_1", api_key="key_1")
+
+    assert pool.transport.pool_maxsize == 50
+    assert pool.transport.session_pool.mode == "thread_local"
+    assert link.client.singleflight is not None
+    assert link.client.metrics is pool.metrics
+    pool.close()
+    assert len(pool) == 0
+
+
+def test_pool_rejects_empty_capacity() -> None:
+    """Test max_clients must allow at least one client."""
+    with pytest.raises(ValueError):
+        ClientPool(max_clients=0)
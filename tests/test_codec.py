@@ -0,0 +1,54 @@
+"""Tests for JSON codecs."""
+
+import builtins
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from hyphen import QrSize
+from hyphen.codec import JsonCodec, OrjsonCodec, StdlibJsonCodec, default_codec
+
+
+@pytest.fixture(params=["json", "orjson"])
+def codec(request: pytest.FixtureRequest) -> JsonCodec:
+    """Each JSON codec, skipping the orjson one when orjson is not installed."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        return OrjsonCodec()
+    return StdlibJsonCodec()
+
+
+def test_codec_round_trip(codec: JsonCodec) -> None:
+    """Test codecs encode to bytes and decode from buffers."""
+    payload = {"data": [{"ip": "8.8.8.8", "location": {"lat": 37.4, "city": "Zürich"}}]}
+
+    encoded = codec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
+    assert codec.loads(memoryview(encoded)) == payload
+
+
+def test_codec_encodes_str_enums(codec: JsonCodec) -> None:
+    """Test codecs encode string enums such as QrSize by value."""
+    assert codec.loads(codec.dumps({"size": QrSize.LARGE})) == {"size": "large"}
+
+
+def test_default_codec_prefers_orjson() -> None:
+    """Test default_codec uses orjson when it is installed."""
+    pytest.importorskip("orjson")
+    assert default_codec().name == "orjson"
+
+
+def test_default_codec_falls_back_to_stdlib() -> None:
+    """Test default_codec falls back to the stdlib codec without orjson."""
+    real_import = builtins.__import__
+
+    def fake_import(name: str, *args: Any, **kwargs: Any) -> Any:
+        if name == "orjson":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    with patch("builtins.__import__", side_effect=fake_import):
+        assert default_codec().name == "json"
@@ -0,0 +1,49 @@
+"""Tests for request body compression."""
+
+import gzip
+import os
+import zlib
+
+import pytest
+
+from hyphen import CompressionPolicy
+
+
+def test_compression_policy_skips_small_bodies() -> None:
+    """Test bodies below the threshold are not compressed."""
+    policy = CompressionPolicy(threshold=100)
+
+    assert policy.compress(b"x" * 99) is None
+
+
+def test_compression_policy_gzip() -> None:
+    """Test gzip compression of a large body."""
+    body = b'["8.8.8.8",' * 1000
+    compressed = CompressionPolicy(encoding="gzip").compress(body)
+
+    assert compressed is not None
+    assert gzip.decompress(compressed) == body
+
+
+def test_compression_policy_deflate() -> None:
+    """Test deflate compression of a large body."""
+    body = b'["8.8.8.8",' * 1000
+    compressed = CompressionPolicy(encoding="deflate").compress(body)
+
+    assert compressed is not None
+    assert zlib.decompress(compressed) == body
+
+
+def test_compression_policy_skips_incompressible_bodies() -> None:
+    """Test bodies that would not shrink are sent as is."""
+    body = os.urandom(1024)
+
+    assert CompressionPolicy(threshold=0).compress(body) is None
+
+
+def test_compression_policy_validation() -> None:
+    """Test CompressionPolicy rejects invalid values."""
+    with pytest.raises(ValueError, match="Unsupported encoding"):
+        CompressionPolicy(encoding="br")
+    with pytest.raises(ValueError, match="level"):
+        CompressionPolicy(level=0)
@@ -0,0 +1,102 @@
+"""Tests for adaptive concurrency limiting."""
+
+import threading
+import time
+
+import pytest
+
+from hyphen import AdaptiveConcurrencyLimiter
+from hyphen.exceptions import ConcurrencyLimitExceededError
+
+
+def test_limiter_grows_on_fast_successes() -> None:
+    """Test the limit increases while requests are fast and successful."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=10)
+
+    for _ in range(20):
+        keys = [limiter.acquire("/ip"), limiter.acquire("/ip")]
+        for key in keys:
+            limiter.release(key, latency=0.01, success=True)
+
+    assert limiter.limit("*") > 2
+
+
+def test_limiter_backs_off_on_errors() -> None:
+    """Test the limit decreases multiplicatively on failures."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+
+    key = limiter.acquire("/ip")
+    limiter.release(key, latency=0.01, success=False)
+
+    assert limiter.limit(key) == 5
+
+
+def test_limiter_backs_off_on_latency_increase() -> None:
+    """Test the limit decreases when latency exceeds the baseline tolerance."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5, latency_tolerance=2)
+
+    key = limiter.acquire("/ip")
+    limiter.release(key, latency=0.01, success=True)
+    key = limiter.acquire("/ip")
+    limiter.release(key, latency=0.05, success=True)
+
+    assert limiter.limit(key) == 5
+
+
+def test_limiter_never_drops_below_min_limit() -> None:
+    """Test the limit is bounded by min_limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2)
+
+    for _ in range(10):
+        limiter.release(limiter.acquire("/ip"), latency=0.01, success=False)
+
+    assert limiter.limit("*") == 2
+
+
+def test_limiter_groups_endpoints_by_pattern() -> None:
+    """Test endpoints matching a pattern get their own limit."""
+    limiter = AdaptiveConcurrencyLimiter(patterns=["/ip/*"])
+
+    assert limiter.key("/ip/8.8.8.8") == "/ip/*"
+    assert limiter.key("/ip") == "*"
+
+
+def test_limiter_blocks_at_limit() -> None:
+    """Test acquire blocks until a slot is released."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1)
+    key = limiter.acquire("/ip")
+    acquired = threading.Event()
+
+    def acquire() -> None:
+        limiter.acquire("/ip")
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    limiter.release(key, latency=0.01, success=True)
+    assert acquired.wait(1)
+    thread.join()
+    assert limiter.in_flight(key) == 1
+
+
+def test_limiter_max_wait() -> None:
+    """Test acquire raises when no slot frees up within max_wait."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=1, max_wait=0.02)
+    limiter.acquire("/ip")
+
+    start = time.monotonic()
+    with pytest.raises(ConcurrencyLimitExceededError) as exc_info:
+        limiter.acquire("/ip")
+
+    assert time.monotonic() - start >= 0.02
+    assert exc_info.value.limit == 1
+
+
+def test_limiter_validation() -> None:
+    """Test invalid limits are rejected."""
+    with pytest.raises(ValueError, match="min_limit"):
+        AdaptiveConcurrencyLimiter(initial_limit=5, max_limit=2)
+    with pytest.raises(ValueError, match="backoff_ratio"):
+        AdaptiveConcurrencyLimiter(backoff_ratio=1.5)
@@ -0,0 +1,72 @@
+"""Tests for DNS caching."""
+
+import socket
+from unittest.mock import patch
+
+import requests
+
+from hyphen.dns import DnsCache, DnsCachingAdapter
+from tests.conftest import StubResponse, StubServer
+
+LOCALHOST_INFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 80))]
+
+
+def test_dns_cache_reuses_resolved_address() -> None:
+    """Test a host is only resolved once within the TTL."""
+    cache = DnsCache(ttl=60)
+    with patch("hyphen.dns.socket.getaddrinfo", return_value=LOCALHOST_INFO) as getaddrinfo:
+        assert cache.resolve("api.example.com", 443) == "127.0.0.1"
+        assert cache.resolve("api.example.com", 443) == "127.0.0.1"
+
+    getaddrinfo.assert_called_once()
+
+
+def test_dns_cache_expires_entries() -> None:
+    """Test a host is resolved again once its entry has expired."""
+    cache = DnsCache(ttl=0)
+    with patch("hyphen.dns.socket.getaddrinfo", return_value=LOCALHOST_INFO) as getaddrinfo:
+        cache.resolve("api.example.com", 443)
+        cache.resolve("api.example.com", 443)
+
+    assert getaddrinfo.call_count == 2
+
+
+def test_dns_cache_invalidate() -> None:
+    """Test invalidated hosts are resolved again."""
+    cache = DnsCache(ttl=60)
+    with patch("hyphen.dns.socket.getaddrinfo", return_value=LOCALHOST_INFO) as getaddrinfo:
+        cache.resolve("api.example.com", 443)
+        cache.invalidate("api.example.com", 443)
+        cache.resolve("api.example.com", 443)
+
+    assert getaddrinfo.call_count == 2
+
+
+def test_dns_cache_skips_ip_literals() -> None:
+    """Test IP addresses are returned without resolution."""
+    cache = DnsCache()
+    with patch("hyphen.dns.socket.getaddrinfo") as getaddrinfo:
+        assert cache.resolve("10.0.0.1", 443) == "10.0.0.1"
+        assert cache.resolve("::1", 443) == "::1"
+
+    getaddrinfo.assert_not_called()
+
+
+def test_dns_caching_adapter_connects_through_cache(stub_server: StubServer) -> None:
+    """Test sessions using the adapter connect to the cached address."""
+    stub_server.handler = lambda request: StubResponse(body=b"ok")
+    port = stub_server.url.rsplit(":", 1)[1]
+    cache = DnsCache()
+    session = requests.Session()
+    session.mount("http://", DnsCachingAdapter(cache))
+
+    info = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", int(port)))]
+    with patch("hyphen.dns.socket.getaddrinfo", return_value=info) as getaddrinfo:
+        response = session.get(f"http://hyphen.invalid:{port}/test")
+
+    assert response.content == b"ok"
+    assert stub_server.requests[0].headers["host"] == f"hyphen.invalid:{port}"
+    # The host name is resolved once by the cache; urllib3 only sees the IP address
+    hosts = [call.args[0] for call in getaddrinfo.call_args_list]
+    assert hosts == ["hyphen.invalid", "127.0.0.1"]
+    session.close()
@@ -0,0 +1,97 @@
+"""Tests for the bounded executor behind the futures-based API."""
+
+import threading
+import time
+
+import pytest
+
+from hyphen import ExecutorQueueFullError
+from hyphen.executor import BoundedExecutor
+
+
+def test_submit_returns_futures() -> None:
+    """Test submitted calls run in the pool and return their results."""
+    executor = BoundedExecutor(max_workers=2)
+
+    future = executor.submit(lambda a, b=0: a + b, 1, b=2)
+
+    assert future.result(timeout=5) == 3
+    executor.shutdown()
+
+
+def test_submit_bounds_unfinished_calls() -> None:
+    """Test submissions beyond max_pending fail after max_wait."""
+    release = threading.Event()
+    executor = BoundedExecutor(max_workers=1, max_pending=2, max_wait=0.05)
+
+    executor.submit(release.wait)
+    queued = executor.submit(release.wait)
+    with pytest.raises(ExecutorQueueFullError) as exc_info:
+        executor.submit(release.wait)
+
+    assert exc_info.value.max_pending == 2
+    assert queued.cancel()
+    executor.submit(release.wait)
+    release.set()
+    executor.shutdown()
+
+
+def test_map_preserves_order_and_bounds_submissions() -> None:
+    """Test map yields results in order without submitting everything at once."""
+    executor = BoundedExecutor(max_workers=4, max_pending=3)
+    submitted = []
+
+    def items():
+        for i in range(20):
+            submitted.append(i)
+            yield i
+
+    results = executor.map(lambda i: (time.sleep(0.001 * (i % 3)), i * i)[1], items())
+
+    assert next(results) == 0
+    assert len(submitted) <= 4
+    assert list(results) == [i * i for i in range(1, 20)]
+    executor.shutdown()
+
+
+def test_map_raises_and_cancels_remaining_calls() -> None:
+    """Test a failing call is raised in order and later calls are cancelled."""
+    executor = BoundedExecutor(max_workers=1, max_pending=10)
+    started = []
+
+    def call(i: int) -> int:
+        started.append(i)
+        time.sleep(0.05)
+        if i == 0:
+            raise ValueError("boom")
+        return i
+
+    with pytest.raises(ValueError, match="boom"):
+        list(executor.map(call, range(10)))
+    executor.shutdown()
+
+    assert len(started) < 10
+
+
+def test_shutdown_cancels_queued_calls() -> None:
+    """Test shutdown cancels queued calls and rejects new ones."""
+    release = threading.Event()
+    executor = BoundedExecutor(max_workers=1)
+    running = executor.submit(release.wait)
+    queued = executor.submit(release.wait)
+
+    threading.Timer(0.05, release.set).start()
+    executor.shutdown(wait=True)
+
+    assert running.result() is True
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+def test_executor_validates_sizes() -> None:
+    """Test invalid pool sizes are rejected."""
+    with pytest.raises(ValueError):
+        BoundedExecutor(max_workers=0)
+    with pytest.raises(ValueError):
+        BoundedExecutor(max_pending=0)
@@ -1,11 +1,12 @@
 """Tests for feature toggle."""
 
+import json
 import os
 from unittest.mock import Mock, patch
 
 import pytest
 
-from hyphen import FeatureToggle, ToggleContext
+from hyphen import FeatureToggle, InMemoryResponse, InMemoryTransport, ToggleContext
 
 
 class TestFeatureToggleInit:
@@ -466,3 +467,25 @@ class TestEvaluate:
 
         call_args = mock_client.post.call_args
         assert call_args[1]["data"]["targetingKey"] == "the_targeting_key"
+
+
+def test_submit_and_map_evaluate() -> None:
+    """Test evaluations can be submitted and mapped over many contexts."""
+    transport = InMemoryTransport(
+        handler=lambda request: InMemoryResponse.json(
+            {"toggles": {"flag": {"value": json.loads(request.body or b"{}")["targetingKey"]}}}
+        )
+    )
+    toggle = FeatureToggle(
+        application_id="app_123", api_key="key_123", environment="production", transport=transport
+    )
+    contexts = [ToggleContext(targeting_key=f"user_{i}") for i in range(5)]
+
+    results = list(toggle.map_evaluate(contexts))
+    future = toggle.submit_get_toggle("flag", context=contexts[0])
+
+    assert [result.toggles["flag"].value for result in results] == [
+        f"user_{i}" for i in range(5)
+    ]
+    assert future.result() == "user_0"
+    toggle.close()
@@ -0,0 +1,193 @@
+"""Tests for request hedging."""
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from hyphen import HedgePolicy, Metrics
+from hyphen.hedging import Hedger, LatencyTracker
+
+
+def test_latency_tracker_percentile() -> None:
+    """Test LatencyTracker computes nearest-rank percentiles."""
+    tracker = LatencyTracker(window_size=100)
+    assert tracker.percentile(95) is None
+
+    for i in range(1, 101):
+        tracker.record(i / 1000)
+
+    assert tracker.percentile(50) == 0.05
+    assert tracker.percentile(95) == 0.095
+    assert tracker.percentile(100) == 0.1
+
+
+def test_latency_tracker_window() -> None:
+    """Test LatencyTracker only keeps the most recent samples."""
+    tracker = LatencyTracker(window_size=2)
+    for latency in (5.0, 1.0, 2.0):
+        tracker.record(latency)
+
+    assert len(tracker) == 2
+    assert tracker.percentile(100) == 2.0
+
+
+def test_hedge_policy_validation() -> None:
+    """Test HedgePolicy rejects invalid values."""
+    with pytest.raises(ValueError, match="percentile"):
+        HedgePolicy(percentile=0)
+    with pytest.raises(ValueError, match="max_delay"):
+        HedgePolicy(min_delay=1.0, max_delay=0.5)
+
+
+def test_hedger_delay_uses_percentile_after_min_samples() -> None:
+    """Test the hedge delay switches from initial_delay to the percentile."""
+    hedger = Hedger(HedgePolicy(initial_delay=0.2, min_samples=3, min_delay=0.0))
+    assert hedger.delay() == 0.2
+
+    for latency in (0.01, 0.02, 0.03):
+        hedger.latencies.record(latency)
+
+    assert hedger.delay() == 0.03
+
+
+def test_hedger_fast_call_is_not_hedged() -> None:
+    """Test a call finishing before the hedge delay sends no duplicate."""
+    metrics = Metrics()
+    hedger = Hedger(HedgePolicy(initial_delay=1.0, burst=1, max_hedge_ratio=1), metrics)
+
+    assert hedger.run(lambda: "result") == "result"
+    assert metrics.get("hedge.calls") == 1
+    assert metrics.get("hedge.sent") == 0
+    hedger.close()
+
+
+def test_hedger_duplicate_wins_over_slow_call() -> None:
+    """Test the duplicate answers when the original call is slow."""
+    metrics = Metrics()
+    hedger = Hedger(
+        HedgePolicy(initial_delay=0.01, min_delay=0.0, max_hedge_ratio=1.0, burst=1), metrics
+    )
+    attempts = 0
+    lock = threading.Lock()
+    release = threading.Event()
+    discarded: list[str] = []
+
+    def call() -> str:
+        nonlocal attempts
+        with lock:
+            attempts += 1
+            attempt = attempts
+        if attempt == 1:
+            release.wait(5)
+            return "slow"
+        return "fast"
+
+    result = hedger.run(call, on_discard=discarded.append)
+    release.set()
+    hedger.close()
+    time.sleep(0.05)
+
+    assert result == "fast"
+    assert metrics.get("hedge.sent") == 1
+    assert metrics.get("hedge.wins") == 1
+    assert discarded == ["slow"]
+
+
+def test_hedger_does_not_queue_original_calls() -> None:
+    """Test more concurrent callers than max_workers all run at once, without hedges."""
+    metrics = Metrics()
+    hedger = Hedger(HedgePolicy(initial_delay=0.5, max_workers=2), metrics)
+    barrier = threading.Barrier(16)
+
+    def caller() -> None:
+        barrier.wait()
+        hedger.run(lambda: time.sleep(0.1))
+
+    threads = [threading.Thread(target=caller) for _ in range(16)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+    hedger.close()
+
+    # Queued behind two workers, the calls would take 0.8s and be hedged
+    assert elapsed < 0.45
+    assert metrics.get("hedge.sent") == 0
+
+
+def test_hedger_budget_caps_extra_load() -> None:
+    """Test no duplicate is sent once the hedge budget is spent."""
+    metrics = Metrics()
+    hedger = Hedger(HedgePolicy(initial_delay=0.0, min_delay=0.0, max_hedge_ratio=0.0), metrics)
+
+    def call() -> str:
+        time.sleep(0.01)
+        return "result"
+
+    assert hedger.run(call) == "result"
+    assert metrics.get("hedge.sent") == 0
+    assert metrics.get("hedge.budget_exhausted") == 1
+    hedger.close()
+
+
+def test_hedger_uses_other_attempt_when_one_fails() -> None:
+    """Test a failing attempt falls back to the other attempt's result."""
+    hedger = Hedger(HedgePolicy(initial_delay=0.01, min_delay=0.0, max_hedge_ratio=1.0, burst=1))
+    attempts = 0
+    lock = threading.Lock()
+
+    def call() -> str:
+        nonlocal attempts
+        with lock:
+            attempts += 1
+            attempt = attempts
+        if attempt == 1:
+            time.sleep(0.05)
+            raise ConnectionError("connection reset")
+        time.sleep(0.1)
+        return "ok"
+
+    assert hedger.run(call) == "ok"
+    hedger.close()
+
+
+def test_hedger_raises_when_all_attempts_fail() -> None:
+    """Test the error is raised when both attempts fail."""
+    hedger = Hedger(HedgePolicy(initial_delay=0.01, min_delay=0.0, max_hedge_ratio=1.0, burst=1))
+
+    def call() -> str:
+        time.sleep(0.02)
+        raise ConnectionError("connection reset")
+
+    with pytest.raises(ConnectionError):
+        hedger.run(call)
+    hedger.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_hedger_runs_calls_after_fork() -> None:
+    """Test a forked child process gets fresh hedging threads instead of the parent's."""
+    hedger = Hedger(HedgePolicy(initial_delay=1.0))
+    assert hedger.run(lambda: "parent") == "parent"
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child process
+        # Exit by alarm rather than hang if the call never completes
+        signal.alarm(5)
+        os.write(write_fd, hedger.run(lambda: b"child"))
+        os._exit(0)
+
+    os.close(write_fd)
+    result = os.read(read_fd, 16)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert result == b"child"
+    assert hedger.run(lambda: "parent") == "parent"
+    hedger.close()
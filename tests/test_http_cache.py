@@ -0,0 +1,224 @@
+"""Tests for HTTP caching with conditional requests."""
+
+from collections.abc import Mapping
+
+import pytest
+
+from hyphen import (
+    HttpCache,
+    InMemoryRequest,
+    InMemoryResponse,
+    InMemoryTransport,
+    Link,
+    RateLimiter,
+)
+from hyphen.base_client import BaseClient
+from hyphen.http_cache import freshness_lifetime, parse_cache_control
+
+SHORT_CODE = {
+    "id": "code_1",
+    "code": "abc",
+    "long_url": "https://example.com",
+    "domain": "h4n.link",
+}
+CODE_PATH = "/api/organizations/org_123/link/codes/abc"
+
+
+def validated(etag: str) -> InMemoryResponse:
+    """Build a short code response with an entity tag."""
+    response = InMemoryResponse.json(SHORT_CODE)
+    response.headers["ETag"] = etag
+    return response
+
+
+def test_parse_cache_control() -> None:
+    """Test Cache-Control directives are parsed case-insensitively."""
+    assert parse_cache_control('Max-Age=60, no-cache, private="x-a"') == {
+        "max-age": "60",
+        "no-cache": None,
+        "private": "x-a",
+    }
+    assert parse_cache_control(None) == {}
+
+
+def test_freshness_lifetime() -> None:
+    """Test max-age, Age, Expires and no-cache determine freshness."""
+    assert freshness_lifetime({"cache-control": "max-age=60", "age": "15"}) == 45
+    assert freshness_lifetime({"cache-control": "max-age=60, no-cache"}) == 0
+    assert freshness_lifetime({"cache-control": "max-age=oops"}) == 0
+    assert (
+        freshness_lifetime(
+            {
+                "expires": "Thu, 01 Jan 2026 00:01:00 GMT",
+                "date": "Thu, 01 Jan 2026 00:00:00 GMT",
+            }
+        )
+        == 60
+    )
+    assert freshness_lifetime({"etag": '"v1"'}) == 0
+
+
+def test_etag_revalidation_serves_304_from_cache() -> None:
+    """Test repeat reads send If-None-Match and reuse the body on 304."""
+
+    def handler(request: InMemoryRequest) -> InMemoryResponse:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return InMemoryResponse(status=304, headers={"ETag": '"v1"'})
+        return validated('"v1"')
+
+    transport = InMemoryTransport()
+    transport.route("GET", CODE_PATH, handler)
+    link = Link(
+        organization_id="org_123", api_key="key", transport=transport, http_cache=HttpCache()
+    )
+
+    first = link.get_short_code("abc")
+    second = link.get_short_code("abc")
+
+    assert first == second
+    assert "If-None-Match" not in transport.requests[0].headers
+    assert transport.requests[1].headers["If-None-Match"] == '"v1"'
+    metrics = link.client.metrics
+    assert metrics.get("http_cache.misses") == 1
+    assert metrics.get("http_cache.revalidated") == 1
+    assert metrics.get("response.wire_bytes") == len(InMemoryResponse.json(SHORT_CODE).body)
+
+
+def test_last_modified_revalidation() -> None:
+    """Test Last-Modified validators are sent as If-Modified-Since."""
+    response = InMemoryResponse.json(["a", "b"])
+    response.headers["Last-Modified"] = "Thu, 01 Jan 2026 00:00:00 GMT"
+    transport = InMemoryTransport()
+    transport.route("GET", "/tags", response)
+    client = BaseClient(api_key="key", transport=transport, http_cache=HttpCache())
+
+    client.get("/tags")
+    client.get("/tags")
+
+    assert transport.requests[1].headers["If-Modified-Since"] == "Thu, 01 Jan 2026 00:00:00 GMT"
+
+
+def test_fresh_responses_skip_requests() -> None:
+    """Test responses within max-age are served without any request."""
+    response = InMemoryResponse.json(["a"])
+    response.headers["Cache-Control"] = "max-age=60"
+    transport = InMemoryTransport()
+    transport.route("GET", "/tags", response)
+    client = BaseClient(api_key="key", transport=transport, http_cache=HttpCache())
+
+    assert client.get("/tags") == ["a"]
+    assert client.get("/tags") == ["a"]
+    assert client.get("/tags", params={"page": 2}) == ["a"]
+
+    assert [request.params for request in transport.requests] == [{}, {"page": 2}]
+    assert client.metrics.get("http_cache.hits") == 1
+
+
+def test_no_store_and_unvalidated_responses_are_not_cached() -> None:
+    """Test responses without validators or with no-store are not kept."""
+    response = InMemoryResponse.json(["a"])
+    response.headers.update({"Cache-Control": "no-store", "ETag": '"v1"'})
+    transport = InMemoryTransport()
+    transport.route("GET", "/no-store", response)
+    transport.route("GET", "/plain", InMemoryResponse.json(["b"]))
+    cache = HttpCache()
+    client = BaseClient(api_key="key", transport=transport, http_cache=cache)
+
+    client.get("/no-store")
+    client.get("/plain")
+    client.get("/no-store")
+
+    assert len(cache) == 0
+    assert "If-None-Match" not in transport.requests[2].headers
+
+
+def test_writes_invalidate_cached_reads() -> None:
+    """Test a successful PATCH drops the cached response of its URL."""
+    transport = InMemoryTransport()
+    transport.route("GET", CODE_PATH, validated('"v1"'))
+    transport.route("PATCH", CODE_PATH, InMemoryResponse.json(SHORT_CODE))
+    link = Link(
+        organization_id="org_123", api_key="key", transport=transport, http_cache=HttpCache()
+    )
+
+    link.get_short_code("abc")
+    link.update_short_code("abc", {"title": "New title"})
+    link.get_short_code("abc")
+
+    assert "If-None-Match" not in transport.requests[2].headers
+
+
+def test_cache_is_bounded_and_scoped_to_api_key() -> None:
+    """Test least recently used entries are evicted and keys are not shared."""
+    transport = InMemoryTransport()
+    transport.route("GET", "/a", validated('"a"'))
+    transport.route("GET", "/b", validated('"b"'))
+    cache = HttpCache(max_entries=1)
+    client = BaseClient(api_key="key", transport=transport, http_cache=cache)
+    other = BaseClient(api_key="other", transport=transport, http_cache=cache)
+
+    client.get("/a")
+    client.get("/b")
+    client.get("/a")
+    other.get("/a")
+
+    assert "If-None-Match" not in transport.requests[2].headers
+    assert "If-None-Match" not in transport.requests[3].headers
+    assert client.metrics.get("http_cache.evictions") == 2
+    assert len(cache) == 1
+
+
+class RecordingRateLimiter(RateLimiter):
+    """Rate limiter recording the responses it is fed."""
+
+    def __init__(self) -> None:
+        super().__init__(rate=100, block=False)
+        self.updates: list[tuple[str, int, dict[str, str]]] = []
+
+    def update_from_response(
+        self, endpoint: str, status_code: int, headers: Mapping[str, str]
+    ) -> None:
+        self.updates.append((endpoint, status_code, dict(headers)))
+        super().update_from_response(endpoint, status_code, headers)
+
+
+def test_cached_responses_do_not_replay_rate_limits() -> None:
+    """Test cache hits and revalidations never apply stored rate-limit headers."""
+    fresh = InMemoryResponse.json(["a"])
+    fresh.headers.update(
+        {"Cache-Control": "max-age=60", "X-RateLimit-Remaining": "5", "Retry-After": "30"}
+    )
+
+    def revalidated(request: InMemoryRequest) -> InMemoryResponse:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return InMemoryResponse(status=304, headers={"ETag": '"v1"'})
+        response = validated('"v1"')
+        response.headers["X-RateLimit-Remaining"] = "3"
+        response.headers["X-RateLimit-Reset"] = "30"
+        return response
+
+    transport = InMemoryTransport()
+    transport.route("GET", "/fresh", fresh)
+    transport.route("GET", "/stale", revalidated)
+    limiter = RecordingRateLimiter()
+    client = BaseClient(
+        api_key="key", transport=transport, http_cache=HttpCache(), rate_limiter=limiter
+    )
+
+    client.get("/fresh")
+    client.get("/fresh")
+    client.get("/stale")
+    client.get("/stale")
+
+    assert [endpoint for endpoint, _, _ in limiter.updates] == ["/fresh", "/stale", "/stale"]
+    revalidation_headers = {name.lower() for name in limiter.updates[2][2]}
+    assert "x-ratelimit-remaining" not in revalidation_headers
+    assert "x-ratelimit-reset" not in revalidation_headers
+    assert client.metrics.get("http_cache.hits") == 1
+    assert client.metrics.get("http_cache.revalidated") == 1
+
+
+def test_http_cache_rejects_empty_store() -> None:
+    """Test max_entries must allow at least one entry."""
+    with pytest.raises(ValueError):
+        HttpCache(max_entries=0)
@@ -1,12 +1,26 @@
 """Tests for Link."""
 
+import json
 import os
+import time
 from datetime import datetime
+from http.client import RemoteDisconnected
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
 
-from hyphen import Link, QrCode, QrCodesResponse, ShortCode, ShortCodesResponse
+from hyphen import (
+    InMemoryResponse,
+    InMemoryTransport,
+    Link,
+    QrCode,
+    QrCodesResponse,
+    ShortCode,
+    ShortCodeCreationError,
+    ShortCodesResponse,
+)
 
 
 def test_link_init_with_params() -> None:
@@ -140,6 +154,33 @@ def test_get_short_codes(mock_client_class: Mock) -> None:
     mock_client.get.assert_called_once()
 
 
+@patch("hyphen.link.BaseClient")
+def test_stream_short_codes(mock_client_class: Mock) -> None:
+    """Test stream_short_codes yields ShortCode objects from the streamed page."""
+    mock_client = Mock()
+    mock_client.stream_items.return_value = iter(
+        [
+            {
+                "id": "1", "code": "abc123", "long_url": "https://a.com",
+                "domain": "s.lnk", "createdAt": "2025-01-01"
+            },
+        ]
+    )
+    mock_client_class.return_value = mock_client
+
+    link = Link(organization_id="org_123", api_key="key_123")
+    result = list(link.stream_short_codes(tags=["tag1", "tag2"], page_size=500))
+
+    assert len(result) == 1
+    assert isinstance(result[0], ShortCode)
+    assert result[0].code == "abc123"
+    mock_client.stream_items.assert_called_once_with(
+        "GET",
+        "/api/organizations/org_123/link/codes",
+        params={"tags": "tag1,tag2", "pageSize": 500},
+    )
+
+
 @patch("hyphen.link.BaseClient")
 def test_get_tags(mock_client_class: Mock) -> None:
     """Test get_tags method."""
@@ -256,3 +297,232 @@ def test_delete_qr_code(mock_client_class: Mock) -> None:
 
     assert result is None
     mock_client.delete.assert_called_once_with("/api/organizations/org_123/link/codes/abc123/qrs/qr_123")
+
+
+def test_map_get_short_code_stats() -> None:
+    """Test stats for many codes are fetched concurrently and returned in order."""
+    transport = InMemoryTransport(
+        handler=lambda request: InMemoryResponse.json({"path": request.path}), latency=0.01
+    )
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    stats = list(link.map_get_short_code_stats(["a", "b", "c"]))
+    future = link.submit_get_short_code_stats("d")
+
+    assert [item["path"] for item in stats] == [
+        f"/api/organizations/org_123/link/codes/{code}/stats" for code in "abc"
+    ]
+    assert future.result()["path"].endswith("/d/stats")
+    link.close()
+
+
+def short_codes_page(request_params: dict, total: int = 5) -> InMemoryResponse:
+    """Build a page of the short code listing for the requested page."""
+    page_num = int(request_params["pageNum"])
+    page_size = int(request_params["pageSize"])
+    first = (page_num - 1) * page_size
+    codes = [
+        {"id": f"code_{i}", "code": f"c{i}", "long_url": "https://x", "domain": "h4n.link"}
+        for i in range(first, min(first + page_size, total))
+    ]
+    return InMemoryResponse.json(
+        {"total": total, "pageNum": page_num, "pageSize": page_size, "data": codes}
+    )
+
+
+def test_iter_short_codes_walks_every_page() -> None:
+    """Test iter_short_codes requests each page once and stops at the total."""
+    transport = InMemoryTransport(handler=lambda request: short_codes_page(request.params))
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    codes = list(link.iter_short_codes(tags=["a"], page_size=2, prefetch_pages=2))
+
+    assert [code.code for code in codes] == [f"c{i}" for i in range(5)]
+    assert sorted(int(request.params["pageNum"]) for request in transport.requests) == [1, 2, 3]
+    assert all(request.params["tags"] == "a" for request in transport.requests)
+    link.close()
+
+
+def test_iter_short_codes_prefetch_is_bounded() -> None:
+    """Test at most prefetch_pages pages are requested ahead of consumption."""
+    transport = InMemoryTransport(handler=lambda request: short_codes_page(request.params, 20))
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    codes = link.iter_short_codes(page_size=2, prefetch_pages=1)
+    next(codes)
+    link.client.executor.shutdown(wait=True, cancel_futures=False)
+
+    assert sorted(int(request.params["pageNum"]) for request in transport.requests) == [1, 2]
+    codes.close()
+
+
+def test_iter_short_codes_sequential_until_empty_page() -> None:
+    """Test pages without totals are walked until an empty page."""
+    pages = {1: ["a", "b"], 2: ["c"], 3: []}
+    transport = InMemoryTransport(
+        handler=lambda request: InMemoryResponse.json(
+            {
+                "data": [
+                    {"id": code, "code": code, "long_url": "https://x", "domain": "h4n.link"}
+                    for code in pages[int(request.params["pageNum"])]
+                ]
+            }
+        )
+    )
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    codes = list(link.iter_short_codes(prefetch_pages=0))
+
+    assert [code.code for code in codes] == ["a", "b", "c"]
+    assert [request.params["pageNum"] for request in transport.requests] == [1, 2, 3]
+
+
+def test_iter_qr_codes() -> None:
+    """Test iter_qr_codes walks the QR code pages of a short code."""
+
+    def handler(request):  # type: ignore[no-untyped-def]
+        page_num = int(request.params["pageNum"])
+        qr = {"id": f"qr_{page_num}", "title": "QR", "qrCode": "data", "qrLink": "https://x"}
+        return InMemoryResponse.json(
+            {"total": 2, "pageNum": page_num, "pageSize": 1, "data": [qr]}
+        )
+
+    transport = InMemoryTransport(handler=handler)
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    qr_codes = list(link.iter_qr_codes("abc", page_size=1))
+
+    assert [qr.id for qr in qr_codes] == ["qr_1", "qr_2"]
+    assert transport.requests[0].path == "/api/organizations/org_123/link/codes/abc/qrs"
+    link.close()
+
+
+def test_fetch_all_short_codes_concurrently_in_order() -> None:
+    """Test remaining pages are fetched concurrently and reassembled in order."""
+    transport = InMemoryTransport(
+        handler=lambda request: short_codes_page(request.params, 25), latency=0.1
+    )
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    start = time.perf_counter()
+    codes = list(link.fetch_all_short_codes(page_size=5, max_concurrency=4))
+    elapsed = time.perf_counter() - start
+
+    assert [code.code for code in codes] == [f"c{i}" for i in range(25)]
+    assert sorted(int(request.params["pageNum"]) for request in transport.requests) == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+    # One round trip for the first page, then one for the other four together
+    assert elapsed < 0.4
+    link.close()
+
+
+def test_fetch_all_short_codes_rejects_no_concurrency() -> None:
+    """Test max_concurrency must allow at least one request."""
+    link = Link(organization_id="org_123", api_key="key_123", transport=InMemoryTransport())
+
+    with pytest.raises(ValueError):
+        link.fetch_all_short_codes(max_concurrency=0)
+
+
+def test_create_short_codes_reports_failures_in_order() -> None:
+    """Test bulk creation retries transient errors and reports the others per item."""
+    attempts: dict[str, int] = {}
+
+    def handler(request):  # type: ignore[no-untyped-def]
+        long_url = json.loads(request.body)["long_url"]
+        attempts[long_url] = attempts.get(long_url, 0) + 1
+        if long_url == "https://flaky" and attempts[long_url] == 1:
+            return InMemoryResponse(status=503, headers={"Retry-After": "0"})
+        if long_url == "https://invalid":
+            return InMemoryResponse.json({"message": "invalid"}, status=400)
+        return InMemoryResponse.json(
+            {"id": long_url, "code": long_url[8:], "long_url": long_url, "domain": "h4n.link"}
+        )
+
+    transport = InMemoryTransport(handler=handler)
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    results = list(
+        link.create_short_codes(
+            [
+                ("https://a", "h4n.link"),
+                ("https://flaky", "h4n.link", {"title": "Flaky"}),
+                ("https://invalid", "h4n.link"),
+                ("https://b", "h4n.link"),
+            ],
+            backoff=0,
+        )
+    )
+
+    assert [type(result) for result in results] == [
+        ShortCode,
+        ShortCode,
+        ShortCodeCreationError,
+        ShortCode,
+    ]
+    failure = results[2]
+    assert isinstance(failure, ShortCodeCreationError)
+    assert (failure.index, failure.long_url, failure.attempts) == (2, "https://invalid", 1)
+    assert attempts == {"https://a": 1, "https://flaky": 2, "https://invalid": 1, "https://b": 1}
+    assert link.client.metrics.get("short_codes.create_retries") == 1
+    assert link.client.metrics.get("short_codes.create_failures") == 1
+    link.close()
+
+
+def test_create_short_codes_only_retries_unprocessed_requests() -> None:
+    """Test creations that may have been processed are reported as ambiguous, not retried."""
+    attempts: dict[str, int] = {}
+
+    def handler(request):  # type: ignore[no-untyped-def]
+        long_url = json.loads(request.body)["long_url"]
+        attempts[long_url] = attempts.get(long_url, 0) + 1
+        if long_url == "https://refused" and attempts[long_url] == 1:
+            refused = NewConnectionError(None, "Connection refused")  # type: ignore[arg-type]
+            raise requests.ConnectionError(MaxRetryError(None, request.url, refused))  # type: ignore[arg-type]
+        if long_url == "https://dropped":
+            raise requests.ConnectionError("Connection aborted.", RemoteDisconnected())
+        if long_url == "https://gateway":
+            return InMemoryResponse(status=502)
+        return InMemoryResponse.json(
+            {"id": long_url, "code": long_url[8:], "long_url": long_url, "domain": "h4n.link"}
+        )
+
+    transport = InMemoryTransport(handler=handler)
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    refused, dropped, gateway = link.create_short_codes(
+        [
+            ("https://refused", "h4n.link"),
+            ("https://dropped", "h4n.link"),
+            ("https://gateway", "h4n.link"),
+        ],
+        backoff=0,
+    )
+
+    assert isinstance(refused, ShortCode)
+    assert isinstance(dropped, ShortCodeCreationError)
+    assert isinstance(gateway, ShortCodeCreationError)
+    assert (dropped.attempts, dropped.ambiguous) == (1, True)
+    assert (gateway.attempts, gateway.ambiguous) == (1, True)
+    assert attempts == {"https://refused": 2, "https://dropped": 1, "https://gateway": 1}
+    link.close()
+
+
+def test_create_short_codes_gives_up_after_max_attempts() -> None:
+    """Test a creation failing every attempt is reported with its last error."""
+    transport = InMemoryTransport(handler=lambda request: InMemoryResponse(status=429))
+    link = Link(organization_id="org_123", api_key="key_123", transport=transport)
+
+    [result] = link.create_short_codes([("https://a", "h4n.link")], max_attempts=2, backoff=0)
+
+    assert isinstance(result, ShortCodeCreationError)
+    assert result.attempts == 2
+    assert not result.ambiguous
+    assert isinstance(result.error, requests.HTTPError)
+    assert len(transport.requests) == 2
+    link.close()
@@ -0,0 +1,26 @@
+"""Tests for client metrics."""
+
+from hyphen import Metrics
+
+
+def test_metrics_counters_and_gauges() -> None:
+    """Test Metrics records counters and gauges."""
+    metrics = Metrics()
+    metrics.increment("requests")
+    metrics.increment("requests", 2)
+    metrics.set_gauge("limit", 10)
+    metrics.set_gauge("limit", 5)
+
+    assert metrics.get("requests") == 3
+    assert metrics.get("limit") == 5
+    assert metrics.get("missing") == 0
+    assert metrics.snapshot() == {"requests": 3, "limit": 5}
+
+
+def test_metrics_reset() -> None:
+    """Test Metrics.reset clears all values."""
+    metrics = Metrics()
+    metrics.increment("requests")
+    metrics.reset()
+
+    assert metrics.snapshot() == {}
@@ -2,7 +2,9 @@
 
 from unittest.mock import Mock, patch
 
-from hyphen import IpInfo, IpInfoError, NetInfo
+import pytest
+
+from hyphen import InMemoryResponse, InMemoryTransport, IpInfo, IpInfoError, NetInfo
 
 
 @patch("hyphen.net_info.BaseClient")
@@ -93,3 +95,48 @@ def test_get_ip_infos_with_errors(mock_client_class: Mock) -> None:
     assert isinstance(result[0], IpInfo)
     assert isinstance(result[1], IpInfoError)
     assert result[1].error_message == "Invalid IP"
+
+
+@patch("hyphen.net_info.BaseClient")
+def test_stream_ip_infos(mock_client_class: Mock) -> None:
+    """Test stream_ip_infos yields IpInfo and IpInfoError objects in order."""
+    mock_client = Mock()
+    mock_client.stream_items.return_value = iter(
+        [
+            {"ip": "8.8.8.8", "type": "ipv4", "location": {"country": "United States"}},
+            {"ip": "invalid", "type": "error", "errorMessage": "Invalid IP"},
+        ]
+    )
+    mock_client_class.return_value = mock_client
+
+    net_info = NetInfo(api_key="key_123")
+    result = list(net_info.stream_ip_infos(["8.8.8.8", "invalid"]))
+
+    assert isinstance(result[0], IpInfo)
+    assert isinstance(result[1], IpInfoError)
+    mock_client.stream_items.assert_called_once_with("POST", "/ip", data=["8.8.8.8", "invalid"])
+
+
+def test_stream_ip_infos_empty() -> None:
+    """Test stream_ip_infos rejects an empty list before sending anything."""
+    net_info = NetInfo(api_key="key_123")
+
+    with pytest.raises(ValueError):
+        net_info.stream_ip_infos([])
+
+
+def test_submit_and_map_get_ip_info() -> None:
+    """Test the futures-based lookups run through the client's thread pool."""
+    transport = InMemoryTransport(latency=0.01)
+    for ip in ("8.8.8.8", "1.1.1.1"):
+        transport.route("GET", f"/ip/{ip}", InMemoryResponse.json({"ip": ip, "type": "ipv4"}))
+    net_info = NetInfo(api_key="key_123", transport=transport, max_workers=2)
+
+    future = net_info.submit_get_ip_info("8.8.8.8")
+    results = list(net_info.map_get_ip_info(["1.1.1.1", "8.8.8.8"]))
+
+    assert future.result().ip == "8.8.8.8"
+    assert [result.ip for result in results] == ["1.1.1.1", "8.8.8.8"]
+    net_info.close()
+    with pytest.raises(RuntimeError):
+        net_info.submit_get_ip_info("8.8.8.8")
@@ -0,0 +1,129 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+import time
+
+import pytest
+
+from hyphen import RateLimiter, RateLimitRule
+from hyphen.exceptions import RateLimitExceededError
+from hyphen.rate_limit import TokenBucket
+
+STATS_RULE = RateLimitRule("/api/organizations/*/link/codes/*/stats", rate=10, burst=1)
+
+
+def test_token_bucket_allows_burst_then_waits() -> None:
+    """Test a bucket hands out its capacity and then reports a wait."""
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.1, abs=0.01)
+
+
+def test_token_bucket_refills() -> None:
+    """Test a bucket earns tokens over time."""
+    bucket = TokenBucket(rate=100, capacity=1)
+    bucket.try_acquire()
+    time.sleep(0.02)
+
+    assert bucket.try_acquire() == 0
+
+
+def test_token_bucket_pause() -> None:
+    """Test a paused bucket hands out no tokens."""
+    bucket = TokenBucket(rate=100, capacity=10)
+    bucket.pause(0.5)
+
+    assert bucket.try_acquire() > 0.4
+
+
+def test_token_bucket_rejects_invalid_rate() -> None:
+    """Test a bucket requires a positive rate."""
+    with pytest.raises(ValueError, match="rate"):
+        TokenBucket(rate=0)
+
+
+def test_rate_limiter_blocks_until_token_available() -> None:
+    """Test a blocking limiter waits for the endpoint bucket."""
+    limiter = RateLimiter(rules=[STATS_RULE])
+    endpoint = "/api/organizations/org/link/codes/abc/stats"
+
+    assert limiter.acquire(endpoint) == 0
+    start = time.monotonic()
+    waited = limiter.acquire(endpoint)
+
+    assert waited > 0
+    assert time.monotonic() - start >= 0.05
+
+
+def test_rate_limiter_rules_only_apply_to_matching_endpoints() -> None:
+    """Test endpoints not matching any rule are not limited."""
+    limiter = RateLimiter(rules=[STATS_RULE])
+
+    for _ in range(10):
+        assert limiter.acquire("/api/organizations/org/link/codes/abc") == 0
+
+
+def test_rate_limiter_fail_fast() -> None:
+    """Test a non-blocking limiter raises instead of waiting."""
+    limiter = RateLimiter(rate=1, burst=1, block=False)
+    limiter.acquire("/ip")
+
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        limiter.acquire("/ip")
+
+    assert exc_info.value.endpoint == "/ip"
+    assert exc_info.value.retry_after > 0
+
+
+def test_rate_limiter_max_wait() -> None:
+    """Test a limiter raises when the wait would exceed max_wait."""
+    limiter = RateLimiter(rate=1, burst=1, max_wait=0.1)
+    limiter.acquire("/ip")
+
+    with pytest.raises(RateLimitExceededError):
+        limiter.acquire("/ip")
+
+
+def test_rate_limiter_acquire_async() -> None:
+    """Test the limiter can be awaited from asyncio code."""
+    limiter = RateLimiter(rate=20, burst=1)
+
+    async def acquire_twice() -> float:
+        await limiter.acquire_async("/ip")
+        return await limiter.acquire_async("/ip")
+
+    assert asyncio.run(acquire_twice()) > 0
+
+
+def test_rate_limiter_backs_off_on_retry_after() -> None:
+    """Test a 429 with Retry-After pauses the limiter."""
+    limiter = RateLimiter(rate=100, block=False)
+    limiter.update_from_response("/ip", 429, {"Retry-After": "30"})
+
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        limiter.acquire("/ip")
+
+    assert exc_info.value.retry_after > 29
+
+
+def test_rate_limiter_adapts_to_remaining_header() -> None:
+    """Test X-RateLimit headers lower the available tokens."""
+    limiter = RateLimiter(rate=100, block=False)
+    limiter.update_from_response(
+        "/ip", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "10"}
+    )
+
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        limiter.acquire("/ip")
+
+    assert exc_info.value.retry_after > 9
+
+
+def test_rate_limiter_ignores_invalid_headers() -> None:
+    """Test malformed rate-limit headers are ignored."""
+    limiter = RateLimiter(rate=100, block=False)
+    limiter.update_from_response("/ip", 200, {"X-RateLimit-Remaining": "soon"})
+
+    assert limiter.acquire("/ip") == 0
@@ -0,0 +1,117 @@
+"""Tests for session pool management."""
+
+import gc
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from hyphen.session_pool import SessionPool
+
+
+def _sessions_by_thread(pool: SessionPool, threads: int) -> list[requests.Session]:
+    """Get the session handed to each of several threads."""
+    results: list[requests.Session] = [Mock()] * threads
+    barrier = threading.Barrier(threads)
+
+    def run(index: int) -> None:
+        barrier.wait()
+        results[index] = pool.get()
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+def test_shared_mode_uses_one_session() -> None:
+    """Test every thread shares the same session in shared mode."""
+    pool = SessionPool(requests.Session)
+
+    sessions = _sessions_by_thread(pool, 4)
+
+    assert len({id(session) for session in sessions}) == 1
+    assert pool.get() is sessions[0]
+    pool.close()
+
+
+def test_thread_local_mode_uses_one_session_per_thread() -> None:
+    """Test each thread gets its own session in thread_local mode."""
+    pool = SessionPool(requests.Session, mode="thread_local")
+
+    sessions = _sessions_by_thread(pool, 4)
+
+    assert len({id(session) for session in sessions}) == 4
+    assert pool.get() is pool.get()
+    pool.close()
+
+
+def test_thread_local_sessions_are_closed_when_threads_end() -> None:
+    """Test thread churn does not accumulate sessions in thread_local mode."""
+    pool = SessionPool(Mock, mode="thread_local")
+
+    sessions = [session for _ in range(50) for session in _sessions_by_thread(pool, 4)]
+    gc.collect()
+
+    assert pool.sessions() == []
+    for session in sessions:
+        session.close.assert_called_once()  # type: ignore[attr-defined]
+    pool.get()
+    assert len(pool.sessions()) == 1
+    pool.close()
+
+
+def test_sharded_mode_spreads_threads_over_shards() -> None:
+    """Test threads are spread round-robin over the shards."""
+    pool = SessionPool(requests.Session, mode="sharded", shards=2)
+
+    sessions = _sessions_by_thread(pool, 4)
+
+    assert len({id(session) for session in sessions}) == 2
+    assert len(pool.sessions()) == 2
+    pool.close()
+
+
+def test_close_closes_all_sessions() -> None:
+    """Test close() closes every session created by the pool."""
+    pool = SessionPool(Mock, mode="thread_local")
+    sessions = _sessions_by_thread(pool, 3)
+
+    pool.close()
+
+    for session in sessions:
+        session.close.assert_called_once()  # type: ignore[attr-defined]
+    assert pool.sessions() == []
+
+
+def test_invalid_mode() -> None:
+    """Test unknown session modes are rejected."""
+    with pytest.raises(ValueError, match="Unsupported session mode"):
+        SessionPool(requests.Session, mode="per_request")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_sessions_are_rebuilt_after_fork() -> None:
+    """Test a forked child process never reuses the parent's session."""
+    pool = SessionPool(requests.Session)
+    parent_session = pool.get()
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child process
+        reused = pool.get() is parent_session
+        os.write(write_fd, b"reused" if reused else b"fresh")
+        os._exit(0)
+
+    os.close(write_fd)
+    result = os.read(read_fd, 16)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert result == b"fresh"
+    assert pool.get() is parent_session
+    pool.close()
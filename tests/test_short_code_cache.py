@@ -0,0 +1,113 @@
+"""Tests for the in-process short code cache."""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from hyphen import InMemoryResponse, InMemoryTransport, Link, ShortCode, ShortCodeCache
+
+CODE_PATH = "/api/organizations/org_123/link/codes/abc"
+
+
+def short_code(title: str = "Original") -> dict:
+    """Build a short code response."""
+    return {
+        "id": "code_1",
+        "code": "abc",
+        "long_url": "https://example.com",
+        "domain": "h4n.link",
+        "title": title,
+    }
+
+
+def build_link(cache: ShortCodeCache) -> tuple[Link, InMemoryTransport]:
+    """Build a Link client with a cache, serving the short code abc."""
+    transport = InMemoryTransport()
+    transport.route("GET", CODE_PATH, InMemoryResponse.json(short_code()))
+    transport.route("PATCH", CODE_PATH, InMemoryResponse.json(short_code("Updated")))
+    transport.route("DELETE", CODE_PATH, InMemoryResponse(status=204))
+    link = Link(
+        organization_id="org_123", api_key="key", transport=transport, short_code_cache=cache
+    )
+    return link, transport
+
+
+def test_repeat_reads_are_served_from_cache() -> None:
+    """Test a cached short code is returned without a request."""
+    link, transport = build_link(ShortCodeCache())
+
+    first = link.get_short_code("abc")
+    second = link.get_short_code("abc")
+
+    assert first is second
+    assert len(transport.requests) == 1
+    assert link.client.metrics.get("short_code_cache.hits") == 1
+    assert link.client.metrics.get("short_code_cache.misses") == 1
+
+
+def test_updates_write_through_and_deletes_evict() -> None:
+    """Test update_short_code refreshes the cache and delete_short_code empties it."""
+    cache = ShortCodeCache()
+    link, transport = build_link(cache)
+
+    link.get_short_code("abc")
+    link.update_short_code("abc", {"title": "Updated"})
+    assert link.get_short_code("abc").title == "Updated"
+    assert len(transport.requests) == 2
+
+    link.delete_short_code("abc")
+    assert len(cache) == 0
+    link.get_short_code("abc")
+    assert transport.requests[-1].method == "GET"
+
+
+def test_failed_update_evicts() -> None:
+    """Test a failed update drops the cached short code."""
+    cache = ShortCodeCache()
+    link, transport = build_link(cache)
+    transport.route("PATCH", CODE_PATH, InMemoryResponse(status=500))
+
+    link.get_short_code("abc")
+    with pytest.raises(requests.HTTPError):
+        link.update_short_code("abc", {"title": "Updated"})
+
+    assert cache.get("org_123", "abc") is None
+
+
+def test_entries_expire_after_ttl() -> None:
+    """Test expired short codes are fetched again."""
+    cache = ShortCodeCache(ttl=10)
+    link, transport = build_link(cache)
+
+    with patch("hyphen.short_code_cache.time.monotonic", return_value=100.0):
+        link.get_short_code("abc")
+    with patch("hyphen.short_code_cache.time.monotonic", return_value=105.0):
+        link.get_short_code("abc")
+    with patch("hyphen.short_code_cache.time.monotonic", return_value=110.0):
+        link.get_short_code("abc")
+
+    assert len(transport.requests) == 2
+
+
+def test_cache_is_bounded_and_scoped_to_organization() -> None:
+    """Test least recently used entries are evicted and organizations are separate."""
+    cache = ShortCodeCache(max_entries=2)
+    codes = [ShortCode.from_dict({**short_code(), "code": code}) for code in "abc"]
+
+    assert cache.put("org_1", codes[0]) == 0
+    assert cache.put("org_1", codes[1]) == 0
+    assert cache.get("org_1", "a") is codes[0]
+    assert cache.put("org_1", codes[2]) == 1
+
+    assert cache.get("org_1", "b") is None
+    assert cache.get("org_1", "a") is codes[0]
+    assert cache.get("org_2", "a") is None
+
+
+def test_cache_rejects_invalid_settings() -> None:
+    """Test max_entries and ttl must be positive."""
+    with pytest.raises(ValueError):
+        ShortCodeCache(max_entries=0)
+    with pytest.raises(ValueError):
+        ShortCodeCache(ttl=0)
@@ -0,0 +1,200 @@
+"""Tests for the SQLite short code mirror."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from hyphen import InMemoryRequest, InMemoryResponse, InMemoryTransport, Link, ShortCodeMirror
+
+
+class FakeListing:
+    """Short code listing served newest first, or oldest first."""
+
+    def __init__(self, newest_first: bool = True):
+        self.codes: list[dict[str, Any]] = []
+        self.newest_first = newest_first
+        self.pages_served: list[int] = []
+        self.failing_page: int | None = None
+
+    def add(self, code: str, created_at: str, **fields: Any) -> None:
+        self.codes.append(
+            {
+                "id": f"id_{code}",
+                "code": code,
+                "long_url": f"https://example.com/{code}",
+                "domain": "h4n.link",
+                "createdAt": created_at,
+                **fields,
+            }
+        )
+
+    def __call__(self, request: InMemoryRequest) -> InMemoryResponse:
+        page_num = int(request.params["pageNum"])
+        page_size = int(request.params["pageSize"])
+        self.pages_served.append(page_num)
+        if page_num == self.failing_page:
+            return InMemoryResponse(status=500)
+        ordered = sorted(
+            self.codes, key=lambda code: code["createdAt"], reverse=self.newest_first
+        )
+        first = (page_num - 1) * page_size
+        return InMemoryResponse.json(
+            {
+                "total": len(ordered),
+                "pageNum": page_num,
+                "pageSize": page_size,
+                "data": ordered[first : first + page_size],
+            }
+        )
+
+
+def build_mirror(listing: FakeListing, path: str = ":memory:") -> ShortCodeMirror:
+    """Build a mirror of a fake listing fetching two short codes per page."""
+    link = Link(
+        organization_id="org_123", api_key="key", transport=InMemoryTransport(handler=listing)
+    )
+    return ShortCodeMirror(link, path, page_size=2, prefetch_pages=0)
+
+
+def test_sync_and_query() -> None:
+    """Test a sync stores every short code and queries use its fields."""
+    listing = FakeListing()
+    listing.add("a", "2025-01-01T00:00:00.000Z", title="Spring", tags=["sale", "spring"])
+    listing.add("b", "2025-01-02T00:00:00.000Z", title="Summer", tags=["sale"])
+    listing.add("c", "2025-01-03T00:00:00.000Z", organizationId={"id": "org", "name": "Org"})
+    mirror = build_mirror(listing)
+
+    result = mirror.sync()
+
+    assert (result.fetched, result.removed) == (3, 0)
+    assert result.watermark == mirror.watermark == "2025-01-03T00:00:00.000Z"
+    assert len(mirror) == 3
+    assert [code.code for code in mirror.find(tag="sale")] == ["b", "a"]
+    assert [code.code for code in mirror.find(tag="sale", title="Spring")] == ["a"]
+    assert [code.code for code in mirror.find(long_url="https://example.com/b")] == ["b"]
+    assert [code.code for code in mirror.find(domain="h4n.link", limit=1)] == ["c"]
+    spring = mirror.get("a")
+    assert spring is not None and spring.tags == ["sale", "spring"]
+    c = mirror.get("c")
+    assert c is not None and c.organization_id == {"id": "org", "name": "Org"}
+    assert mirror.get("missing") is None
+    mirror.close()
+
+
+def test_incremental_sync_stops_at_watermark() -> None:
+    """Test incremental syncs fetch pages until reaching mirrored short codes."""
+    listing = FakeListing()
+    for day in range(1, 7):
+        listing.add(f"c{day}", f"2025-01-0{day}T00:00:00.000Z")
+    mirror = build_mirror(listing)
+    mirror.sync()
+    listing.add("new", "2025-01-07T00:00:00.000Z", tags=["fresh"])
+    listing.pages_served.clear()
+
+    result = mirror.sync()
+
+    assert listing.pages_served == [1, 2]
+    assert result.watermark == "2025-01-07T00:00:00.000Z"
+    assert [code.code for code in mirror.find(tag="fresh")] == ["new"]
+    assert len(mirror) == 7
+
+
+def test_incremental_sync_walks_oldest_first_listings() -> None:
+    """Test listings not ordered newest first are walked entirely."""
+    listing = FakeListing(newest_first=False)
+    for day in range(1, 6):
+        listing.add(f"c{day}", f"2025-01-0{day}T00:00:00.000Z")
+    mirror = build_mirror(listing)
+    mirror.sync()
+    listing.add("new", "2025-01-06T00:00:00.000Z")
+
+    mirror.sync()
+
+    assert mirror.get("new") is not None
+
+
+def test_full_sync_removes_deleted_short_codes_and_updates(tmp_path: Path) -> None:
+    """Test full syncs drop unlisted short codes and persist across reopening."""
+    listing = FakeListing()
+    listing.add("a", "2025-01-01T00:00:00.000Z", tags=["old"])
+    listing.add("b", "2025-01-02T00:00:00.000Z")
+    path = str(tmp_path / "codes.db")
+    mirror = build_mirror(listing, path)
+    mirror.sync()
+    mirror.close()
+
+    listing.codes = [code for code in listing.codes if code["code"] != "b"]
+    listing.codes[0]["tags"] = ["new"]
+    mirror = build_mirror(listing, path)
+    result = mirror.sync(full=True)
+
+    assert (result.fetched, result.removed) == (1, 1)
+    assert mirror.get("b") is None
+    assert mirror.find(tag="old") == []
+    assert [code.code for code in mirror.find(tag="new")] == ["a"]
+    mirror.close()
+
+
+def test_full_sync_after_failed_sync_removes_its_short_codes() -> None:
+    """Test rows stored by a failed sync are not kept by the next full sync."""
+    listing = FakeListing()
+    for day, code in enumerate("abcd", start=1):
+        listing.add(code, f"2025-01-0{day}T00:00:00.000Z")
+    listing.failing_page = 2
+    mirror = build_mirror(listing)
+    with pytest.raises(requests.HTTPError):
+        mirror.sync()
+    assert mirror.get("d") is not None
+
+    listing.failing_page = None
+    listing.codes = [code for code in listing.codes if code["code"] != "d"]
+    result = mirror.sync(full=True)
+
+    assert (result.fetched, result.removed) == (3, 1)
+    assert mirror.get("d") is None
+    assert len(mirror) == 3
+    mirror.close()
+
+
+def test_mirror_rejects_empty_pages() -> None:
+    """Test page_size must be at least 1."""
+    link = Link(organization_id="org_123", api_key="key", transport=InMemoryTransport())
+    with pytest.raises(ValueError):
+        ShortCodeMirror(link, page_size=0)
+
+
+def test_queries_run_during_sync() -> None:
+    """Test a query does not wait for the requests of a running sync."""
+    listing = FakeListing()
+    for day in range(1, 5):
+        listing.add(f"c{day}", f"2025-01-0{day}T00:00:00.000Z")
+    requested = threading.Event()
+    release = threading.Event()
+
+    def handler(request: InMemoryRequest) -> InMemoryResponse:
+        if int(request.params["pageNum"]) == 2:
+            requested.set()
+            release.wait(5)
+        return listing(request)
+
+    link = Link(
+        organization_id="org_123", api_key="key", transport=InMemoryTransport(handler=handler)
+    )
+    mirror = ShortCodeMirror(link, page_size=2, prefetch_pages=0)
+    sync = threading.Thread(target=mirror.sync)
+    sync.start()
+    try:
+        assert requested.wait(5)
+        started = time.monotonic()
+        assert len(mirror) == 2
+        assert mirror.get("c4") is not None
+        assert mirror.get("c1") is None
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+        sync.join()
+    assert len(mirror) == 4
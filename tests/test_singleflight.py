@@ -0,0 +1,61 @@
+"""Tests for singleflight call coalescing."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hyphen import Metrics
+from hyphen.singleflight import SingleFlight
+
+
+def test_singleflight_shares_result_between_waiters() -> None:
+    """Test concurrent callers with the same key share one call."""
+    metrics = Metrics()
+    group = SingleFlight(metrics)
+    release = threading.Event()
+    calls = 0
+
+    def fn() -> dict[str, str]:
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        return {"code": "abc"}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(group.do, "key", fn) for _ in range(4)]
+        while metrics.get("singleflight.coalesced") < 3:
+            release.wait(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_singleflight_shares_errors() -> None:
+    """Test waiters receive the error raised by the shared call."""
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fn() -> None:
+        release.wait(5)
+        raise RuntimeError("upstream failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(group.do, "key", fn) for _ in range(2)]
+        while group.metrics.get("singleflight.coalesced") < 1:
+            release.wait(0.001)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="upstream failed"):
+                future.result()
+
+
+def test_singleflight_runs_again_after_completion() -> None:
+    """Test a key is called again once its previous call has finished."""
+    group = SingleFlight()
+    results = iter([1, 2])
+
+    assert group.do("key", lambda: next(results)) == 1
+    assert group.do("key", lambda: next(results)) == 2
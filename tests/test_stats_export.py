@@ -0,0 +1,147 @@
+"""Tests for bulk short code statistics and their export."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from hyphen import InMemoryRequest, InMemoryResponse, InMemoryTransport, Link
+from hyphen.stats_export import merge_stats, split_date_range, write_csv, write_ndjson
+
+
+def test_split_date_range() -> None:
+    """Test windows cover the range without overlapping."""
+    start = datetime(2025, 1, 1)
+
+    windows = split_date_range(start, datetime(2025, 1, 3, 12), timedelta(days=1))
+
+    assert windows == [
+        (start, datetime(2025, 1, 1, 23, 59, 59)),
+        (datetime(2025, 1, 2), datetime(2025, 1, 2, 23, 59, 59)),
+        (datetime(2025, 1, 3), datetime(2025, 1, 3, 12)),
+    ]
+    assert split_date_range(start, start, timedelta(days=1)) == [(start, start)]
+    with pytest.raises(ValueError):
+        split_date_range(start, start, timedelta(0))
+    with pytest.raises(ValueError):
+        split_date_range(start, start - timedelta(days=1), timedelta(days=1))
+
+
+def test_merge_stats() -> None:
+    """Test numbers are summed and list entries with the same identity combined."""
+    merged = merge_stats(
+        [
+            {
+                "clicks": {"total": 3, "unique": 2, "byDay": [{"date": "2025-01-01", "total": 3}]},
+                "browsers": [{"name": "Chrome", "total": 2}, {"name": "Safari", "total": 1}],
+                "tags": ["a"],
+                "updated": "first",
+            },
+            {
+                "clicks": {"total": 4, "unique": 1, "byDay": [{"date": "2025-01-02", "total": 4}]},
+                "browsers": [{"name": "Chrome", "total": 4}],
+                "tags": ["b"],
+                "updated": "last",
+            },
+        ]
+    )
+
+    assert merged == {
+        "clicks": {
+            "total": 7,
+            "unique": 3,
+            "byDay": [{"date": "2025-01-01", "total": 3}, {"date": "2025-01-02", "total": 4}],
+        },
+        "browsers": [{"name": "Chrome", "total": 6}, {"name": "Safari", "total": 1}],
+        "tags": ["a", "b"],
+        "updated": "last",
+    }
+
+
+def stats_handler(request: InMemoryRequest) -> InMemoryResponse:
+    """Answer stats requests with one click per requested day."""
+    code = request.path.split("/")[-2]
+    start = request.params.get("startDate", "")
+    return InMemoryResponse.json(
+        {"clicks": {"total": 1, "byDay": [{"date": start[:10], "total": 1}]}, "code": code}
+    )
+
+
+def test_iter_short_code_stats_windows() -> None:
+    """Test every window of every code is fetched and merged per code, in order."""
+    transport = InMemoryTransport(handler=stats_handler, latency=0.01)
+    link = Link(organization_id="org_123", api_key="key", transport=transport)
+
+    rows = list(
+        link.iter_short_code_stats(
+            ["a", "b"],
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 3, 23, 59, 59),
+            window=timedelta(days=1),
+        )
+    )
+
+    assert [code for code, _ in rows] == ["a", "b"]
+    assert rows[0][1]["clicks"]["total"] == 3
+    assert [day["date"] for day in rows[1][1]["clicks"]["byDay"]] == [
+        "2025-01-01",
+        "2025-01-02",
+        "2025-01-03",
+    ]
+    assert len(transport.requests) == 6
+    link.close()
+
+
+def test_iter_short_code_stats_without_window() -> None:
+    """Test stats are fetched once per code without a window."""
+    link = Link(
+        organization_id="org_123", api_key="key", transport=InMemoryTransport(handler=stats_handler)
+    )
+
+    rows = list(link.iter_short_code_stats(iter(["a", "b", "c"])))
+
+    assert [(code, stats["code"]) for code, stats in rows] == [("a", "a"), ("b", "b"), ("c", "c")]
+    with pytest.raises(ValueError):
+        link.iter_short_code_stats(["a"], window=timedelta(days=1))
+    link.close()
+
+
+def test_write_ndjson() -> None:
+    """Test one JSON object is written per code."""
+    file = io.StringIO()
+
+    count = write_ndjson(iter([("a", {"clicks": 1}), ("b", {"clicks": 2})]), file)
+
+    assert count == 2
+    assert [json.loads(line) for line in file.getvalue().splitlines()] == [
+        {"code": "a", "clicks": 1},
+        {"code": "b", "clicks": 2},
+    ]
+
+
+def test_write_csv() -> None:
+    """Test nested stats are flattened and lists written as JSON."""
+    file = io.StringIO(newline="")
+    rows = [
+        ("a", {"clicks": {"total": 1, "unique": 1}, "browsers": [{"name": "Chrome"}]}),
+        ("b", {"clicks": {"total": 2}, "extra": True}),
+    ]
+
+    count = write_csv(iter(rows), file)
+
+    assert count == 2
+    assert list(csv.DictReader(io.StringIO(file.getvalue()))) == [
+        {
+            "code": "a",
+            "clicks.total": "1",
+            "clicks.unique": "1",
+            "browsers": '[{"name": "Chrome"}]',
+        },
+        {"code": "b", "clicks.total": "2", "clicks.unique": "", "browsers": ""},
+    ]
+
+    file = io.StringIO(newline="")
+    write_csv(iter(rows), file, columns=["clicks.total"])
+    assert file.getvalue().splitlines() == ["code,clicks.total", "a,1", "b,2"]
@@ -0,0 +1,94 @@
+"""Tests for incremental JSON array parsing."""
+
+import json
+
+import pytest
+
+from hyphen import StdlibJsonCodec
+from hyphen.streaming import JsonArrayParser
+
+DOCUMENT = {
+    "total": 3,
+    "meta": {"note": 'tricky "]}," text', "nested": [1, [2, {"x": []}]]},
+    "data": [
+        {"id": 1, "text": 'escaped \\" quote and [brackets] {braces}, commas: ok'},
+        {"id": 2, "tags": ["a", "b"], "empty": {}},
+        {"id": 3, "unicode": "café ✓"},
+    ],
+    "pageNum": 1,
+}
+
+
+def parse(raw: bytes, chunk_size: int, key: str | None = "data") -> tuple[list, JsonArrayParser]:
+    """Feed a document to a parser in chunks of the given size."""
+    parser = JsonArrayParser(key, StdlibJsonCodec())
+    items = []
+    for start in range(0, len(raw), chunk_size):
+        items.extend(parser.feed(raw[start : start + chunk_size]))
+    parser.close()
+    return items, parser
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 1 << 20])
+def test_parser_yields_elements_across_chunk_boundaries(chunk_size: int) -> None:
+    """Test elements and other members are parsed whatever the chunking."""
+    raw = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+    items, parser = parse(raw, chunk_size)
+
+    assert items == DOCUMENT["data"]
+    assert parser.fields == {"total": 3, "meta": DOCUMENT["meta"], "pageNum": 1}
+
+
+def test_parser_yields_each_element_when_complete() -> None:
+    """Test elements are returned as soon as their last byte arrives."""
+    parser = JsonArrayParser("data")
+
+    assert parser.feed(b'{"data": [{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b": 2}") == []
+    assert parser.feed(b"]}") == [{"id": 2}]
+    parser.close()
+
+
+def test_parser_keeps_only_the_current_element() -> None:
+    """Test parsed elements are dropped from the buffer."""
+    parser = JsonArrayParser("data")
+    parser.feed(b'{"data": [')
+    for i in range(1000):
+        parser.feed(json.dumps({"id": i, "padding": "x" * 100}).encode() + b",")
+
+    assert len(parser._buffer) < 200
+
+
+def test_parser_top_level_array() -> None:
+    """Test key=None parses a top-level array."""
+    items, _ = parse(b'[1, "two", {"three": [3]}, []]', 3, key=None)
+
+    assert items == [1, "two", {"three": [3]}, []]
+
+
+def test_parser_empty_array() -> None:
+    """Test an empty array yields nothing."""
+    items, parser = parse(b'{"data": [], "total": 0}', 4)
+
+    assert items == []
+    assert parser.fields == {"total": 0}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b'{"data": [{"id": 1}',
+        b'{"total": 0}',
+        b'{"data": null}',
+        b"[1, 2]",
+        b'{"data": [1,, 2]}',
+    ],
+)
+def test_parser_rejects_unexpected_documents(raw: bytes) -> None:
+    """Test truncated or differently shaped documents raise ValueError."""
+    parser = JsonArrayParser("data")
+
+    with pytest.raises(ValueError):
+        parser.feed(raw)
+        parser.close()
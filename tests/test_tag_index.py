@@ -0,0 +1,123 @@
+"""Tests for the inverted tag index."""
+
+import pytest
+
+from hyphen import InMemoryRequest, InMemoryResponse, InMemoryTransport, Link, ShortCode, TagIndex
+
+TAGS = {
+    "a": ["sale", "spring"],
+    "b": ["sale", "summer"],
+    "c": ["summer"],
+    "d": ["sale", "archived"],
+    "e": [],
+}
+
+
+def short_code(code: str, tags: list[str]) -> ShortCode:
+    """Build a short code with tags."""
+    return ShortCode(
+        id=f"id_{code}",
+        code=code,
+        long_url="https://x",
+        domain="h4n.link",
+        created_at="",
+        tags=tags,
+    )
+
+
+def build_index() -> TagIndex:
+    """Build an index of TAGS."""
+    index = TagIndex()
+    index.build(short_code(code, tags) for code, tags in TAGS.items())
+    return index
+
+
+def test_boolean_queries() -> None:
+    """Test AND, OR and NOT queries and their counts."""
+    index = build_index()
+
+    assert index.query(all_of=["sale"]) == ["a", "b", "d"]
+    assert index.query(any_of=["spring", "summer"]) == ["a", "b", "c"]
+    assert index.query(all_of=["sale"], none_of=["archived"]) == ["a", "b"]
+    assert index.query(all_of=["sale"], any_of=["summer", "unknown"]) == ["b"]
+    assert index.query(none_of=["sale"]) == ["c", "e"]
+    assert index.query(all_of=["unknown"]) == []
+    assert index.query() == ["a", "b", "c", "d", "e"]
+    assert index.count(all_of=["sale"], none_of=["archived"]) == 2
+    assert len(index) == 5
+
+
+def test_cardinalities() -> None:
+    """Test tag cardinalities are counted and sorted by use."""
+    index = build_index()
+
+    assert index.cardinality("sale") == 3
+    assert index.cardinality("unknown") == 0
+    assert index.cardinalities() == {"sale": 3, "summer": 2, "archived": 1, "spring": 1}
+
+
+def test_build_keeps_last_entry_of_a_code() -> None:
+    """Test bulk builds dedupe codes and leave the index open to updates."""
+    index = TagIndex()
+    index.build(
+        [short_code("a", ["old"]), short_code("b", ["sale"]), short_code("a", ["sale", "new"])]
+        + [short_code(f"x{i}", ["bulk"]) for i in range(20)]
+    )
+
+    assert index.query(all_of=["sale"]) == ["a", "b"]
+    assert index.cardinality("old") == 0
+    assert index.cardinality("bulk") == 20
+    assert len(index) == 22
+    index.update(short_code("c", ["sale"]))
+    assert index.query(all_of=["sale"]) == ["a", "b", "c"]
+
+
+def test_updates_and_removals() -> None:
+    """Test updated tags replace the old ones and removed ids are reused."""
+    index = build_index()
+
+    index.update(short_code("a", ["summer"]))
+    assert index.remove("d")
+    assert not index.remove("d")
+    index.update(short_code("f", ["archived"]))
+
+    assert index.query(all_of=["sale"]) == ["b"]
+    assert index.query(all_of=["summer"]) == ["a", "b", "c"]
+    assert index.tags("f") == {"archived"}
+    assert index.cardinalities() == {"summer": 3, "archived": 1, "sale": 1}
+    assert sorted(index.query()) == ["a", "b", "c", "e", "f"]
+
+
+def test_refresh_from_listing() -> None:
+    """Test refresh() indexes every page of the short code listing."""
+
+    def handler(request: InMemoryRequest) -> InMemoryResponse:
+        codes = list(TAGS.items())
+        page_num = int(request.params["pageNum"])
+        page = codes[(page_num - 1) * 2 : page_num * 2]
+        return InMemoryResponse.json(
+            {
+                "total": len(codes),
+                "pageNum": page_num,
+                "pageSize": 2,
+                "data": [
+                    {"id": code, "code": code, "long_url": "https://x", "tags": tags}
+                    for code, tags in page
+                ],
+            }
+        )
+
+    link = Link(
+        organization_id="org_123", api_key="key", transport=InMemoryTransport(handler=handler)
+    )
+    index = TagIndex(link, page_size=2)
+
+    assert index.refresh() == 5
+    assert index.query(all_of=["sale"], none_of=["archived"]) == ["a", "b"]
+    link.close()
+
+
+def test_refresh_requires_link() -> None:
+    """Test refresh() needs a client."""
+    with pytest.raises(ValueError):
+        TagIndex().refresh()
@@ -0,0 +1,235 @@
+"""Tests for HTTP transports."""
+
+import gzip
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from hyphen import (
+    Http2Transport,
+    InMemoryResponse,
+    InMemoryTransport,
+    IpInfo,
+    NetInfo,
+    RequestsTransport,
+    ResponseTooLargeError,
+    StdlibJsonCodec,
+)
+from hyphen.base_client import BaseClient
+from hyphen.transport import StreamedBody, build_response
+from tests.conftest import H2StubServer, StubResponse, StubServer
+
+
+def test_build_response_behaves_like_requests() -> None:
+    """Test built responses expose content, headers and errors as requests does."""
+    response = build_response(
+        "https://api.hyphen.ai/test",
+        404,
+        b'{"error": "not found"}',
+        headers={"Content-Type": "application/json"},
+        reason="Not Found",
+        wire_bytes=12,
+    )
+
+    assert response.json() == {"error": "not found"}
+    assert response.headers["content-type"] == "application/json"
+    assert response.raw.tell() == 12
+    with pytest.raises(requests.HTTPError, match="404 Client Error: Not Found"):
+        response.raise_for_status()
+
+
+def test_requests_transport_is_default(stub_server: StubServer) -> None:
+    """Test BaseClient sends requests with a RequestsTransport by default."""
+    stub_server.handler = lambda request: StubResponse(body=b'{"ok": true}')
+    client = BaseClient(api_key="test_key", base_url=stub_server.url)
+
+    assert isinstance(client.transport, RequestsTransport)
+    assert client.get("/test") == {"ok": True}
+    assert client.session is client.transport.session
+    client.close()
+
+
+def test_http2_transport_sends_requests(h2_stub_server: H2StubServer) -> None:
+    """Test BaseClient sends requests and bodies over HTTP/2."""
+    h2_stub_server.handler = lambda request: StubResponse(
+        body=gzip.compress(b'{"data": "test"}'), headers={"Content-Encoding": "gzip"}
+    )
+    transport = Http2Transport(prior_knowledge=True)
+    client = BaseClient(api_key="test_key", base_url=h2_stub_server.url, transport=transport)
+
+    result = client.post("/test", data=["8.8.8.8"])
+    client.close()
+
+    assert result == {"data": "test"}
+    request = h2_stub_server.requests[0]
+    assert request.method == "POST"
+    assert request.path == "/test"
+    assert request.headers["x-api-key"] == "test_key"
+    assert request.body == b'["8.8.8.8"]'
+    assert client.metrics.get("response.body_bytes") == 16
+    assert client.metrics.get("response.wire_bytes") == len(gzip.compress(b'{"data": "test"}'))
+
+
+def test_http2_transport_raises_http_errors(h2_stub_server: H2StubServer) -> None:
+    """Test error statuses received over HTTP/2 raise requests.HTTPError."""
+    h2_stub_server.handler = lambda request: StubResponse(status=503)
+    client = BaseClient(
+        api_key="test_key",
+        base_url=h2_stub_server.url,
+        transport=Http2Transport(prior_knowledge=True),
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.get("/test", params={"q": "1"})
+    client.close()
+
+    assert h2_stub_server.requests[0].path == "/test?q=1"
+
+
+def test_http2_transport_streams_bodies(h2_stub_server: H2StubServer) -> None:
+    """Test streamed HTTP/2 responses are read by iter_content, within size limits."""
+    body = gzip.compress(b"0" * 10_000)
+    h2_stub_server.handler = lambda request: StubResponse(
+        body=body, headers={"Content-Encoding": "gzip"}
+    )
+    transport = Http2Transport(prior_knowledge=True)
+
+    response = transport.request("GET", f"{h2_stub_server.url}/test", stream=True)
+    assert isinstance(response.raw, StreamedBody)
+    assert b"".join(response.iter_content(chunk_size=1024)) == b"0" * 10_000
+    assert response.raw.tell() == len(body)
+    response.close()
+
+    client = BaseClient(
+        api_key="test_key",
+        base_url=h2_stub_server.url,
+        transport=transport,
+        max_response_bytes=1000,
+    )
+    with pytest.raises(ResponseTooLargeError):
+        client.get("/test")
+    client.close()
+
+
+def test_http2_transport_is_thread_safe(
+    h2_stub_server: H2StubServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test threads sharing a connection open streams in order."""
+    import h2.connection
+
+    next_stream_id = h2.connection.H2Connection.get_next_available_stream_id
+
+    def slow_next_stream_id(self: h2.connection.H2Connection) -> int:
+        # Widens the window in which another thread could open a stream first
+        stream_id = next_stream_id(self)
+        time.sleep(0.005)
+        return stream_id
+
+    monkeypatch.setattr(
+        h2.connection.H2Connection, "get_next_available_stream_id", slow_next_stream_id
+    )
+    transport = Http2Transport(prior_knowledge=True, timeout=5)
+    transport.request("GET", f"{h2_stub_server.url}/test")
+    barrier = threading.Barrier(8)
+
+    def send(index: int) -> list[int]:
+        barrier.wait()
+        return [
+            transport.request("GET", f"{h2_stub_server.url}/test/{index}").status_code
+            for _ in range(5)
+        ]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = [status for result in executor.map(send, range(8)) for status in result]
+    transport.close()
+
+    assert statuses == [200] * 40
+    assert len(h2_stub_server.requests) == 41
+
+
+def test_http2_transport_warmup(h2_stub_server: H2StubServer) -> None:
+    """Test warmup opens the single multiplexed connection."""
+    client = BaseClient(
+        api_key="test_key",
+        base_url=h2_stub_server.url,
+        transport=Http2Transport(prior_knowledge=True),
+    )
+
+    assert client.warmup(connections=4) == 1
+    assert client.metrics.get("warmup.connections") == 1
+    assert h2_stub_server.requests[0].method == "HEAD"
+    with pytest.raises(AttributeError):
+        client.session
+    client.close()
+
+
+def test_http2_transport_warmup_raises_os_error() -> None:
+    """Test connection failures during warmup are raised as OSError."""
+    pytest.importorskip("h2")
+    transport = Http2Transport(prior_knowledge=True, timeout=1)
+
+    with pytest.raises(OSError):
+        transport.warmup("http://127.0.0.1:9", 1)
+    transport.close()
+
+
+def test_in_memory_transport_serves_routes() -> None:
+    """Test routes are matched by method and path and requests are recorded."""
+    transport = InMemoryTransport()
+    transport.route("GET", "/ip/8.8.8.8", InMemoryResponse.json({"ip": "8.8.8.8"}))
+    transport.route(
+        "POST", "/ip", lambda request: InMemoryResponse.json({"echo": len(request.body or b"")})
+    )
+    client = BaseClient(api_key="test_key", transport=transport, codec=StdlibJsonCodec())
+
+    assert client.get("/ip/8.8.8.8", params={"fields": "all"}) == {"ip": "8.8.8.8"}
+    assert client.post("/ip", data=["8.8.8.8"]) == {"echo": 11}
+    with pytest.raises(requests.HTTPError, match="404 Client Error: Not Found"):
+        client.get("/missing")
+
+    first = transport.requests[0]
+    assert first.method == "GET"
+    assert first.url == "https://api.hyphen.ai/ip/8.8.8.8"
+    assert first.params == {"fields": "all"}
+    assert first.headers["x-api-key"] == "test_key"
+    assert transport.requests[1].body == b'["8.8.8.8"]'
+    assert client.warmup() == 0
+
+
+def test_in_memory_transport_handler_and_latency() -> None:
+    """Test the fallback handler and injected latency."""
+    transport = InMemoryTransport(
+        handler=lambda request: InMemoryResponse(status=204),
+        latency=lambda request: 0.02 if request.path == "/slow" else 0.0,
+        record=False,
+    )
+    client = BaseClient(api_key="test_key", transport=transport)
+
+    start = time.perf_counter()
+    assert client.delete("/fast") is None
+    fast = time.perf_counter() - start
+    start = time.perf_counter()
+    client.delete("/slow")
+    slow = time.perf_counter() - start
+
+    assert fast < 0.02 <= slow
+    assert transport.requests == []
+
+
+def test_in_memory_transport_with_service() -> None:
+    """Test services accept an in-memory transport."""
+    transport = InMemoryTransport(latency=0.001)
+    transport.route(
+        "GET",
+        "/ip/8.8.8.8",
+        InMemoryResponse.json({"ip": "8.8.8.8", "type": "ipv4", "location": {"country": "US"}}),
+    )
+    net_info = NetInfo(api_key="test_key", transport=transport)
+
+    result = net_info.get_ip_info("8.8.8.8")
+
+    assert isinstance(result, IpInfo)
+    assert result.location.country == "US"
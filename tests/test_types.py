@@ -1,5 +1,11 @@
 """Tests for types module."""
 
+import base64
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 from hyphen import (
     Evaluation,
     EvaluationResponse,
@@ -7,6 +13,7 @@ from hyphen import (
     IpInfoError,
     IpLocation,
     QrCode,
+    QrCodeImage,
     QrCodesResponse,
     QrSize,
     ShortCode,
@@ -223,6 +230,59 @@ class TestQrCode:
         assert qr_code.qr_code == "base64data"
         assert qr_code.qr_link == "https://qr.link/image.png"
 
+    def test_image_is_decoded_lazily(self) -> None:
+        """Test the base64 payload is only decoded on first access, then dropped."""
+        encoded = base64.b64encode(b"\x89PNG image").decode()
+        qr_code = QrCode.from_dict({"id": "qr", "qrCode": encoded, "qrCodeBytes": [1, 2]})
+
+        assert qr_code.image is not None
+        assert repr(qr_code.image) == "QrCodeImage(encoded)"
+        assert qr_code.qr_code == encoded
+        assert qr_code.qr_code_bytes == b"\x89PNG image"
+        assert repr(qr_code.image) == "QrCodeImage(decoded)"
+        assert qr_code.image.memoryview().obj is qr_code.qr_code_bytes
+        assert qr_code.qr_code == encoded
+
+    def test_image_from_integers_and_data_urls(self) -> None:
+        """Test integer arrays and data URLs decode to the same image."""
+        data_url = "data:image/png;base64," + base64.b64encode(b"png").decode()
+        from_integers = QrCode.from_dict({"id": "qr", "qrCodeBytes": list(b"png")})
+        from_data_url = QrCode.from_dict({"id": "qr", "qrCode": data_url})
+
+        assert from_integers == from_data_url
+        assert from_integers.qr_code == base64.b64encode(b"png").decode()
+        assert from_data_url.qr_code_bytes == b"png"
+        assert from_data_url.qr_code == data_url
+        assert QrCode.from_dict({"id": "qr"}).qr_code_bytes is None
+        assert QrCode(id="qr", qr_code_bytes=b"png").qr_code_bytes == b"png"
+
+    def test_image_is_decoded_consistently_by_concurrent_readers(self) -> None:
+        """Test threads decoding the same image concurrently all get its bytes."""
+        payload = b"\x89PNG" * 10_000
+        images = [QrCodeImage(base64.b64encode(payload).decode()) for _ in range(50)]
+        images += [QrCodeImage(integers=list(payload)) for _ in range(50)]
+        barrier = threading.Barrier(8)
+
+        def read_all() -> list[bytes]:
+            barrier.wait()
+            return [image.tobytes() for image in images]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = [future.result() for future in [executor.submit(read_all) for _ in range(8)]]
+
+        assert all(data == payload for result in results for data in result)
+        assert all(image.tobytes() == payload for image in images)
+
+    def test_image_write_to(self, tmp_path: Path) -> None:
+        """Test images are written to paths and streams."""
+        image = QrCodeImage(integers=list(b"png"))
+        stream = io.BytesIO()
+
+        assert image.write_to(stream) == 3
+        assert image.write_to(tmp_path / "qr.png") == 3
+        assert stream.getvalue() == (tmp_path / "qr.png").read_bytes() == b"png"
+        assert len(image) == 3
+
 
 class TestQrCodesResponse:
     """Tests for QrCodesResponse dataclass."""
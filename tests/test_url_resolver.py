@@ -0,0 +1,156 @@
+"""Tests for local code to long URL resolution."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from hyphen import InMemoryRequest, InMemoryResponse, InMemoryTransport, Link, UrlResolver, UrlTable
+
+
+class Listing:
+    """Single-page short code listing whose URLs can be changed."""
+
+    def __init__(self, urls: dict[str, str]):
+        self.urls = urls
+
+    def __call__(self, request: InMemoryRequest) -> InMemoryResponse:
+        data = [
+            {"id": code, "code": code, "long_url": url, "domain": "h4n.link"}
+            for code, url in self.urls.items()
+        ]
+        return InMemoryResponse.json(
+            {"total": len(data), "pageNum": 1, "pageSize": 500, "data": data}
+        )
+
+
+def build_link(listing: Listing) -> Link:
+    """Build a Link client serving a listing."""
+    return Link(
+        organization_id="org_123", api_key="key", transport=InMemoryTransport(handler=listing)
+    )
+
+
+def test_table_lookups() -> None:
+    """Test codes resolve to their domain and URL, with the last entry winning."""
+    table = UrlTable.build(
+        [
+            ("abc", "h4n.link", "https://example.com/a"),
+            ("déjà", "go.example", "https://example.com/ü"),
+            ("abc", "h4n.link", "https://example.com/new"),
+        ]
+        + [(f"c{i}", "h4n.link", f"https://example.com/{i}") for i in range(1000)]
+    )
+
+    assert len(table) == 1002
+    assert table.lookup("abc") == ("h4n.link", "https://example.com/new")
+    assert table.lookup("déjà") == ("go.example", "https://example.com/ü")
+    assert table.lookup("c999") == ("h4n.link", "https://example.com/999")
+    assert table.lookup("missing") is None
+    assert table.domains == ["h4n.link", "go.example"]
+    assert UrlTable.build([]).lookup("abc") is None
+
+
+def test_table_keeps_empty_and_unusual_domains() -> None:
+    """Test empty domains and domains with separators round-trip through the table."""
+    assert UrlTable.build([("abc", "", "https://example.com")]).lookup("abc") == (
+        "",
+        "https://example.com",
+    )
+
+    table = UrlTable.build([("a", "", "https://a"), ("b", "x\ny", "https://b")])
+
+    assert table.domains == ["", "x\ny"]
+    assert table.lookup("b") == ("x\ny", "https://b")
+
+
+def test_table_save_and_open(tmp_path: Path) -> None:
+    """Test a saved table is memory-mapped back with the same content."""
+    path = tmp_path / "urls.table"
+    UrlTable.build([("abc", "h4n.link", "https://example.com")]).save(path)
+
+    table = UrlTable.open(path)
+
+    assert table.lookup("abc") == ("h4n.link", "https://example.com")
+    assert [file.name for file in tmp_path.iterdir()] == ["urls.table"]
+
+
+def test_table_rejects_other_buffers() -> None:
+    """Test buffers that are not complete tables are refused."""
+    with pytest.raises(ValueError):
+        UrlTable(b"not a table")
+    with pytest.raises(ValueError):
+        UrlTable(b"x" * 64)
+    table = UrlTable.build([("abc", "h4n.link", "https://example.com")])
+    with pytest.raises(ValueError):
+        UrlTable(table._buffer[:-1])
+
+
+def test_resolver_refresh_swaps_table() -> None:
+    """Test refresh() resolves from the listing and replaces the table."""
+    listing = Listing({"abc": "https://example.com/a"})
+    resolver = UrlResolver(build_link(listing))
+    assert resolver.resolve("abc") is None
+
+    assert resolver.refresh() == 1
+    assert resolver.resolve("abc") == "https://example.com/a"
+
+    listing.urls = {"abc": "https://example.com/b", "def": "https://example.com/d"}
+    previous = resolver.table
+    resolver.refresh()
+
+    assert resolver.resolve("abc") == "https://example.com/b"
+    assert resolver.lookup("def") == ("h4n.link", "https://example.com/d")
+    assert previous.lookup("abc") == ("h4n.link", "https://example.com/a")
+    assert len(resolver) == 2
+
+
+def test_resolver_shares_tables_through_files(tmp_path: Path) -> None:
+    """Test a resolver can load the table another one refreshed."""
+    path = tmp_path / "urls.table"
+    listing = Listing({"abc": "https://example.com/a"})
+    writer = UrlResolver(build_link(listing), path)
+    reader = UrlResolver(path=path)
+
+    writer.refresh()
+    reader.load()
+    listing.urls = {"abc": "https://example.com/b"}
+    writer.refresh()
+
+    assert reader.resolve("abc") == "https://example.com/a"
+    reader.load()
+    assert reader.resolve("abc") == "https://example.com/b"
+
+
+def test_lookups_during_refresh() -> None:
+    """Test concurrent lookups always see a complete table."""
+    urls = {f"c{i}": "https://example.com/a" for i in range(500)}
+    listing = Listing(urls)
+    resolver = UrlResolver(build_link(listing))
+    resolver.refresh()
+    failures: list[str | None] = []
+    stop = threading.Event()
+
+    def lookups() -> None:
+        while not stop.is_set():
+            url = resolver.resolve("c42")
+            if url not in ("https://example.com/a", "https://example.com/b"):
+                failures.append(url)
+
+    thread = threading.Thread(target=lookups)
+    thread.start()
+    for version in "ba" * 5:
+        listing.urls = {code: f"https://example.com/{version}" for code in urls}
+        resolver.refresh()
+    stop.set()
+    thread.join()
+
+    assert failures == []
+
+
+def test_resolver_requires_link_and_path() -> None:
+    """Test refresh() needs a client and load() a path."""
+    with pytest.raises(ValueError):
+        UrlResolver().refresh()
+    with pytest.raises(ValueError):
+        UrlResolver().load()